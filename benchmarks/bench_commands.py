@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#
+# benchmarks/bench_commands.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import pytest
+
+from escpos import barcode
+from escpos.exceptions import CashDrawerException
+
+
+COMMANDS = [
+        ('init',),
+        ('text', ('Lorem ipsum dolor sit amet, consectetur adipiscing',)),
+        ('set_emphasized', (True,)),
+        ('justify_center',),
+        ('set_text_size', (1, 1)),
+        ('ean13', ('4006381333931',)),
+        ('code128', ('ABC-1234-XYZ',)),
+        ('qrcode', ('https://example.com/nfce?p=35200714200166000187650010',)),
+        ('cut',),
+        ('kick_drawer',),
+    ]
+
+
+@pytest.mark.parametrize(
+        'command',
+        COMMANDS,
+        ids=[command[0] for command in COMMANDS])
+def bench_command(benchmark, impl, command):
+    printer = impl(pytest.NullDevice(), features=pytest.FEATURES)
+    method = getattr(printer, command[0])
+    args = command[1] if len(command) > 1 else ()
+    # flushing every write skips waits for barcodes to be printed, while
+    # still sending each command to the (null) device
+    with printer.buffered(size=1):
+        try:
+            method(*args)
+        except CashDrawerException:
+            pytest.skip('{} has no cash drawer port 0'.format(impl.__name__))
+        benchmark(method, *args)
+
+
+def bench_gs_k_barcode(benchmark):
+    benchmark(
+            barcode.gs_k_barcode,
+            barcode.CODE128,
+            b'{AABC-1234-XYZ',
+            barcode_height=120,
+            barcode_width=barcode.BARCODE_DOUBLE_WIDTH,
+            barcode_hri=barcode.BARCODE_HRI_BOTTOM)
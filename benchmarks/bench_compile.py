@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+#
+# benchmarks/bench_compile.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import pytest
+
+from escpos.impl.epson import GenericESCPOS
+
+
+class NoWait(object):
+    """Completion strategy that does not wait for barcodes to be printed."""
+
+    def wait(self, device, delay):
+        return device.read()
+
+
+def bench_compile_receipt(benchmark, impl, receipt):
+    data = benchmark(impl.compile, receipt, features=pytest.FEATURES)
+    assert data
+
+
+def bench_print_receipt(benchmark, receipt):
+    # unbuffered, one write per command, as most applications print
+    printer = GenericESCPOS(
+            pytest.NullDevice(),
+            features=pytest.FEATURES,
+            completion=NoWait())
+    benchmark(receipt, printer)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+#
+# benchmarks/bench_conn.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import os
+
+import pytest
+
+from escpos.conn.network import NetworkConnection
+from escpos.emulator.server import PrinterServer
+
+if hasattr(os, 'openpty'):
+    from escpos.emulator.serialport import SerialPrinter
+
+
+@pytest.fixture(scope='module')
+def server():
+    with PrinterServer(interpret=False) as server:
+        yield server
+
+
+@pytest.fixture(params=[512, 65536])
+def payload(request):
+    return os.urandom(request.param)
+
+
+def bench_network_write(benchmark, server, payload):
+    conn = NetworkConnection.create(server.address)
+    conn.catch()
+    try:
+        benchmark(conn.write, payload)
+    finally:
+        conn.release()
+
+
+@pytest.mark.skipif(not hasattr(os, 'openpty'), reason='requires a pty')
+def bench_serial_write(benchmark):
+    # fast enough and with room enough for flow control not to stall
+    payload = os.urandom(4096)
+    with SerialPrinter(baudrate=4000000, buffer_size=1 << 24) as printer:
+        conn = printer.connect()
+        conn.catch()
+        benchmark(conn.write, payload)
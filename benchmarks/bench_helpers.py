@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+#
+# benchmarks/bench_helpers.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import os
+
+import pytest
+
+from escpos.helpers import chunks
+from escpos.helpers import hexdump
+from escpos.retry import backoff
+
+
+@pytest.mark.parametrize('size', [512, 65536])
+def bench_chunks(benchmark, size):
+    data = os.urandom(size)
+    benchmark(lambda: list(chunks(data, 512)))
+
+
+@pytest.mark.parametrize('size', [64, 4096])
+def bench_hexdump(benchmark, size):
+    data = os.urandom(size)
+    benchmark(hexdump, data)
+
+
+def bench_backoff_wrapper(benchmark):
+    # connections build the decorated function on every call
+    def call():
+        @backoff(max_tries=3, delay=1, factor=2)
+        def _write():
+            return None
+        return _write()
+    benchmark(call)
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+#
+# benchmarks/bench_middleware.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import pytest
+
+from escpos.conn import middleware
+
+
+STAGES = [
+        ('none', []),
+        ('passthrough', [middleware.Middleware]),
+        ('coalesce', [(middleware.Coalesce, {'size': 1 << 30})]),
+        ('ratelimit', [(middleware.RateLimit, {'rate': 1 << 40})]),
+        ('tee', [(middleware.Tee, {'recorder': lambda d, data: None})]),
+        ('metrics', [(middleware.Metrics, {'label': 'bench'})]),
+        ('retry', [(middleware.Retry, {'max_tries': 3, 'delay': 1})]),
+    ]
+
+
+@pytest.mark.parametrize(
+        'stages',
+        [stages for name, stages in STAGES],
+        ids=[name for name, stages in STAGES])
+def bench_stage_write(benchmark, stages):
+    # per write overhead of each stage over a device that does nothing
+    conn = middleware.stack(pytest.NullDevice(), stages)
+    benchmark(conn.write, b'\x1B\x40Hello World!\n')
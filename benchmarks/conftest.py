@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+#
+# benchmarks/conftest.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import pytest
+
+from escpos import feature
+from escpos import showcase
+from escpos.helpers import find_implementations
+
+
+FEATURES = {
+        feature.CUTTER: True,
+        feature.CASHDRAWER_PORTS: True,
+    }
+
+IMPLEMENTATIONS = find_implementations(sort_by='fqname')
+
+
+class NullDevice(object):
+    """A device that discards everything written to it, so benchmarks measure
+    command generation only.
+    """
+
+    def catch(self):
+        pass
+
+    def write(self, data):
+        pass
+
+    def read(self):
+        return None
+
+    def close(self):
+        pass
+
+
+def _receipt(printer):
+    printer.init()
+    showcase.receipt_showcase(printer)
+    printer.ean13('4006381333931')
+    printer.qrcode('https://example.com/nfce?p=35200714200166000187650010')
+    printer.cut()
+
+
+@pytest.fixture
+def receipt():
+    """A typical sale receipt, with a barcode and a QRCode, as a callable
+    that prints it (suitable for ``compile``).
+    """
+    return _receipt
+
+
+@pytest.fixture(
+        params=IMPLEMENTATIONS,
+        ids=[impl.fqname.rsplit('.', 1)[-1] for impl in IMPLEMENTATIONS])
+def impl(request):
+    """Every known implementation type."""
+    return request.param.type
+
+
+def pytest_configure(config):
+    pytest.NullDevice = NullDevice
+    pytest.FEATURES = FEATURES
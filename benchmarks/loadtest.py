@@ -0,0 +1,419 @@
+# -*- coding: utf-8 -*-
+#
+# benchmarks/loadtest.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Load test: drives a fleet of emulated printers with bursts of receipts,
+through a spooler, reporting throughput, job latency percentiles, backoff
+retries and client CPU time per printer. Some printers can be made to fail
+(dead hosts) or to print slowly, to see how retries degrade tail latency.
+
+    python benchmarks/loadtest.py --network 200 --jobs 2000 --rate 500 \\
+        --dead 0.02 --slow 0.1
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import io
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+
+from collections import defaultdict
+from concurrent.futures import wait
+
+import six
+
+from escpos import config
+from escpos import feature
+from escpos import showcase
+from escpos.conn.network import NetworkConnection
+from escpos.emulator.server import PrinterServer
+from escpos.impl.epson import GenericESCPOS
+from escpos.spool import Spooler
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
+
+FEATURES = {
+        feature.CUTTER: True,
+        feature.CASHDRAWER_PORTS: True,
+    }
+
+PERCENTILES = (50, 95, 99)
+
+_current = threading.local()
+
+
+def text_workload(printer):
+    printer.init()
+    for i in range(40):
+        printer.text('Line {:02d} Lorem ipsum dolor sit amet'.format(i))
+    printer.cut()
+
+
+def receipt_workload(printer):
+    printer.init()
+    showcase.receipt_showcase(printer)
+    printer.cut()
+
+
+def showcase_workload(printer):
+    printer.init()
+    showcase.showcase(printer)
+
+
+WORKLOADS = {
+        'text': text_workload,
+        'receipt': receipt_workload,
+        'showcase': showcase_workload,
+    }
+
+
+class Fleet(object):
+    """The emulated printers, each with a printer implementation connected
+    to it, ready to be added to a spooler.
+    """
+
+    def __init__(self):
+        super(Fleet, self).__init__()
+        self.printers = {}  # name -> implementation instance
+        self.kinds = {}  # name -> description
+        self._servers = []
+        self._serial_printers = []
+        self._dead = []
+
+    def add_network(
+            self,
+            name,
+            print_speed=None,
+            receive_buffer=None,
+            dead=False):
+        server = PrinterServer(
+                print_speed=print_speed,
+                receive_buffer=receive_buffer,
+                interpret=False)
+        server.start()
+        self._servers.append(server)
+        conn = NetworkConnection.create(server.address)
+        self.printers[name] = GenericESCPOS(conn, features=FEATURES)
+        self.kinds[name] = 'network' + (
+                ' (dead)' if dead else ' (slow)' if print_speed else '')
+        if dead:
+            self._dead.append(server)
+
+    def add_serial(self, name, baudrate):
+        from escpos.emulator.serialport import SerialPrinter
+        serial_printer = SerialPrinter(baudrate=baudrate)
+        serial_printer.start()
+        self._serial_printers.append(serial_printer)
+        conn = serial_printer.connect()
+        self.printers[name] = GenericESCPOS(conn, features=FEATURES)
+        self.kinds[name] = 'serial ({} bps)'.format(baudrate)
+
+    def kill_dead_hosts(self):
+        # printers go away after connections have been made, so writes fail
+        # and reconnections are refused, as with a printer turned off
+        for server in self._dead:
+            server.stop()
+
+    def stop(self):
+        for server in self._servers:
+            server.stop()
+        for serial_printer in self._serial_printers:
+            serial_printer.stop()
+
+
+class RetryCounter(logging.Handler):
+    """Counts backoff retries (logged by :mod:`escpos.retry`) per printer,
+    attributed through the printer name of the job being run by the thread.
+    """
+
+    def __init__(self):
+        super(RetryCounter, self).__init__(level=logging.INFO)
+        self.counts = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def emit(self, record):
+        name = getattr(_current, 'printer', None)
+        with self._lock:
+            self.counts[name] += 1
+
+
+def percentile(values, p):
+    """Nearest-rank percentile of the given sorted values."""
+    if not values:
+        return None
+    rank = max(1, int(round(p / 100.0 * len(values) + 0.5)))
+    return values[min(rank, len(values)) - 1]
+
+
+def _thread_time():
+    clock = getattr(time, 'thread_time', None)
+    return clock() if clock is not None else 0.0
+
+
+def _process_time():
+    clock = getattr(time, 'process_time', None)
+    return clock() if clock is not None else time.clock()
+
+
+def run(args):
+    rng = random.Random(args.seed)
+    config.BACKOFF_MAXTRIES = args.backoff_tries
+    config.BACKOFF_DELAY = args.backoff_delay
+    config.BACKOFF_FACTOR = args.backoff_factor
+
+    fleet = Fleet()
+    for i in range(args.network):
+        roll = rng.random()
+        slow = roll < args.slow
+        fleet.add_network(
+                'net-{:03d}'.format(i),
+                print_speed=args.slow_speed if slow else None,
+                receive_buffer=args.slow_buffer if slow else None,
+                dead=args.slow <= roll < args.slow + args.dead)
+    for i in range(args.serial):
+        fleet.add_serial('ser-{:03d}'.format(i), baudrate=args.baudrate)
+    fleet.kill_dead_hosts()
+
+    retries = RetryCounter()
+    retry_logger = logging.getLogger('escpos.retry')
+    retry_logger.addHandler(retries)
+    retry_level = retry_logger.level
+    retry_logger.setLevel(logging.INFO)
+
+    workload = WORKLOADS[args.workload]
+    names = sorted(fleet.printers)
+    latencies = defaultdict(list)
+    failures = defaultdict(int)
+    cpu = defaultdict(float)
+    lock = threading.Lock()
+
+    def make_job(name):
+        def job(printer):
+            _current.printer = name
+            started = _thread_time()
+            try:
+                with printer.buffered():
+                    workload(printer)
+            finally:
+                with lock:
+                    cpu[name] += _thread_time() - started
+                _current.printer = None
+        return job
+
+    def make_callback(name, submitted_at):
+        # latency is measured up to the job outcome, whatever it is, so time
+        # spent retrying before failing shows up in the tail
+        def callback(future):
+            elapsed = time.time() - submitted_at
+            with lock:
+                latencies[name].append(elapsed)
+                if future.exception() is not None:
+                    failures[name] += 1
+        return callback
+
+    spooler = Spooler(max_workers=args.workers or len(names))
+    for name in names:
+        spooler.add_printer(name, fleet.printers[name])
+
+    futures = []
+    cpu_started = _process_time()
+    started = time.time()
+    interval = args.burst / float(args.rate) if args.rate else 0
+    submitted = 0
+    while submitted < args.jobs:
+        for i in range(min(args.burst, args.jobs - submitted)):
+            name = rng.choice(names)
+            future = spooler.submit(name, make_job(name))
+            future.add_done_callback(make_callback(name, time.time()))
+            futures.append(future)
+            submitted += 1
+        if interval:
+            # exponential inter-burst times make traffic bursty
+            time.sleep(rng.expovariate(1.0 / interval))
+    wait(futures)
+    elapsed = time.time() - started
+    cpu_elapsed = _process_time() - cpu_started
+
+    spooler.shutdown(wait=True)
+    retry_logger.removeHandler(retries)
+    retry_logger.setLevel(retry_level)
+    fleet.stop()
+
+    all_latencies = sorted(v for values in latencies.values() for v in values)
+    completed = len(all_latencies) - sum(failures.values())
+    report = {
+            'printers': len(names),
+            'jobs': args.jobs,
+            'completed': completed,
+            'failed': sum(failures.values()),
+            'elapsed': elapsed,
+            'throughput': completed / elapsed if elapsed else 0.0,
+            'latency': dict(
+                    ('p{}'.format(p), percentile(all_latencies, p))
+                    for p in PERCENTILES),
+            'retries': sum(retries.counts.values()),
+            'cpu_seconds': cpu_elapsed,
+            'max_rss_kib': _max_rss_kib(),
+            'per_printer': [],
+        }
+    for name in names:
+        values = sorted(latencies[name])
+        row = {
+                'name': name,
+                'kind': fleet.kinds[name],
+                'completed': len(values) - failures[name],
+                'failed': failures[name],
+                'retries': retries.counts.get(name, 0),
+                'cpu_seconds': cpu[name],
+            }
+        row.update(
+                ('p{}'.format(p), percentile(values, p)) for p in PERCENTILES)
+        report['per_printer'].append(row)
+    return report
+
+
+def _max_rss_kib():
+    if resource is None:
+        return None
+    value = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return value // 1024 if sys.platform == 'darwin' else value
+
+
+def _ms(value):
+    return '-' if value is None else '{:.1f}'.format(value * 1000)
+
+
+def print_report(report, out=sys.stdout, per_printer=False):
+    print((
+            '{printers} printers, {completed}/{jobs} jobs completed '
+            '({failed} failed) in {elapsed:.2f}s: {throughput:.1f} jobs/s'
+        ).format(**report), file=out)
+    print('latency (ms): ' + ', '.join(
+            '{} {}'.format(key, _ms(report['latency'][key]))
+            for key in sorted(report['latency'])), file=out)
+    print('retries: {}'.format(report['retries']), file=out)
+    rss = report['max_rss_kib']
+    print('cpu: {:.2f}s ({:.2f}ms per printer), max rss: {}'.format(
+            report['cpu_seconds'],
+            report['cpu_seconds'] * 1000 / max(1, report['printers']),
+            '-' if rss is None else '{} KiB ({:.1f} KiB per printer)'.format(
+                    rss, rss / max(1, report['printers']))), file=out)
+    if not per_printer:
+        return
+    print('', file=out)
+    line = '{:<8} {:<18} {:>5} {:>5} {:>7} {:>9} {:>9} {:>9} {:>8}'
+    print(line.format(
+            'printer', 'kind', 'ok', 'fail', 'retries',
+            'p50 ms', 'p95 ms', 'p99 ms', 'cpu ms'), file=out)
+    for row in report['per_printer']:
+        print(line.format(
+                row['name'],
+                row['kind'],
+                row['completed'],
+                row['failed'],
+                row['retries'],
+                _ms(row['p50']),
+                _ms(row['p95']),
+                _ms(row['p99']),
+                _ms(row['cpu_seconds'])), file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=(
+            'Load test pyescpos against a fleet of emulated printers.'))
+    parser.add_argument(
+            '--network', type=int, default=20,
+            help='number of network printers (default: %(default)s)')
+    parser.add_argument(
+            '--serial', type=int, default=0,
+            help='number of serial printers, POSIX only (default: none)')
+    parser.add_argument(
+            '--baudrate', type=int, default=115200,
+            help='serial printers baud rate (default: %(default)s)')
+    parser.add_argument(
+            '--jobs', type=int, default=500,
+            help='number of jobs to submit (default: %(default)s)')
+    parser.add_argument(
+            '--rate', type=float, default=0,
+            help='average jobs per second (default: as fast as possible)')
+    parser.add_argument(
+            '--burst', type=int, default=10,
+            help='jobs submitted at once (default: %(default)s)')
+    parser.add_argument(
+            '--workload', choices=sorted(WORKLOADS), default='receipt',
+            help='what each job prints (default: %(default)s)')
+    parser.add_argument(
+            '--workers', type=int, default=0,
+            help='spooler workers (default: one per printer)')
+    parser.add_argument(
+            '--dead', type=float, default=0,
+            help='fraction of network printers that go away (default: 0)')
+    parser.add_argument(
+            '--slow', type=float, default=0,
+            help='fraction of network printers that print slowly')
+    parser.add_argument(
+            '--slow-speed', type=int, default=2000,
+            help='bytes per second of slow printers (default: %(default)s)')
+    parser.add_argument(
+            '--slow-buffer', type=int, default=4096,
+            help='receive buffer of slow printers (default: %(default)s)')
+    parser.add_argument(
+            '--backoff-tries', type=int, default=config.BACKOFF_MAXTRIES,
+            help='backoff tries (default: %(default)s)')
+    parser.add_argument(
+            '--backoff-delay', type=float, default=config.BACKOFF_DELAY,
+            help='backoff delay in seconds (default: %(default)s)')
+    parser.add_argument(
+            '--backoff-factor', type=float, default=config.BACKOFF_FACTOR,
+            help='backoff factor (default: %(default)s)')
+    parser.add_argument(
+            '--seed', type=int, default=None,
+            help='random seed, for repeatable runs')
+    parser.add_argument(
+            '--per-printer', action='store_true',
+            help='also report every printer')
+    parser.add_argument(
+            '--json', metavar='FILE',
+            help='also write the report, as JSON, to FILE')
+    args = parser.parse_args(argv)
+
+    if args.serial and not hasattr(os, 'openpty'):
+        parser.error('serial printers require a POSIX system')
+
+    report = run(args)
+    print_report(report, per_printer=args.per_printer)
+    if args.json:
+        with io.open(args.json, 'w', encoding='utf-8') as fileobj:
+            fileobj.write(six.text_type(json.dumps(report, indent=2)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,550 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/aio.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Native :mod:`asyncio` support (Python 3 only).
+
+Printer implementations are not rewritten as coroutines. Instead,
+:class:`AsyncPrinter` runs the regular implementation methods against an
+in-memory device, which only collects the commands, and then awaits the
+actual writes (and the waits for barcodes and QRCodes) on an asynchronous
+connection, such as :class:`AsyncNetworkConnection`. So, one event loop can
+drive many printers concurrently without blocking and without a thread per
+printer.
+
+.. sourcecode:: python
+
+    from escpos.aio import AsyncNetworkConnection
+    from escpos.aio import AsyncPrinter
+    from escpos.impl.epson import GenericESCPOS
+
+    async def print_receipt():
+        conn = AsyncNetworkConnection.create('10.0.0.101:9100')
+        async with AsyncPrinter(conn, GenericESCPOS) as printer:
+            async with printer.buffered():
+                await printer.init()
+                await printer.text('Hello World!')
+                await printer.cut()
+
+"""
+import asyncio
+import functools
+import logging
+import socket
+
+from . import config
+from . import constants
+from . import status as _status
+from .exceptions import TimeoutException
+from .impl.epson import GenericESCPOS
+from .retry import always_retry
+from .retry import noop
+from .retry import _validate_backoff_args
+from .wirelog import WireLogger
+
+
+DEFAULT_READ_BUFSIZE = 4096
+
+logger = logging.getLogger('escpos.aio')
+wire = WireLogger(logger)
+
+
+def async_backoff(
+        max_tries=constants.BACKOFF_DEFAULT_MAXTRIES,
+        delay=constants.BACKOFF_DEFAULT_DELAY,
+        factor=constants.BACKOFF_DEFAULT_FACTOR,
+        exception_handler=always_retry,
+        before_delay_handler=noop,
+        after_delay_handler=noop):
+    """Exponential backoff decorator for coroutine functions. This is the
+    asynchronous counterpart of :func:`escpos.retry.backoff` and takes the
+    very same arguments, except that delays are awaited through
+    :func:`asyncio.sleep`, so the event loop is never blocked.
+
+    Unlike :func:`~escpos.retry.backoff`, which gives up silently, the last
+    exception is raised once tries run out, so failures are not mistaken for
+    successes. Cancellation is never retried: :class:`asyncio.CancelledError`
+    is raised immediately, even while delaying between retries. Handlers may
+    be regular functions or coroutine functions.
+    """
+    _validate_backoff_args(max_tries, delay, factor)
+
+    def outter(f):
+        @functools.wraps(f)
+        async def inner(*args, **kwargs):
+            m_max_tries, m_delay = max_tries, delay  # make mutable
+            while m_max_tries > 0:
+                try:
+                    retval = await f(*args, **kwargs)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as ex:
+                    m_max_tries -= 1  # consume an attempt
+                    if m_max_tries <= 0:
+                        # run out of tries
+                        raise
+                    if exception_handler(ex):
+                        logger.info(
+                                (
+                                    'backoff retry for: %r (max_tries=%r, '
+                                    'delay=%r, factor=%r)'
+                                ),
+                                f,
+                                max_tries,
+                                delay,
+                                factor
+                            )
+                        await _maybe_await(before_delay_handler(ex))
+                        await asyncio.sleep(m_delay)  # wait...
+                        await _maybe_await(after_delay_handler(ex))
+                        m_delay *= factor  # make future wait longer
+                    else:
+                        # exception handler gave up
+                        raise
+                else:
+                    # done without errors
+                    return retval
+        return inner
+    return outter
+
+
+def _network_exception_handler(ex):
+    # Retry for any socket related exception, including timeouts
+    return isinstance(ex, (OSError, asyncio.TimeoutError))
+
+
+class AsyncNetworkConnection(object):
+    """Implements a potentially resilient network TCP/IP connection based on
+    :mod:`asyncio` streams. Its methods are coroutines that mirror those of
+    :class:`~escpos.conn.network.NetworkConnection`, retrying through
+    :func:`async_backoff` with the same configuration.
+
+    :param float connect_timeout: Optional. Maximum time (in seconds) to wait
+        for the connection to be established.
+
+    :param float read_timeout: Optional. Maximum time (in seconds) to wait for
+        data to arrive on :meth:`read`. Defaults to 1 second, just as the
+        blocking connection ``select_timeout``.
+
+    """
+
+    SETTINGS_EXAMPLE = '192.168.0.100:9100'
+
+    @classmethod
+    def create(cls, setting, **kwargs):
+        """Instantiate a :class:`AsyncNetworkConnection` (or subclass) object
+        based on a given host name and port number (eg.
+        ``192.168.0.205:9100``).
+        """
+        host, port = setting.rsplit(':', 1)
+        return cls(host, int(port), **kwargs)
+
+    def __init__(
+            self,
+            host,
+            port,
+            connect_timeout=None,
+            read_timeout=1.0,
+            read_buffer_size=DEFAULT_READ_BUFSIZE):
+        super(AsyncNetworkConnection, self).__init__()
+        self.reader = None
+        self.writer = None
+        self.host_name = host
+        self.port_number = port
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.read_buffer_size = read_buffer_size
+
+    def __repr__(self):
+        content = (
+                '{}({!r}, {!r}, connect_timeout={!r}, read_timeout={!r}, '
+                'read_buffer_size={!r})'
+            ).format(
+                self.__class__.__name__,
+                self.host_name,
+                self.port_number,
+                self.connect_timeout,
+                self.read_timeout,
+                self.read_buffer_size
+            )
+        return content
+
+    def __str__(self):
+        return '{}:{}'.format(self.host_name, self.port_number)
+
+    async def __aenter__(self):
+        await self.catch()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.release()
+
+    async def _raw_catch(self):
+        self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host_name, self.port_number),
+                self.connect_timeout)
+        sock = self.writer.get_extra_info('socket')
+        if sock is not None:
+            # disables Nagle's algorithm, just as the blocking connection
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    async def _raw_release(self):
+        if self.writer is not None:
+            writer, self.reader, self.writer = self.writer, None, None
+            try:
+                writer.close()
+                if hasattr(writer, 'wait_closed'):  # Python 3.7+
+                    await writer.wait_closed()
+            except Exception:
+                pass
+
+    async def _raw_write(self, data):
+        if self.writer is None:
+            await self._raw_catch()
+        wire.debug('sending to %s:\n%s', self, data)
+        self.writer.write(data)
+        await self.writer.drain()
+
+    async def _raw_read(self):
+        if self.reader is None:
+            await self._raw_catch()
+        try:
+            return await asyncio.wait_for(
+                    self.reader.read(self.read_buffer_size),
+                    self.read_timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def catch(self):
+        @async_backoff(
+                max_tries=config.BACKOFF_MAXTRIES,
+                delay=config.BACKOFF_DELAY,
+                factor=config.BACKOFF_FACTOR,
+                exception_handler=_network_exception_handler)
+        async def _catch():
+            return await self._raw_catch()
+        return await _catch()
+
+    async def release(self):
+        await self._raw_release()
+
+    async def write(self, data):
+        @async_backoff(
+                max_tries=config.BACKOFF_MAXTRIES,
+                delay=config.BACKOFF_DELAY,
+                factor=config.BACKOFF_FACTOR,
+                exception_handler=_network_exception_handler,
+                before_delay_handler=self._before_delay_handler_for_write)
+        async def _write():
+            return await self._raw_write(data)
+        return await _write()
+
+    async def read(self):
+        return await self._raw_read()
+
+    async def _before_delay_handler_for_write(self, ex):
+        # a broken stream cannot be reused, so the next try will reconnect
+        await self._raw_release()
+
+
+class _CaptureDevice(object):
+    # Synchronous in-memory device where the wrapped implementation writes
+    # to; commands are collected to be sent later by the asynchronous facade
+
+    def __init__(self, device):
+        super(_CaptureDevice, self).__init__()
+        self._device = device
+        self._chunks = []
+
+    def __str__(self):
+        # printers are identified by their connection string (for example,
+        # by the NV graphics registry)
+        return str(self._device)
+
+    def take(self):
+        data = b''.join(self._chunks)
+        del self._chunks[:]
+        return data
+
+    def catch(self):
+        pass
+
+    def release(self):
+        pass
+
+    def write(self, data):
+        self._chunks.append(data)
+
+    def read(self):
+        # methods that read would block the event loop (and would never get
+        # an answer from here), so they need an asynchronous counterpart
+        raise RuntimeError(
+                'Cannot read synchronously from {}; this method has no '
+                'asynchronous implementation'.format(self))
+
+
+class _DeferredCompletion(object):
+    # Completion strategy that, instead of waiting, records how long the
+    # asynchronous facade should wait after the commands have been sent
+
+    def __init__(self):
+        super(_DeferredCompletion, self).__init__()
+        self.delay = None
+
+    def wait(self, device, delay):
+        self.delay = delay
+        return None
+
+
+class AsyncPrinter(object):
+    """Asynchronous facade over a printer implementation. Every public
+    method of the implementation is available as a coroutine function that
+    sends the resulting commands to the asynchronous connection. Non-callable
+    attributes (such as ``model`` and ``hardware_features``) are available
+    just as they are. Methods that read from the printer, such as
+    :meth:`status` and :meth:`end_job`, have asynchronous implementations;
+    any other implementation method that tries to read raises
+    :exc:`RuntimeError`.
+
+    Calls made on the same printer are serialized, so commands from
+    concurrent tasks will never interleave.
+
+    :param device: An asynchronous connection, such as
+        :class:`AsyncNetworkConnection`.
+
+    :param impl: Optional. The printer implementation class. Defaults to
+        :class:`~escpos.impl.epson.GenericESCPOS`.
+
+    :param kwargs: Keyword arguments for the implementation constructor,
+        such as ``features`` and ``encoding``.
+
+    """
+
+    def __init__(self, device, impl=GenericESCPOS, **kwargs):
+        super(AsyncPrinter, self).__init__()
+        self.device = device
+        self._capture = _CaptureDevice(device)
+        self._completion = _DeferredCompletion()
+        self._impl = impl(
+                self._capture,
+                completion=self._completion,
+                **kwargs
+            )
+        self._lock = None
+        self._buffered = None
+
+    def __getattr__(self, name):
+        attr = getattr(self._impl, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def method(*args, **kwargs):
+            return await self._call(attr, args, kwargs)
+
+        return method
+
+    async def __aenter__(self):
+        await self.catch()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.release()
+
+    @property
+    def impl(self):
+        """The wrapped (synchronous) implementation instance."""
+        return self._impl
+
+    async def catch(self):
+        await self.device.catch()
+
+    async def status(self, timeout=1.0, interval=0.05):
+        """Request the real-time printer status. See
+        :meth:`~escpos.impl.epson.GenericESCPOS.status` for details.
+        """
+        async def request():
+            await self.device.write(_status.DLE_EOT_QUERY)
+            data = await self._read_until(
+                    lambda data: len(data) >= 4,
+                    timeout,
+                    interval)
+            # any leftover answer to a previous command comes first
+            return _status.parse(bytes(data[-4:]))
+
+        return await self._exclusive(request)
+
+    async def end_job(self, ack=True, timeout=30, interval=0.05):
+        """Mark the end of a job and await the printer acknowledgement. See
+        :meth:`~escpos.impl.epson.GenericESCPOS.end_job` for details. Within
+        a :meth:`buffered` block the request is just added to the block.
+
+        :returns: Time (in seconds) from the request to the acknowledgement,
+            or ``None`` if ``ack`` is false or within a buffered block.
+
+        :raises TimeoutException: If the printer does not acknowledge the job
+            within ``timeout``.
+
+        """
+        if (self._buffered is not None
+                and self._buffered.owner is _current_task()):
+            return self._impl.end_job(ack=ack)
+
+        if not ack:
+            return None  # there is nothing pending outside buffered blocks
+
+        async def request():
+            loop = asyncio.get_event_loop()
+            data, expected = self._impl._job_ack_request()
+            start = loop.time()
+            await self.device.write(data)
+            response = await self._read_until(
+                    lambda response: expected in response,
+                    timeout,
+                    interval)
+            if expected not in response:
+                raise TimeoutException((
+                        'printer did not acknowledge job within {!r} seconds'
+                    ).format(timeout))
+            return loop.time() - start
+
+        return await self._exclusive(request)
+
+    async def release(self):
+        await self.device.release()
+
+    def buffered(self, size=None):
+        """Asynchronous context manager that sends every command issued
+        within the block in a single write, when the block exits. See
+        :meth:`~escpos.impl.epson.GenericESCPOS.buffered` for details.
+
+        .. sourcecode:: python
+
+            async with printer.buffered():
+                await printer.text('Hello World!')
+                await printer.cut()
+
+        """
+        return _AsyncBuffered(self, size)
+
+    async def _exclusive(self, request):
+        # await the request coroutine function holding the lock, unless the
+        # current task holds it already in a buffered block
+        if (self._buffered is not None
+                and self._buffered.owner is _current_task()):
+            return await request()
+        async with self._get_lock():
+            return await request()
+
+    async def _read_until(self, done, timeout, interval):
+        # read until done(data) is true or timeout expires, never blocking
+        # the event loop, returning whatever was read
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+        data = bytearray()
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return data
+            try:
+                incoming = await asyncio.wait_for(
+                        self.device.read(),
+                        remaining)
+            except asyncio.TimeoutError:
+                incoming = None
+            if incoming:
+                data.extend(bytearray(incoming))
+                if done(data):
+                    return data
+            else:
+                remaining = deadline - loop.time()
+                await asyncio.sleep(max(0, min(interval, remaining)))
+
+    def _get_lock(self):
+        # created lazily, so it is bound to the running event loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def _call(self, method, args, kwargs):
+        if (self._buffered is not None
+                and self._buffered.owner is _current_task()):
+            # the buffering task already holds the lock
+            return method(*args, **kwargs)
+
+        async with self._get_lock():
+            self._completion.delay = None
+            try:
+                retval = method(*args, **kwargs)
+            except Exception:
+                self._capture.take()  # discard partial commands
+                raise
+            data = self._capture.take()
+            if data:
+                await self.device.write(data)
+            if self._completion.delay is not None:
+                await asyncio.sleep(self._completion.delay)
+                return await self.device.read()
+            return retval
+
+
+class _AsyncBuffered(object):
+
+    def __init__(self, printer, size):
+        super(_AsyncBuffered, self).__init__()
+        self._printer = printer
+        self._size = size
+        self._context = None
+        self.owner = None
+
+    async def __aenter__(self):
+        printer = self._printer
+        if (printer._buffered is not None
+                and printer._buffered.owner is _current_task()):
+            raise RuntimeError('Nested asynchronous buffered blocks')
+        await printer._get_lock().acquire()
+        printer._buffered = self
+        self.owner = _current_task()
+        # chunks flushed before the block exits (if size is given) are
+        # just collected by the capture device
+        self._context = printer._impl.buffered(size=self._size)
+        self._context.__enter__()
+        return printer
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        printer = self._printer
+        try:
+            self._context.__exit__(exc_type, exc_value, traceback)
+            data = printer._capture.take()
+            if exc_type is None and data:
+                await printer.device.write(data)
+        finally:
+            printer._buffered = None
+            printer._get_lock().release()
+        return False
+
+
+def _current_task():
+    if hasattr(asyncio, 'current_task'):  # Python 3.7+
+        return asyncio.current_task()
+    return asyncio.Task.current_task()
+
+
+async def _maybe_await(value):
+    if asyncio.iscoroutine(value):
+        return await value
+    return value
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/asb.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Automatic Status Back (ASB). Once enabled through ``GS a``, the printer
+sends its status on its own whenever it changes, so there is no need to poll
+printers to know, for example, that one has run out of paper.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import logging
+import threading
+import time
+
+import six
+
+from . import status as _status
+
+
+ASB_DRAWER = 0x01
+ASB_ONLINE = 0x02
+ASB_ERROR = 0x04
+ASB_PAPER_SENSOR = 0x08
+ASB_ALL = ASB_DRAWER | ASB_ONLINE | ASB_ERROR | ASB_PAPER_SENSOR
+
+DEFAULT_POLL_TIMEOUT = 0.2
+
+JOB_ACK_HEADER = b'\x37\x22'
+"""First bytes of the answer to a transmission response request (``GS ( H``),
+which is followed by the process ID digits and a NUL.
+"""
+
+MAX_RECONNECT_DELAY = 5.0
+"""Longest time (in seconds) between attempts to reconnect the reader."""
+
+logger = logging.getLogger('escpos.asb')
+
+
+def gs_a(mode):
+    """Build the ``GS a`` command that enables Automatic Status Back for
+    the given status changes (a combination of ``ASB_*`` flags) or disables
+    it, if ``mode`` is zero.
+    """
+    return b'\x1D\x61' + six.int2byte(mode)
+
+
+class AutomaticStatusBack(object):
+    """Wraps a connection, enabling Automatic Status Back on :meth:`catch`
+    and running a background reader that takes unsolicited status out of the
+    incoming data, which would otherwise be mistaken for the answers to
+    other commands. Subscribers are called on every status change.
+
+    .. sourcecode:: python
+
+        def on_change(old, new):
+            if new.paper_end:
+                dashboard.alert('{} is out of paper'.format(conn))
+
+        conn = AutomaticStatusBack(NetworkConnection.create('10.0.0.5:9100'))
+        conn.subscribe(on_change)
+        printer = GenericESCPOS(conn)
+
+    The wrapped connection must implement ``poll(timeout)``, as
+    :class:`~escpos.conn.network.NetworkConnection` and
+    :class:`~escpos.conn.serial.SerialConnection` do.
+
+    :param connection: The connection to wrap.
+
+    :param int mode: Optional. Status changes the printer should send.
+        Defaults to :const:`ASB_ALL`.
+
+    :param float read_timeout: Optional. Time (in seconds) :meth:`read` will
+        wait for answers to arrive.
+
+    """
+
+    def __init__(
+            self,
+            connection,
+            mode=ASB_ALL,
+            read_timeout=1.0,
+            poll_timeout=DEFAULT_POLL_TIMEOUT):
+        super(AutomaticStatusBack, self).__init__()
+        self.connection = connection
+        self.mode = mode
+        self.read_timeout = read_timeout
+        self.poll_timeout = poll_timeout
+        self._status = None
+        self._subscribers = []
+        self._pending = bytearray()  # incomplete status being received
+        self._ack = 0  # bytes of the job ack header received so far
+        self._responses = bytearray()
+        self._received = threading.Condition(threading.Lock())
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __repr__(self):
+        return '{}({!r}, mode={!r})'.format(
+                self.__class__.__name__,
+                self.connection,
+                self.mode
+            )
+
+    def __str__(self):
+        return str(self.connection)
+
+    @property
+    def status(self):
+        """Last :class:`~escpos.status.ASBStatus` sent by the printer or
+        ``None`` if none has been received yet.
+        """
+        return self._status
+
+    def subscribe(self, callback):
+        """Call ``callback(old, new)`` whenever the printer status changes.
+        On the first status received, ``old`` is ``None``. Callbacks are
+        called from the reader thread, so they should return quickly.
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        self._subscribers.remove(callback)
+
+    def catch(self):
+        self.connection.catch()
+        self.connection.write(gs_a(self.mode))
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                    target=self._run,
+                    name='escpos-asb-reader')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def release(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        try:
+            self.connection.write(gs_a(0))
+        except Exception:
+            logger.exception('cannot disable ASB on %s', self)
+        release = getattr(self.connection, 'release', None)
+        if release is not None:
+            release()
+
+    def write(self, data):
+        self.connection.write(data)
+
+    def read(self):
+        """Returns the data received since the last read, except status sent
+        automatically, waiting up to ``read_timeout`` for data to arrive.
+        """
+        deadline = time.time() + self.read_timeout
+        with self._received:
+            while not self._responses:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return None
+                self._received.wait(remaining)
+            data = bytes(self._responses)
+            del self._responses[:]
+            return data
+
+    def feed(self, data):
+        """Demultiplex incoming data. Called by the reader thread with data
+        from the wrapped connection.
+        """
+        statuses = []
+        ack_header = bytearray(JOB_ACK_HEADER)
+        with self._received:
+            for value in bytearray(data):
+                if self._ack == len(ack_header):
+                    # job ack digits may look like status headers; they are
+                    # answers up to the closing NUL
+                    self._responses.append(value)
+                    if value == 0x00:
+                        self._ack = 0
+                    continue
+                if self._ack:
+                    if value == ack_header[self._ack]:
+                        self._ack += 1
+                        self._responses.append(value)
+                        continue
+                    self._ack = 0
+                if self._pending:
+                    if _status.is_asb_byte(value):
+                        self._pending.append(value)
+                        if len(self._pending) == 4:
+                            statuses.append(bytes(self._pending))
+                            del self._pending[:]
+                        continue
+                    # not a status after all
+                    self._responses.extend(self._pending)
+                    del self._pending[:]
+                if value == ack_header[0]:
+                    self._ack = 1
+                    self._responses.append(value)
+                elif _status.is_status_byte(value):
+                    # a DLE EOT answer
+                    self._responses.append(value)
+                elif _status.is_asb_header(value):
+                    self._pending.append(value)
+                else:
+                    self._responses.append(value)
+            if self._responses:
+                self._received.notify_all()
+        for data in statuses:
+            self._publish(_status.parse_asb(data))
+
+    def _publish(self, new):
+        old, self._status = self._status, new
+        if old == new:
+            return
+        logger.debug('status changed on %s: %r', self, new)
+        for callback in list(self._subscribers):
+            try:
+                callback(old, new)
+            except Exception:
+                logger.exception('ASB subscriber %r failed', callback)
+
+    def _run(self):
+        delay = self.poll_timeout
+        while not self._stop.is_set():
+            try:
+                data = self.connection.poll(self.poll_timeout)
+            except Exception as ex:
+                # for instance, the printer closed the connection; back off
+                # and reconnect, so ASB is enabled again
+                logger.warning('cannot poll %s: %r', self, ex)
+                while not self._stop.wait(delay):
+                    delay = min(delay * 2, MAX_RECONNECT_DELAY)
+                    if self._reconnect():
+                        break
+                continue
+            delay = self.poll_timeout
+            if data:
+                self.feed(data)
+
+    def _reconnect(self):
+        try:
+            self.connection.catch()
+            self.connection.write(gs_a(self.mode))
+        except Exception as ex:
+            logger.warning('cannot reconnect %s: %r', self, ex)
+            return False
+        logger.info('reconnected %s', self)
+        return True
@@ -0,0 +1,470 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/capture.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Wire captures: a compact binary record of the data written to and read
+from printer connections, with timestamps, which can be replayed later
+against any connection, at the original pace or as fast as possible.
+
+.. sourcecode:: python
+
+    from escpos import capture
+
+    with capture.CaptureWriter('store.cap') as writer:
+        conn = capture.tee(NetworkConnection.create('10.0.0.5:9100'), writer)
+        printer = GenericESCPOS(conn)
+        ...
+
+    conn = NetworkConnection.create('127.0.0.1:9100')  # a simulator
+    result = capture.replay('store.cap', conn, speed=None)
+
+A capture file starts with a header (magic, version and the capture start
+time), followed by records, each with a header (type, stream, time offset
+and length) and its data, and ends with an index of the data records
+(their file offsets and time offsets), so readers can skip to a point in
+time. Captures cut short, without index, can still be read sequentially.
+Every connection recorded is a stream, named by a stream record.
+
+It also works from the command line::
+
+    python -m escpos.capture info store.cap
+    python -m escpos.capture replay store.cap network 127.0.0.1:9100
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import bisect
+import io
+import os
+import struct
+import threading
+import time
+
+from collections import namedtuple
+
+import six
+
+from .conn import middleware
+from .exceptions import CaptureFormatError
+
+
+MAGIC = b'ESCPCAP\x00'
+
+INDEX_MAGIC = b'ESCPIDX\x00'
+
+VERSION = 1
+
+HEADER = struct.Struct(b'<8sHHd')  # magic, version, reserved, start time
+
+RECORD_HEADER = struct.Struct(b'<BHdI')  # type, stream, time offset, length
+
+INDEX_ENTRY = struct.Struct(b'<Qd')  # file offset, time offset
+
+FOOTER = struct.Struct(b'<Q8s')  # index offset, index magic
+
+RECORD_STREAM = 1
+RECORD_WRITE = 2
+RECORD_READ = 3
+
+RECORD_TYPES = (
+        (RECORD_STREAM, 'Stream (connection) name'),
+        (RECORD_WRITE, 'Data written'),
+        (RECORD_READ, 'Data read'),
+    )
+
+_DIRECTION_TYPES = {
+        middleware.WRITE: RECORD_WRITE,
+        middleware.READ: RECORD_READ,
+    }
+
+_TYPE_DIRECTIONS = dict((v, k) for k, v in _DIRECTION_TYPES.items())
+
+_RECORD_TYPE_IDS = frozenset(t for t, description in RECORD_TYPES)
+
+
+Record = namedtuple('Record', [
+        'time',  # seconds since the capture started
+        'stream',  # stream id
+        'direction',  # middleware.WRITE or middleware.READ
+        'data',
+    ])
+
+ReplayResult = namedtuple('ReplayResult', [
+        'records',  # number of write records replayed
+        'bytes',  # number of bytes written
+        'elapsed',  # seconds
+    ])
+
+
+class CaptureWriter(object):
+    """Writes a capture file. It is safe to record many connections (each
+    a stream) from many threads at once. The index is written on
+    :meth:`close`.
+
+    :param target: File name or binary file object, which must be seekable
+        to be read back with its index (see :class:`CaptureReader`).
+
+    """
+
+    def __init__(self, target):
+        super(CaptureWriter, self).__init__()
+        if isinstance(target, six.string_types):
+            self._fileobj = io.open(target, 'wb')
+            self._owned = True
+        else:
+            self._fileobj = target
+            self._owned = False
+        self.start_time = time.time()
+        self._offset = 0
+        self._index = []
+        self._streams = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._write(HEADER.pack(MAGIC, VERSION, 0, self.start_time))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def streams(self):
+        """Names of the streams recorded, by stream id."""
+        return list(self._streams)
+
+    def stream(self, name):
+        """Start a new stream with the given name, such as the connection
+        string, returning a recorder, that is, a callable taking a
+        direction (:const:`~escpos.conn.middleware.WRITE` or
+        :const:`~escpos.conn.middleware.READ`) and data, suitable for
+        :class:`~escpos.conn.middleware.Tee`.
+        """
+        with self._lock:
+            stream_id = len(self._streams)
+            self._streams.append(name)
+            self._record(
+                    RECORD_STREAM,
+                    stream_id,
+                    time.time() - self.start_time,
+                    name.encode('utf-8'))
+
+        def recorder(direction, data):
+            self.record(stream_id, direction, data)
+
+        return recorder
+
+    def record(self, stream_id, direction, data):
+        record_type = _DIRECTION_TYPES[direction]
+        with self._lock:
+            if self._closed:
+                return
+            offset_time = time.time() - self.start_time
+            self._index.append(INDEX_ENTRY.pack(self._offset, offset_time))
+            self._record(record_type, stream_id, offset_time, data)
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            index_offset = self._offset
+            self._write(INDEX_MAGIC)
+            self._write(struct.pack(b'<I', len(self._index)))
+            self._write(b''.join(self._index))
+            self._write(FOOTER.pack(index_offset, INDEX_MAGIC))
+            self._fileobj.flush()
+            if self._owned:
+                self._fileobj.close()
+
+    def _record(self, record_type, stream_id, offset_time, data):
+        self._write(RECORD_HEADER.pack(
+                record_type,
+                stream_id,
+                offset_time,
+                len(data)))
+        self._write(data)
+
+    def _write(self, data):
+        self._fileobj.write(data)
+        self._offset += len(data)
+
+
+class CaptureReader(object):
+    """Reads a capture file.
+
+    .. sourcecode:: python
+
+        with CaptureReader('store.cap') as reader:
+            for record in reader.records(start=60.0):
+                print(record.time, reader.streams[record.stream],
+                      record.direction, len(record.data))
+
+    :param source: File name or binary file object.
+
+    """
+
+    def __init__(self, source):
+        super(CaptureReader, self).__init__()
+        if isinstance(source, six.string_types):
+            self._fileobj = io.open(source, 'rb')
+            self._owned = True
+        else:
+            self._fileobj = source
+            self._owned = False
+        header = self._fileobj.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise CaptureFormatError('Not a capture file (too short)')
+        magic, version, reserved, self.start_time = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise CaptureFormatError('Not a capture file')
+        if version > VERSION:
+            raise CaptureFormatError(
+                    'Unsupported capture version: {!r}'.format(version))
+        self._end = None  # where records end (the index offset), if known
+        self._offsets = None
+        self._times = None
+        self.streams = {}
+        """Names of the streams recorded, by stream id."""
+
+        self._load_index()
+        self._load_streams()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        """Number of data (write and read) records."""
+        if self._offsets is not None:
+            return len(self._offsets)
+        return sum(1 for record in self.records())
+
+    @property
+    def indexed(self):
+        """Whether the capture has an index (that is, it was closed)."""
+        return self._offsets is not None
+
+    def close(self):
+        if self._owned:
+            self._fileobj.close()
+
+    def records(self, stream=None, direction=None, start=None):
+        """Yield :class:`Record` instances, in the order they were recorded,
+        optionally only those of the given stream and direction and those
+        recorded ``start`` seconds (or more) after the capture started.
+        """
+        offset = HEADER.size
+        if start is not None and self._times is not None:
+            position = bisect.bisect_left(self._times, start)
+            if position >= len(self._offsets):
+                return
+            offset = self._offsets[position]
+        for record_type, record in self._scan(offset):
+            if record_type == RECORD_STREAM:
+                continue
+            if stream is not None and record.stream != stream:
+                continue
+            if direction is not None and record.direction != direction:
+                continue
+            if start is not None and record.time < start:
+                continue
+            yield record
+
+    def _scan(self, offset):
+        fileobj = self._fileobj
+        fileobj.seek(offset)
+        while self._end is None or offset < self._end:
+            header = fileobj.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                break  # capture cut short
+            record_type, stream, offset_time, length = RECORD_HEADER.unpack(
+                    header)
+            if record_type not in _RECORD_TYPE_IDS:
+                break  # index reached, in a capture cut short while closing
+            data = fileobj.read(length)
+            if len(data) < length:
+                break
+            offset += RECORD_HEADER.size + length
+            direction = _TYPE_DIRECTIONS.get(record_type)
+            yield record_type, Record(offset_time, stream, direction, data)
+            fileobj.seek(offset)  # since callers may read in between
+
+    def _load_index(self):
+        fileobj = self._fileobj
+        fileobj.seek(0, os.SEEK_END)
+        size = fileobj.tell()
+        if size < HEADER.size + FOOTER.size:
+            return
+        fileobj.seek(size - FOOTER.size)
+        index_offset, magic = FOOTER.unpack(fileobj.read(FOOTER.size))
+        if magic != INDEX_MAGIC:
+            return
+        fileobj.seek(index_offset)
+        if fileobj.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+            return
+        count, = struct.unpack(b'<I', fileobj.read(4))
+        entries = fileobj.read(count * INDEX_ENTRY.size)
+        self._offsets, self._times = [], []
+        for i in range(count):
+            offset, offset_time = INDEX_ENTRY.unpack_from(
+                    entries, i * INDEX_ENTRY.size)
+            self._offsets.append(offset)
+            self._times.append(offset_time)
+        self._end = index_offset
+
+    def _load_streams(self):
+        for record_type, record in self._scan(HEADER.size):
+            if record_type == RECORD_STREAM:
+                self.streams[record.stream] = record.data.decode('utf-8')
+
+
+def tee(connection, writer, name=None):
+    """Wrap a connection so everything written to and read from it is
+    recorded as a new stream of the given :class:`CaptureWriter`, named
+    after the connection, unless ``name`` is given.
+    """
+    recorder = writer.stream(str(connection) if name is None else name)
+    return middleware.Tee(connection, recorder)
+
+
+def replay(source, connection, stream=None, speed=1.0, read=False):
+    """Write the data written in a capture to a connection (caught first),
+    at the original pace or as fast as possible.
+
+    :param source: Capture file name, binary file object or
+        :class:`CaptureReader`.
+
+    :param connection: Any connection, such as those in :mod:`escpos.conn`.
+
+    :param int stream: Optional. Replay only this stream. Defaults to all
+        of them, merged in the order they were recorded.
+
+    :param float speed: Optional. Pace relative to the original (``2.0``
+        is twice as fast) or ``None`` to write as fast as possible.
+
+    :param bool read: Optional. Whether to read from the connection where
+        the capture has reads, so answers do not pile up.
+
+    :returns: A :class:`ReplayResult`.
+
+    """
+    if not isinstance(source, CaptureReader):
+        with CaptureReader(source) as reader:
+            return replay(reader, connection, stream, speed, read)
+
+    connection.catch()
+    records = nbytes = 0
+    first = None
+    started = time.time()
+    for record in source.records(stream=stream):
+        if speed:
+            if first is None:
+                first = record.time
+            delay = (record.time - first) / speed - (time.time() - started)
+            if delay > 0:
+                time.sleep(delay)
+        if record.direction == middleware.WRITE:
+            connection.write(record.data)
+            records += 1
+            nbytes += len(record.data)
+        elif read:
+            connection.read()
+    return ReplayResult(records, nbytes, time.time() - started)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+            prog='python -m escpos.capture',
+            description='Inspect and replay ESC/POS wire captures.')
+    commands = parser.add_subparsers(dest='command')
+
+    info = commands.add_parser('info', help='describe a capture')
+    info.add_argument('capture')
+
+    replayer = commands.add_parser('replay', help='replay a capture')
+    replayer.add_argument('capture')
+    replayer.add_argument(
+            'type',
+            help='connection type, such as network or serial')
+    replayer.add_argument(
+            'settings',
+            help='connection settings, such as 127.0.0.1:9100')
+    replayer.add_argument('--stream', type=int, default=None)
+    replayer.add_argument(
+            '--speed',
+            type=float,
+            default=1.0,
+            help='pace relative to the original (default: %(default)s)')
+    replayer.add_argument(
+            '--max-speed',
+            action='store_true',
+            help='write as fast as possible')
+    replayer.add_argument(
+            '--read',
+            action='store_true',
+            help='read from the connection where the capture has reads')
+
+    args = parser.parse_args(argv)
+    if args.command == 'info':
+        _info(args.capture)
+    elif args.command == 'replay':
+        connection = middleware.create(args.type, args.settings)
+        result = replay(
+                args.capture,
+                connection,
+                stream=args.stream,
+                speed=None if args.max_speed else args.speed,
+                read=args.read)
+        print('{} writes, {} bytes in {:.3f}s'.format(*result))
+    else:
+        parser.print_usage()
+        return 2
+    return 0
+
+
+def _info(path):
+    with CaptureReader(path) as reader:
+        totals = {}
+        duration = 0.0
+        for record in reader.records():
+            key = (record.stream, record.direction)
+            count, nbytes = totals.get(key, (0, 0))
+            totals[key] = (count + 1, nbytes + len(record.data))
+            duration = record.time
+        print('started at {} ({}), {:.3f}s, {} records{}'.format(
+                time.strftime(
+                        '%Y-%m-%d %H:%M:%S',
+                        time.localtime(reader.start_time)),
+                reader.start_time,
+                duration,
+                sum(count for count, nbytes in totals.values()),
+                '' if reader.indexed else ' (no index)'))
+        for stream_id, name in sorted(reader.streams.items()):
+            for direction, description in middleware.DIRECTIONS:
+                count, nbytes = totals.get((stream_id, direction), (0, 0))
+                print('  #{} {}: {} {}s, {} bytes'.format(
+                        stream_id, name, count, direction, nbytes))
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
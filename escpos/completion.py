@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/completion.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Strategies for detecting when lengthy operations, such as printing
+barcodes and QRCodes, are completed by the printer.
+
+Implementations request a wait by calling the strategy ``wait`` method with
+the device and the amount of time (in seconds) that is known to be enough
+for the operation to complete, which works as a worst-case estimate.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import time
+
+
+GS_R_PAPER_SENSOR_STATUS = b'\x1D\x72\x01'
+"""Command ``GS r 1`` (transmit paper sensor status). Unlike real-time
+commands (``DLE EOT``), it is processed in sequence, so the printer will only
+answer after all data sent before it has been processed.
+"""
+
+DLE_EOT_PRINTER_STATUS = b'\x10\x04\x01'
+"""Command ``DLE EOT 1`` (transmit printer status, real-time). The printer
+answers as soon as it receives this command, so the answer only tells that
+the printer is online, not that previous data has been processed.
+"""
+
+
+class FixedDelay(object):
+    """Waits a fixed amount of time and then reads any response available.
+    This is the default strategy.
+    """
+
+    def wait(self, device, delay):
+        time.sleep(delay)
+        return device.read()
+
+
+class StatusPolling(object):
+    """Sends a status request right after the operation and polls the device
+    until the printer answers, returning as soon as the answer arrives. If
+    the printer does not answer within the timeout, this strategy will just
+    behave as :class:`FixedDelay`.
+
+    .. sourcecode:: python
+
+        from escpos.completion import StatusPolling
+
+        printer = GenericESCPOS(conn, completion=StatusPolling())
+
+    :param bytes query: Optional. The status request command. Defaults to
+        :const:`GS_R_PAPER_SENSOR_STATUS`.
+
+    :param float interval: Optional. Time to wait (in seconds) between reads,
+        for connections that cannot be polled. Defaults to 50 milliseconds.
+
+    :param float timeout: Optional. Maximum time to wait (in seconds) for the
+        printer to answer. Defaults to ``None``, which means to wait for no
+        longer than the worst-case estimate given by the implementation.
+
+    """
+
+    def __init__(
+            self,
+            query=GS_R_PAPER_SENSOR_STATUS,
+            interval=0.05,
+            timeout=None):
+        super(StatusPolling, self).__init__()
+        self.query = query
+        self.interval = interval
+        self.timeout = timeout
+
+    def wait(self, device, delay):
+        timeout = delay if self.timeout is None else self.timeout
+        deadline = time.time() + timeout
+        device.write(self.query)
+        # connections that support it are polled, since reading would
+        # reconnect (and retry) while a busy printer does not answer
+        poll = getattr(device, 'poll', None)
+        while True:
+            remaining = deadline - time.time()
+            if poll is not None:
+                data = poll(max(0, remaining))
+            else:
+                data = device.read()
+            if data:
+                # leave the answer to our status request out of the response
+                return bytes(bytearray(data)[:-1])
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            if poll is None:
+                time.sleep(min(self.interval, remaining))
+        return data
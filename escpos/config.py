@@ -25,6 +25,9 @@ import os
 from .constants import BACKOFF_DEFAULT_MAXTRIES
 from .constants import BACKOFF_DEFAULT_DELAY
 from .constants import BACKOFF_DEFAULT_FACTOR
+from .constants import RASTER_CACHE_DEFAULT_MAX_BYTES
+from .constants import WIRELOG_DEFAULT_MAX_BYTES
+from .constants import WIRELOG_DEFAULT_SAMPLE
 
 try:
     from decouple import config as decouple_config
@@ -33,14 +36,32 @@ except ImportError:
     _lib_decouple = False
 
 
-def _env(var_name, default):
+def _optional_int(value):
+    # unset (or set to an empty string) means no value at all
+    return None if value is None or value == '' else int(value)
+
+
+def _env(var_name, default, cast=int):
     if _lib_decouple:
-        return decouple_config(var_name, cast=int, default=default)
+        return decouple_config(var_name, cast=cast, default=default)
     else:
         value = os.getenv(var_name)
-        return default if value is None else int(value)
+        return default if value is None else cast(value)
 
 
 BACKOFF_MAXTRIES = _env('ESCPOS_BACKOFF_MAXTRIES', BACKOFF_DEFAULT_MAXTRIES)
 BACKOFF_DELAY = _env('ESCPOS_BACKOFF_DELAY', BACKOFF_DEFAULT_DELAY)
 BACKOFF_FACTOR = _env('ESCPOS_BACKOFF_FACTOR', BACKOFF_DEFAULT_FACTOR)
+
+RASTER_CACHE_MAX_BYTES = _env(
+        'ESCPOS_RASTER_CACHE_MAX_BYTES',
+        RASTER_CACHE_DEFAULT_MAX_BYTES
+    )
+
+WIRELOG_MAX_BYTES = _env(
+        'ESCPOS_WIRELOG_MAX_BYTES',
+        WIRELOG_DEFAULT_MAX_BYTES,
+        cast=_optional_int
+    )
+
+WIRELOG_SAMPLE = _env('ESCPOS_WIRELOG_SAMPLE', WIRELOG_DEFAULT_SAMPLE)
@@ -23,6 +23,7 @@ from __future__ import unicode_literals
 import functools
 import logging
 import socket
+import time
 
 from future.utils import python_2_unicode_compatible
 
@@ -38,11 +39,13 @@ except ImportError:
     _RETRY_EXCEPTIONS = ()
 
 from .. import config
-from ..helpers import hexdump
+from .. import metrics
 from ..retry import backoff
+from ..wirelog import WireLogger
 
 
 logger = logging.getLogger('escpos.conn.bt')
+wire = WireLogger(logger)
 
 
 class BluetoothConnectionError(Exception):
@@ -141,6 +144,7 @@ class BluetoothConnection(object):
         self.socket = None
         self.address = address
         self.port = port
+        self.metrics = metrics.connection_metrics('bluetooth', str(self))
 
     def __repr__(self):
         content = '{}({!r}, port={!r})'.format(
@@ -153,35 +157,21 @@ class BluetoothConnection(object):
     def __str__(self):
         return '{}/{}'.format(self.address, self.port)
 
-    @backoff(
-            max_tries=config.BACKOFF_MAXTRIES,
-            delay=config.BACKOFF_DELAY,
-            factor=config.BACKOFF_FACTOR,
-            exception_handler=_bt_exception_handler)
-    def release(self):
+    def _retrying(self, ex):
+        self.metrics.record_retry()
+
+    def _raw_release(self):
         if self.socket is not None:
             self.socket.shutdown(socket.SHUT_RDWR)
             self.socket.close()
             self.socket = None
 
-    @depends_on_pybluez_lib
-    @backoff(
-            max_tries=config.BACKOFF_MAXTRIES,
-            delay=config.BACKOFF_DELAY,
-            factor=config.BACKOFF_FACTOR,
-            exception_handler=_bt_exception_handler)
-    def catch(self):
+    def _raw_catch(self):
         self.socket = bluetooth.BluetoothSocket(bluetooth.RFCOMM)
         self.socket.connect((self.address, self.port))
 
-    @backoff(
-            max_tries=config.BACKOFF_MAXTRIES,
-            delay=config.BACKOFF_DELAY,
-            factor=config.BACKOFF_FACTOR,
-            exception_handler=_bt_exception_handler)
-    def write(self, data):
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug('writing to bluetooth %s:\n%s', self, hexdump(data))
+    def _raw_write(self, data):
+        wire.debug('writing to bluetooth %s:\n%s', self, data)
         totalsent = 0
         while totalsent < len(data):
             sent = self.socket.send(data[totalsent:])
@@ -189,14 +179,63 @@ class BluetoothConnection(object):
                 self._raise_with_details('socket connection broken')
             totalsent += sent
 
-    @backoff(
-            max_tries=config.BACKOFF_MAXTRIES,
-            delay=config.BACKOFF_DELAY,
-            factor=config.BACKOFF_FACTOR,
-            exception_handler=_bt_exception_handler)
-    def read(self):
+    def _raw_read(self):
         try:
             return self.socket.recv()
         except Exception:
             logger.exception('read error')
             return None
+
+    def release(self):
+        @backoff(
+                max_tries=config.BACKOFF_MAXTRIES,
+                delay=config.BACKOFF_DELAY,
+                factor=config.BACKOFF_FACTOR,
+                exception_handler=_bt_exception_handler,
+                before_delay_handler=self._retrying)
+        def _release():
+            return self._raw_release()
+        return _release()
+
+    @depends_on_pybluez_lib
+    def catch(self):
+        @backoff(
+                max_tries=config.BACKOFF_MAXTRIES,
+                delay=config.BACKOFF_DELAY,
+                factor=config.BACKOFF_FACTOR,
+                exception_handler=_bt_exception_handler,
+                before_delay_handler=self._retrying)
+        def _catch():
+            return self._raw_catch()
+        return _catch()
+
+    def write(self, data):
+        @backoff(
+                max_tries=config.BACKOFF_MAXTRIES,
+                delay=config.BACKOFF_DELAY,
+                factor=config.BACKOFF_FACTOR,
+                exception_handler=_bt_exception_handler,
+                before_delay_handler=self._retrying)
+        def _write():
+            return self._raw_write(data)
+        started = time.time()
+        try:
+            result = _write()
+        except Exception:
+            self.metrics.record_error()
+            raise
+        self.metrics.record_write(len(data), time.time() - started)
+        return result
+
+    def read(self):
+        @backoff(
+                max_tries=config.BACKOFF_MAXTRIES,
+                delay=config.BACKOFF_DELAY,
+                factor=config.BACKOFF_FACTOR,
+                exception_handler=_bt_exception_handler,
+                before_delay_handler=self._retrying)
+        def _read():
+            return self._raw_read()
+        data = _read()
+        self.metrics.record_read(len(data) if data else 0)
+        return data
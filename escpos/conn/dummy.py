@@ -21,11 +21,14 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import logging
+import time
 
-from ..helpers import hexdump
+from .. import metrics
+from ..wirelog import WireLogger
 
 
 logger = logging.getLogger('escpos.conn.dummy')
+wire = WireLogger(logger)
 
 
 class DummyConnection(object):
@@ -45,15 +48,17 @@ class DummyConnection(object):
     def __init__(self, *args, **kwargs):
         super(DummyConnection, self).__init__()
         self._output_list = []
+        self.metrics = metrics.connection_metrics('dummy', 'dummy')
 
     def write(self, data):
         """Print any command sent in raw format.
 
         :param str data: Arbitrary code to be printed.
         """
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug('writing to %r:\n%s', self, hexdump(data))
+        wire.debug('writing to %r:\n%s', self, data)
+        started = time.time()
         self._output_list.append(data)
+        self.metrics.record_write(len(data), time.time() - started)
 
     @property
     def output(self):
@@ -21,13 +21,16 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import logging
+import time
 
 from future.utils import python_2_unicode_compatible
 
-from ..helpers import hexdump
+from .. import metrics
+from ..wirelog import WireLogger
 
 
 logger = logging.getLogger('escpos.conn.file')
+wire = WireLogger(logger)
 
 
 @python_2_unicode_compatible
@@ -43,6 +46,7 @@ class FileConnection(object):
         super(FileConnection, self).__init__()
         self.devfile = devfile
         self.auto_flush = auto_flush
+        self.metrics = metrics.connection_metrics('file', devfile)
         self.open()
 
     def __repr__(self):
@@ -71,11 +75,16 @@ class FileConnection(object):
 
         :param bytes data: arbitrary code to be printed.
         """
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug('writing to file %s:\n%s', self, hexdump(data))
-        self.device.write(data)
-        if self.auto_flush:
-            self.flush()
+        wire.debug('writing to file %s:\n%s', self, data)
+        started = time.time()
+        try:
+            self.device.write(data)
+            if self.auto_flush:
+                self.flush()
+        except Exception:
+            self.metrics.record_error()
+            raise
+        self.metrics.record_write(len(data), time.time() - started)
 
     def close(self):
         """Close system file."""
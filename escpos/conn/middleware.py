@@ -0,0 +1,393 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/conn/middleware.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Connection middleware: stages that wrap a connection, each adding one
+behavior, composed at construction time so a deployment pays only for the
+stages it needs.
+
+.. sourcecode:: python
+
+    from escpos.conn import middleware
+
+    conn = middleware.create('network', '10.0.0.5:9100', [
+            middleware.Metrics,
+            (middleware.RateLimit, {'rate': 20000}),
+            middleware.Coalesce,
+        ])
+    printer = GenericESCPOS(conn)
+
+Stages are listed from the outermost (called first) to the innermost (the
+one that wraps the connection). A stack of stages is itself a connection, so
+it can be given to printers as any other connection, and any other attribute
+(such as ``poll``) is looked up in the wrapped connection.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import functools
+import logging
+import socket
+import threading
+import time
+
+from .. import config
+from .. import metrics as _metrics
+from ..exceptions import NonReadableSocketError
+from ..exceptions import NonWritableSocketError
+from ..exceptions import TimeoutException
+from ..retry import backoff
+from . import CONNECTION_TYPES
+
+
+WRITE = 'write'
+READ = 'read'
+
+DIRECTIONS = (
+        (WRITE, 'Data written to the device'),
+        (READ, 'Data read from the device'),
+    )
+
+DEFAULT_COALESCE_SIZE = 4096
+
+RETRY_EXCEPTIONS = (
+        socket.error,
+        IOError,
+        OSError,
+        NonReadableSocketError,
+        NonWritableSocketError,
+        TimeoutException,
+    )
+"""Exceptions :class:`Retry` retries by default. Any other exception (such as
+a ``TypeError`` from a bad argument) is raised at once, since trying again
+would not change the outcome.
+"""
+
+logger = logging.getLogger('escpos.conn.middleware')
+
+
+class Middleware(object):
+    """Base stage, which just passes everything through to the wrapped
+    connection. Stages override the methods they are interested in.
+    """
+
+    def __init__(self, connection):
+        super(Middleware, self).__init__()
+        self.connection = connection
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.connection)
+
+    def __str__(self):
+        return str(self.connection)
+
+    def __getattr__(self, name):
+        # only called for attributes not found in the stage itself
+        if name == 'connection':
+            raise AttributeError(name)
+        return getattr(self.connection, name)
+
+    def catch(self):
+        return self.connection.catch()
+
+    def write(self, data):
+        return self.connection.write(data)
+
+    def read(self):
+        return self.connection.read()
+
+    def release(self):
+        for name in ('release', 'close'):
+            method = getattr(self.connection, name, None)
+            if method is not None:
+                return method()
+
+
+class Coalesce(Middleware):
+    """Holds written data in memory and writes it to the connection in
+    larger chunks, once it reaches ``size`` bytes. Pending data is written
+    before any read (so answers to requests are never waited for in vain),
+    on :meth:`flush` and on release, so end jobs with one of those, as
+    :meth:`~escpos.impl.epson.GenericESCPOS.end_job` and
+    :meth:`~escpos.impl.epson.GenericESCPOS.status` do.
+
+    :param int size: Optional. Number of pending bytes that triggers a write.
+
+    """
+
+    def __init__(self, connection, size=DEFAULT_COALESCE_SIZE):
+        super(Coalesce, self).__init__(connection)
+        self.size = size
+        self._pending = bytearray()
+        self._lock = threading.Lock()
+        if hasattr(connection, 'poll'):
+            # only if the wrapped connection has it, since its absence
+            # tells printers to read instead
+            self.poll = self._poll
+
+    @property
+    def pending(self):
+        """Number of bytes not written yet."""
+        return len(self._pending)
+
+    def write(self, data):
+        with self._lock:
+            self._pending.extend(data)
+            if len(self._pending) < self.size:
+                return
+            data = bytes(self._pending)
+            del self._pending[:]
+        self.connection.write(data)
+
+    def flush(self):
+        """Write any pending data."""
+        with self._lock:
+            if not self._pending:
+                return
+            data = bytes(self._pending)
+            del self._pending[:]
+        self.connection.write(data)
+
+    def read(self):
+        self.flush()
+        return self.connection.read()
+
+    def release(self):
+        self.flush()
+        return super(Coalesce, self).release()
+
+    def _poll(self, timeout):
+        self.flush()
+        return self.connection.poll(timeout)
+
+
+class RateLimit(Middleware):
+    """Limits the rate data is written to ``rate`` bytes per second, with
+    bursts of up to ``burst`` bytes (a token bucket), so slow printers are
+    not flooded and shared links are not saturated. Writes block for as
+    long as needed.
+
+    :param int rate: Bytes per second.
+
+    :param int burst: Optional. Defaults to a second worth of data.
+
+    """
+
+    def __init__(self, connection, rate, burst=None):
+        super(RateLimit, self).__init__(connection)
+        if rate <= 0:
+            raise ValueError('Rate must be greater than 0; got {!r}'.format(
+                    rate))
+        self.rate = float(rate)
+        self.burst = burst or rate
+        self._tokens = float(self.burst)
+        self._last = time.time()
+        self._lock = threading.Lock()
+
+    def write(self, data):
+        with self._lock:
+            now = time.time()
+            self._tokens = min(
+                    self.burst,
+                    self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= len(data)
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0
+        if delay:
+            time.sleep(delay)
+        return self.connection.write(data)
+
+
+class Tee(Middleware):
+    """Calls ``recorder(direction, data)`` with everything written to
+    (:const:`WRITE`) and read from (:const:`READ`) the connection.
+
+    .. sourcecode:: python
+
+        recorded = []
+        conn = Tee(conn, lambda direction, data: recorded.append(data))
+
+    """
+
+    def __init__(self, connection, recorder):
+        super(Tee, self).__init__(connection)
+        self.recorder = recorder
+        if hasattr(connection, 'poll'):
+            self.poll = self._poll
+
+    def write(self, data):
+        result = self.connection.write(data)
+        self.recorder(WRITE, data)
+        return result
+
+    def read(self):
+        data = self.connection.read()
+        if data:
+            self.recorder(READ, data)
+        return data
+
+    def _poll(self, timeout):
+        data = self.connection.poll(timeout)
+        if data:
+            self.recorder(READ, data)
+        return data
+
+
+class Metrics(Middleware):
+    """Records writes and reads in :mod:`escpos.metrics`, as seen at this
+    point of the stack (so the time spent in the stages it wraps is part of
+    the write latency), under the given type and label.
+
+    :param str type_name: Optional. Defaults to ``'stack'``.
+
+    :param str label: Optional. Defaults to the connection string.
+
+    """
+
+    def __init__(self, connection, type_name='stack', label=None):
+        super(Metrics, self).__init__(connection)
+        self.metrics = _metrics.connection_metrics(
+                type_name,
+                str(connection) if label is None else label)
+
+    def write(self, data):
+        started = time.time()
+        try:
+            result = self.connection.write(data)
+        except Exception:
+            self.metrics.record_error()
+            raise
+        self.metrics.record_write(len(data), time.time() - started)
+        return result
+
+    def read(self):
+        data = self.connection.read()
+        self.metrics.record_read(len(data) if data else 0)
+        return data
+
+
+class Retry(Middleware):
+    """Retries failed catches and writes with exponential backoff (see
+    :func:`~escpos.retry.backoff`), releasing and catching the connection
+    again between write attempts. Parameters not given are taken from
+    :mod:`escpos.config` at the time of each call.
+
+    :param exception_handler: Optional. Callable that tells whether to retry
+        upon a given exception. Defaults to retry only connection errors
+        (see :const:`RETRY_EXCEPTIONS`).
+
+    """
+
+    def __init__(
+            self,
+            connection,
+            max_tries=None,
+            delay=None,
+            factor=None,
+            exception_handler=None):
+        super(Retry, self).__init__(connection)
+        self.max_tries = max_tries
+        self.delay = delay
+        self.factor = factor
+        self.exception_handler = (
+                exception_handler or _connection_exception_handler)
+
+    def catch(self):
+        return self._call(self.connection.catch)
+
+    def write(self, data):
+        return self._call(
+                self.connection.write,
+                data,
+                before_delay_handler=self._before_delay_handler_for_write,
+                after_delay_handler=self._after_delay_handler_for_write)
+
+    def _call(self, func, *args, **kwargs):
+        # backoff() gives up silently once out of tries, so the outcome is
+        # wrapped to tell it apart and the last error is raised instead
+        errors = []
+
+        def exception_handler(ex):
+            errors.append(ex)
+            return self.exception_handler(ex)
+
+        @backoff(
+                max_tries=self.max_tries or config.BACKOFF_MAXTRIES,
+                delay=self.delay or config.BACKOFF_DELAY,
+                factor=self.factor or config.BACKOFF_FACTOR,
+                exception_handler=exception_handler,
+                **kwargs)
+        def attempt():
+            return (func(*args),)
+
+        outcome = attempt()
+        if outcome is None:
+            raise errors[-1]
+        return outcome[0]
+
+    def _before_delay_handler_for_write(self, ex):
+        try:
+            super(Retry, self).release()
+        except Exception:
+            logger.debug('cannot release %s before retrying', self)
+
+    def _after_delay_handler_for_write(self, ex):
+        try:
+            self.connection.catch()
+        except Exception:
+            # the next attempt will fail and be retried, if tries are left
+            logger.debug('cannot catch %s before retrying', self)
+
+
+def _connection_exception_handler(ex):
+    # Retry for connection errors only
+    return isinstance(ex, RETRY_EXCEPTIONS)
+
+
+def stack(connection, stages):
+    """Wrap the connection in the given stages, listed from the outermost
+    to the innermost. Each stage is a stage class (or any callable taking
+    the connection as its only argument) or a tuple of a stage class and a
+    dictionary of keyword arguments.
+    """
+    for stage in reversed(list(stages)):
+        if isinstance(stage, tuple):
+            stage_class, kwargs = stage
+            stage = functools.partial(stage_class, **kwargs)
+        connection = stage(connection)
+    return connection
+
+
+def create(type_name, settings, stages=()):
+    """Create a connection of the given type (one of the names in
+    :const:`~escpos.conn.CONNECTION_TYPES`, such as ``'network'``) from a
+    settings string, wrapped in the given stages (see :func:`stack`).
+    """
+    types = dict(CONNECTION_TYPES)
+    if type_name not in types:
+        raise ValueError('Unknown connection type: {!r}'.format(type_name))
+    connection = types[type_name].type.create(settings)
+    return stack(connection, stages)
+
+
+def unwrap(connection):
+    """The innermost connection of a stack."""
+    while isinstance(connection, Middleware):
+        connection = connection.connection
+    return connection
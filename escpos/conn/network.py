@@ -25,15 +25,18 @@ import logging
 import os
 import select
 import socket
+import time
 
 from future.utils import python_2_unicode_compatible
 from six.moves import range
 
 from .. import config
+from .. import metrics
+from .. import tracing
 from ..exceptions import NonReadableSocketError
 from ..exceptions import NonWritableSocketError
-from ..helpers import hexdump
 from ..retry import backoff
+from ..wirelog import WireLogger
 
 
 DEFAULT_READ_BUFSIZE = 4096
@@ -76,6 +79,7 @@ def _network_exception_handler_for_write(ex):
 
 
 logger = logging.getLogger('escpos.conn.network')
+wire = WireLogger(logger)
 
 
 @python_2_unicode_compatible
@@ -109,6 +113,7 @@ class NetworkConnection(object):
         self.socket_type = socket_type
         self.select_timeout = select_timeout
         self.read_buffer_size = read_buffer_size
+        self.metrics = metrics.connection_metrics('network', str(self))
 
     def __del__(self):
         self._raw_release()
@@ -147,6 +152,7 @@ class NetworkConnection(object):
     def _reconnect(self):
         self._raw_release()
         self._raw_catch()
+        self.metrics.record_reconnect()
 
     def _assert_writable(self):
         # check if we can write to socket; if not, make one attempt to
@@ -211,9 +217,9 @@ class NetworkConnection(object):
         self.socket.connect((self.host_name, self.port_number))
 
     def _raw_write(self, data):
-        self._assert_writable()
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug('sending to %s:\n%s', self, hexdump(data))
+        with tracing.span('network.select'):
+            self._assert_writable()
+        wire.debug('sending to %s:\n%s', self, data)
         totalsent = 0
         while totalsent < len(data):
             sent = self.socket.send(data[totalsent:])
@@ -223,25 +229,66 @@ class NetworkConnection(object):
 
     def _raw_read(self):
         try:
-            self._assert_readable()
+            with tracing.span('network.select'):
+                self._assert_readable()
             return self.socket.recv(self.read_buffer_size)
         except:  # noqa: E722
             return None
 
+    def poll(self, timeout):
+        """Wait up to ``timeout`` seconds for incoming data, returning it or
+        ``None`` if nothing has arrived. Unlike :meth:`read`, it never
+        reconnects nor retries, so it is meant for background readers, such
+        as :class:`~escpos.asb.AutomaticStatusBack`.
+
+        :raises NonReadableSocketError: If the printer has closed the
+            connection, which is then released, so the next write will
+            reconnect.
+
+        """
+        sock = self.socket
+        if sock is None:
+            return None
+        try:
+            readable, writable, in_error = select.select(
+                    [sock], [], [], timeout)
+            if not readable:
+                return None
+            data = sock.recv(self.read_buffer_size)
+        except (socket.error, ValueError):
+            # socket closed or being reconnected by another thread
+            return None
+        if not data:
+            # readable with no data means the peer closed the connection
+            if self.socket is sock:
+                self._raw_release()
+            raise NonReadableSocketError(
+                    'connection closed by peer (host={!r}, port={!r})'.format(
+                        self.host_name,
+                        self.port_number))
+        self.metrics.record_read(len(data))
+        return data
+
+    def _retrying(self, ex):
+        self.metrics.record_retry()
+
     def _before_delay_handler_for_write(self, ex):
+        self._retrying(ex)
         if _is_socket_error_exception(ex):
             self._raw_release()
 
     def _after_delay_handler_for_write(self, ex):
         if _is_socket_error_exception(ex):
             self._raw_catch()
+            self.metrics.record_reconnect()
 
     def release(self):
         @backoff(
                 max_tries=config.BACKOFF_MAXTRIES,
                 delay=config.BACKOFF_DELAY,
                 factor=config.BACKOFF_FACTOR,
-                exception_handler=_network_exception_handler)
+                exception_handler=_network_exception_handler,
+                before_delay_handler=self._retrying)
         def _release():
             return self._raw_release()
         return _release()
@@ -251,7 +298,8 @@ class NetworkConnection(object):
                 max_tries=config.BACKOFF_MAXTRIES,
                 delay=config.BACKOFF_DELAY,
                 factor=config.BACKOFF_FACTOR,
-                exception_handler=_network_exception_handler)
+                exception_handler=_network_exception_handler,
+                before_delay_handler=self._retrying)
         def _catch():
             return self._raw_catch()
         return _catch()
@@ -266,14 +314,24 @@ class NetworkConnection(object):
                 after_delay_handler=self._after_delay_handler_for_write)
         def _write():
             return self._raw_write(data)
-        return _write()
+        started = time.time()
+        try:
+            result = _write()
+        except Exception:
+            self.metrics.record_error()
+            raise
+        self.metrics.record_write(len(data), time.time() - started)
+        return result
 
     def read(self):
         @backoff(
                 max_tries=config.BACKOFF_MAXTRIES,
                 delay=config.BACKOFF_DELAY,
                 factor=config.BACKOFF_FACTOR,
-                exception_handler=_network_exception_handler)
+                exception_handler=_network_exception_handler,
+                before_delay_handler=self._retrying)
         def _read():
             return self._raw_read()
-        return _read()
+        data = _read()
+        self.metrics.record_read(len(data) if data else 0)
+        return data
@@ -23,6 +23,7 @@ from __future__ import unicode_literals
 import functools
 import logging
 import sys
+import time
 
 from future.utils import python_2_unicode_compatible
 from six import string_types
@@ -34,15 +35,19 @@ except ImportError:
     # PySerial library is optional
     _lib_pyserial = False
 
+from .. import metrics
+from .. import tracing
 from ..helpers import TimeoutHelper
 from ..helpers import chunks
-from ..helpers import hexdump
+from ..wirelog import WireLogger
 
 
 DEFAULT_READ_TIMEOUT = 1
 DEFAULT_WRITE_TIMEOUT = 1
 DEFAULT_PROTOCOL_TIMEOUT = 5
 
+WAIT_TO_WRITE_INTERVAL = 0.001
+
 RTSCTS = 'RTSCTS'
 DSRDTR = 'DSRDTR'
 XONXOFF = 'XONXOFF'
@@ -55,6 +60,7 @@ FLOW_CONTROL_PROTOCOLS = (
 
 
 logger = logging.getLogger('escpos.conn.serial')
+wire = WireLogger(logger)
 
 
 def depends_on_pyserial_lib(func):
@@ -435,6 +441,7 @@ class SerialConnection(object):
         self._read_timeout = read_timeout
         self._write_timeout = write_timeout
         self._protocol_timeout = protocol_timeout
+        self.metrics = metrics.connection_metrics('serial', str(settings))
 
     def __del__(self):
         if self.comport is not None:
@@ -461,10 +468,17 @@ class SerialConnection(object):
         raise NotImplementedError()
 
     def wait_to_write(self):
+        if self.is_clear_to_write():
+            return
+        started = time.time()
         timeout = TimeoutHelper(self.protocol_timeout)
-        while timeout.check():
-            if self.is_clear_to_write():
-                break
+        try:
+            with tracing.span('serial.wait_to_write'):
+                while not self.is_clear_to_write():
+                    timeout.check()  # raises TimeoutException once expired
+                    time.sleep(WAIT_TO_WRITE_INTERVAL)
+        finally:
+            self.metrics.record_stall(time.time() - started)
 
     def write(self, data):
         """Write data to serial port.
@@ -472,16 +486,17 @@ class SerialConnection(object):
         :param data: Bytes to write.
         :type data: bytes|bytearray
         """
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(
-                    'writing to serial port %s:\n%s',
-                    self._settings,
-                    hexdump(data)
-                )
-        for chunk in chunks(data, 512):
-            self.wait_to_write()
-            self.comport.write(chunk)
-        self.comport.flush()
+        wire.debug('writing to serial port %s:\n%s', self._settings, data)
+        started = time.time()
+        try:
+            for chunk in chunks(data, 512):
+                self.wait_to_write()
+                self.comport.write(chunk)
+            self.comport.flush()
+        except Exception:
+            self.metrics.record_error()
+            raise
+        self.metrics.record_write(len(data), time.time() - started)
 
     def read(self):
         """Read data from serial port and returns a ``bytearray``."""
@@ -493,8 +508,22 @@ class SerialConnection(object):
             else:
                 content = self.comport.read(size=incoming_bytes)
                 data.extend(bytearray(content))
+        self.metrics.record_read(len(data))
         return data
 
+    def poll(self, timeout):
+        """Wait up to ``timeout`` seconds for incoming data, returning
+        whatever has arrived (possibly nothing) as a ``bytearray``. Meant for
+        background readers, such as :class:`~escpos.asb.AutomaticStatusBack`.
+        """
+        deadline = time.time() + timeout
+        while self.comport.inWaiting() == 0:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return bytearray()
+            time.sleep(min(0.01, remaining))
+        return self.read()
+
     @depends_on_pyserial_lib
     def catch(self):
         if self.comport is not None:
@@ -23,10 +23,12 @@ from __future__ import unicode_literals
 import functools
 import logging
 import re
+import time
 
 from future.utils import python_2_unicode_compatible
 
-from ..helpers import hexdump
+from .. import metrics
+from ..wirelog import WireLogger
 
 try:
     import usb.core
@@ -41,6 +43,7 @@ PRINTER_CLASS = 0x07
 
 
 logger = logging.getLogger('escpos.conn.usb')
+wire = WireLogger(logger)
 
 
 def depends_on_pyusb_lib(func):
@@ -160,6 +163,7 @@ class USBConnection(object):
         self.ep_in = ep_in
         self.ep_out = ep_out
         self.timeout = timeout
+        self.metrics = metrics.connection_metrics('usb', str(self))
 
     def __repr__(self):
         content = (
@@ -231,9 +235,14 @@ class USBConnection(object):
             self._raise_with_details(msg, exctype=usb.core.USBError)
 
     def write(self, data):
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug('writing to USB port %s:\n%s', self, hexdump(data))
-        self.usbport.write(self.ep_out, data, timeout=self.timeout)
+        wire.debug('writing to USB port %s:\n%s', self, data)
+        started = time.time()
+        try:
+            self.usbport.write(self.ep_out, data, timeout=self.timeout)
+        except Exception:
+            self.metrics.record_error()
+            raise
+        self.metrics.record_write(len(data), time.time() - started)
 
     def read(self):
         return ''
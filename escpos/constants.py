@@ -39,3 +39,17 @@ BACKOFF_DEFAULT_FACTOR = 2
 """Multiply factor in which delay will be increased for the next retry.
 See :func:`escpos.retry.backoff`.
 """
+
+RASTER_CACHE_DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+"""Memory budget (in bytes) for the shared raster cache.
+See :class:`escpos.raster.RasterCache`.
+"""
+
+WIRELOG_DEFAULT_MAX_BYTES = None
+"""Maximum number of bytes of each write dumped to debug logs, or ``None``
+(or zero) for no limit. See :mod:`escpos.wirelog`.
+"""
+
+WIRELOG_DEFAULT_SAMPLE = 1
+"""Dump one in this many writes to debug logs. See :mod:`escpos.wirelog`.
+"""
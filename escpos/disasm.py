@@ -0,0 +1,511 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/disasm.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""ESC/POS disassembler. Splits a byte stream into text, control codes and
+commands (through the streaming tokenizer of :mod:`escpos.emulator`), each
+annotated with its mnemonic, category and decoded parameters, in a single
+linear pass, and counts bytes per category and per command, to find out
+where bandwidth goes.
+
+.. sourcecode:: python
+
+    from escpos import disasm
+
+    data = TMT20.compile(['init', ('text', ('Hello',)), 'cut'])
+    print(disasm.listing(data))
+
+    stats = disasm.Statistics()
+    for instruction in disasm.disassemble_file('receipts.bin'):
+        stats.add(instruction)
+    print(stats.report())
+
+It also works from the command line, with raw files and with captures (see
+:mod:`escpos.capture`)::
+
+    python -m escpos.disasm receipts.bin
+    python -m escpos.disasm --stats --no-listing store.cap
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import binascii
+import io
+import sys
+
+from collections import namedtuple
+
+import six
+
+from . import capture
+from . import impl as _impl  # noqa: F401 (for find_implementations)
+from .conn import middleware
+from .emulator import tokenizer as _tokenizer
+from .helpers import find_implementations
+
+
+DEFAULT_CHUNK_SIZE = 65536
+
+MAX_LISTED_BYTES = 8
+"""Bytes shown in the hex column of listings; the rest are elided."""
+
+TEXT = 'text'
+CONTROL = 'control'
+SETUP = 'setup'
+CHARACTER = 'character'
+LAYOUT = 'layout'
+BARCODE = 'barcode'
+SYMBOL = 'symbol'
+IMAGE = 'image'
+STATUS = 'status'
+CUT = 'cut'
+DRAWER = 'drawer'
+UNKNOWN = 'unknown'
+
+CATEGORIES = (
+        (TEXT, 'Text'),
+        (CONTROL, 'Control codes'),
+        (SETUP, 'Printer setup'),
+        (CHARACTER, 'Character style and code pages'),
+        (LAYOUT, 'Justification, spacing and feeding'),
+        (BARCODE, 'Barcodes'),
+        (SYMBOL, '2D symbols (QRCode, PDF417)'),
+        (IMAGE, 'Images and NV graphics'),
+        (STATUS, 'Status and transmission'),
+        (CUT, 'Paper cut'),
+        (DRAWER, 'Cash drawer'),
+        (UNKNOWN, 'Unknown commands'),
+    )
+
+COMMANDS = {
+        'ESC @': (SETUP, 'Initialize printer'),
+        'ESC !': (CHARACTER, 'Select print mode'),
+        'ESC *': (IMAGE, 'Select bit image mode'),
+        'ESC -': (CHARACTER, 'Underline mode'),
+        'ESC 2': (LAYOUT, 'Default line spacing'),
+        'ESC 3': (LAYOUT, 'Set line spacing'),
+        'ESC E': (CHARACTER, 'Emphasized mode'),
+        'ESC G': (CHARACTER, 'Double-strike mode'),
+        'ESC J': (LAYOUT, 'Print and feed paper'),
+        'ESC M': (CHARACTER, 'Select character font'),
+        'ESC R': (CHARACTER, 'Select international character set'),
+        'ESC V': (CHARACTER, '90 degrees clockwise rotation'),
+        'ESC W': (LAYOUT, 'Set print area in page mode'),
+        'ESC 80': (DRAWER, 'Generate pulse (drawer #2)'),
+        'ESC 81': (SYMBOL, 'Print QRCode'),
+        'ESC F': (CHARACTER, 'Emphasized mode off'),
+        'ESC H': (CHARACTER, 'Condensed mode off'),
+        'ESC SI': (CHARACTER, 'Condensed mode on'),
+        'ESC b': (BARCODE, 'Print barcode'),
+        'ESC j': (LAYOUT, 'Select justification'),
+        'ESC v': (DRAWER, 'Generate pulse (drawer #1)'),
+        'ESC a': (LAYOUT, 'Select justification'),
+        'ESC d': (LAYOUT, 'Print and feed lines'),
+        'ESC i': (CUT, 'Full cut'),
+        'ESC m': (CUT, 'Partial cut'),
+        'ESC p': (DRAWER, 'Generate pulse'),
+        'ESC t': (CHARACTER, 'Select code page'),
+        'ESC {': (CHARACTER, 'Upside-down mode'),
+        'GS !': (CHARACTER, 'Select character size'),
+        'GS ( A': (SETUP, 'Test print'),
+        'GS ( H': (STATUS, 'Request transmission response'),
+        'GS ( K': (SETUP, 'Print control'),
+        'GS ( L': (IMAGE, 'Graphics'),
+        'GS ( k': (SYMBOL, '2D symbol'),
+        'GS (': (SETUP, 'Extended command'),
+        'GS 8 L': (IMAGE, 'Graphics (large)'),
+        'GS B': (CHARACTER, 'White/black reverse mode'),
+        'GS H': (BARCODE, 'HRI position'),
+        'GS L': (LAYOUT, 'Set left margin'),
+        'GS V': (CUT, 'Select cut mode and cut'),
+        'GS W': (LAYOUT, 'Set print area width'),
+        'GS a': (STATUS, 'Automatic status back'),
+        'GS f': (BARCODE, 'HRI font'),
+        'GS h': (BARCODE, 'Barcode height'),
+        'GS k': (BARCODE, 'Print barcode'),
+        'GS k Q': (SYMBOL, 'Print QRCode'),
+        'GS r': (STATUS, 'Transmit status'),
+        'GS v 0': (IMAGE, 'Print raster bit image'),
+        'GS w': (BARCODE, 'Barcode width'),
+        'DLE EOT': (STATUS, 'Real-time status transmission'),
+        'DLE ENQ': (STATUS, 'Real-time request to printer'),
+        'DLE DC4': (DRAWER, 'Real-time pulse'),
+        'FS p': (IMAGE, 'Print NV bit image'),
+        'FS q': (IMAGE, 'Define NV bit image'),
+    }
+"""Category and description of the commands in
+:const:`~escpos.emulator.tokenizer.ESCPOS_COMMANDS` and of the vendor only
+commands in :const:`~escpos.emulator.tokenizer.VENDOR_COMMANDS`, by
+mnemonic.
+"""
+
+VENDOR_COMMANDS = {
+        'escpos.impl.bematech.MP4200TH': {
+            'ESC E': (CHARACTER, 'Emphasized mode on'),
+            'ESC W': (CHARACTER, 'Double width mode'),
+        },
+        'escpos.impl.daruma.DarumaGeneric': {
+            'ESC W': (CHARACTER, 'Double width mode'),
+            'ESC p': (DRAWER, 'Open cash drawer'),
+        },
+        'escpos.impl.unknown.CB55C': {
+            'ESC E': (CHARACTER, 'Emphasized mode on'),
+            'ESC W': (CHARACTER, 'Double width mode'),
+        },
+    }
+"""Changes to :const:`COMMANDS` for commands that mean something else in
+the dialects of :const:`~escpos.emulator.tokenizer.VENDOR_COMMANDS`, by
+the fully qualified name of the implementation class. See
+:func:`command_descriptions`.
+"""
+
+_KIND_CATEGORIES = {
+        _tokenizer.TEXT: TEXT,
+        _tokenizer.CONTROL: CONTROL,
+        _tokenizer.UNKNOWN: UNKNOWN,
+    }
+
+
+Instruction = namedtuple('Instruction', [
+        'offset',  # of the first byte, from the start of the stream
+        'kind',  # token kind, see escpos.emulator.tokenizer.TOKEN_KINDS
+        'name',  # mnemonic, such as 'GS k' (None for text)
+        'category',  # one of CATEGORIES
+        'raw',  # all the bytes of this instruction
+        'args',  # bytes following the command prefix
+    ])
+
+
+class Disassembler(object):
+    """Streaming disassembler. Feed it chunks of any size; instructions are
+    returned as soon as they are complete.
+
+    :param dict table: Optional. Command table for the tokenizer. See
+        :const:`~escpos.emulator.tokenizer.ESCPOS_COMMANDS`.
+
+    :param dict commands: Optional. Category and description of commands,
+        by mnemonic. Defaults to :const:`COMMANDS`.
+
+    """
+
+    def __init__(self, table=None, commands=None):
+        super(Disassembler, self).__init__()
+        self.tokenizer = _tokenizer.Tokenizer(table=table)
+        self.commands = COMMANDS if commands is None else commands
+        self.offset = 0
+        """Offset of the next instruction."""
+
+    def feed(self, data):
+        return self._annotate(self.tokenizer.feed(data))
+
+    def close(self):
+        return self._annotate(self.tokenizer.close())
+
+    def _annotate(self, tokens):
+        instructions = []
+        append = instructions.append
+        commands = self.commands
+        offset = self.offset
+        for token in tokens:
+            kind = token.kind
+            if kind == _tokenizer.COMMAND:
+                category = commands.get(token.name, (UNKNOWN, None))[0]
+            else:
+                category = _KIND_CATEGORIES[kind]
+            append(Instruction(
+                    offset,
+                    kind,
+                    token.name,
+                    category,
+                    token.raw,
+                    token.args))
+            offset += len(token.raw)
+        self.offset = offset
+        return instructions
+
+
+class Statistics(object):
+    """Counts instructions and bytes per category and per command."""
+
+    def __init__(self):
+        super(Statistics, self).__init__()
+        self.total_bytes = 0
+        self.instructions = 0
+        self.categories = {}
+        """Pairs of instruction count and byte count, by category."""
+
+        self.commands = {}
+        """Pairs of instruction count and byte count, by mnemonic (text
+        runs are counted as ``TEXT``).
+        """
+
+    def add(self, instruction):
+        size = len(instruction.raw)
+        self.total_bytes += size
+        self.instructions += 1
+        for counters, key in (
+                (self.categories, instruction.category),
+                (self.commands, instruction.name or 'TEXT')):
+            counts = counters.get(key)
+            if counts is None:
+                counters[key] = [1, size]
+            else:
+                counts[0] += 1
+                counts[1] += size
+
+    def report(self):
+        """Text report of bytes per category and per command, the largest
+        first.
+        """
+        names = dict(CATEGORIES)
+        lines = ['{} instructions, {} bytes'.format(
+                self.instructions, self.total_bytes)]
+        for title, counters, label in (
+                ('By category', self.categories, names.get),
+                ('By command', self.commands, lambda key: key)):
+            lines.append('')
+            lines.append(title)
+            ordered = sorted(
+                    counters.items(),
+                    key=lambda item: (-item[1][1], item[0]))
+            for key, (count, size) in ordered:
+                lines.append('  {:<36} {:>10} {:>12} {:>6.1%}'.format(
+                        label(key) or key,
+                        count,
+                        size,
+                        size / float(self.total_bytes or 1)))
+        return '\n'.join(lines)
+
+
+def command_descriptions(impl):
+    """The category and description of the commands the given implementation
+    (a class or an instance) emits: :const:`COMMANDS` updated by the nearest
+    entry in :const:`VENDOR_COMMANDS`. To be given along with the command
+    table of the implementation:
+
+    .. sourcecode:: python
+
+        from escpos.emulator.tokenizer import command_table
+        from escpos.impl.daruma import DR700
+
+        print(disasm.listing(
+                data,
+                table=command_table(DR700),
+                commands=disasm.command_descriptions(DR700)))
+
+    """
+    changes = _tokenizer.vendor_entry(impl, VENDOR_COMMANDS)
+    if changes is None:
+        return COMMANDS
+    commands = dict(COMMANDS)
+    commands.update(changes)
+    return commands
+
+
+def disassemble(data, table=None):
+    """Disassemble all the given data at once, returning a list of
+    :class:`Instruction`.
+    """
+    disassembler = Disassembler(table=table)
+    return disassembler.feed(data) + disassembler.close()
+
+
+def disassemble_file(source, chunk_size=DEFAULT_CHUNK_SIZE, table=None):
+    """Disassemble the contents of ``source`` (a file name or a binary file
+    object), yielding :class:`Instruction` instances, in constant memory.
+    """
+    if isinstance(source, six.string_types):
+        with io.open(source, 'rb') as fileobj:
+            for instruction in disassemble_file(fileobj, chunk_size, table):
+                yield instruction
+        return
+    disassembler = Disassembler(table=table)
+    while True:
+        data = source.read(chunk_size)
+        if not data:
+            break
+        for instruction in disassembler.feed(data):
+            yield instruction
+    for instruction in disassembler.close():
+        yield instruction
+
+
+def describe(instruction, commands=None):
+    """Human readable description of an instruction and its parameters."""
+    if instruction.kind == _tokenizer.TEXT:
+        return repr(instruction.raw.decode('latin-1'))
+    if instruction.kind != _tokenizer.COMMAND:
+        return ''
+    commands = COMMANDS if commands is None else commands
+    description = commands.get(instruction.name, (None, ''))[1]
+    formatter = _FORMATTERS.get(instruction.name, _format_args)
+    params = formatter(bytearray(instruction.args))
+    return '{} ({})'.format(description, params) if params else description
+
+
+def format_instruction(instruction, commands=None):
+    """One listing line: offset, bytes (elided beyond
+    :const:`MAX_LISTED_BYTES`), mnemonic and description.
+    """
+    raw = instruction.raw
+    hex_bytes = _hex(raw[:MAX_LISTED_BYTES])
+    if len(raw) > MAX_LISTED_BYTES:
+        hex_bytes += ' ..'
+    return '{:08x}  {:<26} {:<8} {}'.format(
+            instruction.offset,
+            hex_bytes,
+            instruction.name or 'TEXT',
+            describe(instruction, commands=commands)).rstrip()
+
+
+def listing(data, table=None, commands=None):
+    """Disassembly listing of the given data, one instruction per line."""
+    return '\n'.join(
+            format_instruction(instruction, commands=commands)
+            for instruction in disassemble(data, table=table)
+        )
+
+
+def _hex(data):
+    digits = binascii.hexlify(data).decode('ascii')
+    return ' '.join(digits[i:i + 2] for i in range(0, len(digits), 2))
+
+
+def _format_args(args):
+    if not args:
+        return ''
+    if len(args) <= 4:
+        return ' '.join('{}'.format(b) for b in args)
+    return '{} bytes'.format(len(args))
+
+
+def _format_gs_k(args):
+    # m d1...dk NUL (function A) or m n d1...dn (function B)
+    if len(args) < 2:
+        return _format_args(args)
+    m = args[0]
+    data = args[1:-1] if m <= 6 else args[2:]
+    return 'm={}, {!r}'.format(m, bytes(data).decode('latin-1'))
+
+
+def _format_gs_paren_k(args):
+    # pL pH cn fn ...; symbol type and function tell commands apart
+    if len(args) < 4:
+        return _format_args(args)
+    return 'cn={}, fn={}, {} bytes'.format(
+            args[2], args[3], args[0] + args[1] * 256)
+
+
+def _format_gs_paren_l(args):
+    # pL pH m fn ...
+    if len(args) < 4:
+        return _format_args(args)
+    return 'fn={}, {} bytes'.format(args[3], args[0] + args[1] * 256)
+
+
+def _format_gs_v_0(args):
+    # m xL xH yL yH
+    if len(args) < 5:
+        return _format_args(args)
+    return '{}x{} dots'.format(
+            (args[1] + args[2] * 256) * 8,
+            args[3] + args[4] * 256)
+
+
+_FORMATTERS = {
+        'GS k': _format_gs_k,
+        'GS ( k': _format_gs_paren_k,
+        'GS ( L': _format_gs_paren_l,
+        'GS v 0': _format_gs_v_0,
+    }
+
+
+def main(argv=None, out=None):
+    out = out or sys.stdout
+    parser = argparse.ArgumentParser(
+            prog='python -m escpos.disasm',
+            description='Disassemble ESC/POS byte streams or captures.')
+    parser.add_argument('source', help='raw ESC/POS file or capture')
+    parser.add_argument(
+            '--stream',
+            type=int,
+            default=None,
+            help='capture stream to disassemble (default: all)')
+    parser.add_argument(
+            '--stats',
+            action='store_true',
+            help='report bytes per category and per command')
+    parser.add_argument(
+            '--no-listing',
+            action='store_true',
+            help='do not list instructions')
+    parser.add_argument(
+            '--impl',
+            default=None,
+            help='fully qualified name of the implementation that wrote the '
+                 'data, for vendor dialects (default: standard ESC/POS)')
+    args = parser.parse_args(argv)
+
+    table = commands = None
+    if args.impl:
+        impls = dict((i.fqname, i.type) for i in find_implementations())
+        if args.impl not in impls:
+            parser.error('unknown implementation: {}'.format(args.impl))
+        table = _tokenizer.command_table(impls[args.impl])
+        commands = command_descriptions(impls[args.impl])
+
+    stats = Statistics()
+    for instruction in _instructions(args.source, args.stream, table):
+        if args.stats:
+            stats.add(instruction)
+        if not args.no_listing:
+            out.write(format_instruction(instruction, commands=commands))
+            out.write('\n')
+    if args.stats:
+        out.write(stats.report())
+        out.write('\n')
+    return 0
+
+
+def _instructions(path, stream=None, table=None):
+    with io.open(path, 'rb') as fileobj:
+        is_capture = fileobj.read(len(capture.MAGIC)) == capture.MAGIC
+    if not is_capture:
+        for instruction in disassemble_file(path, table=table):
+            yield instruction
+        return
+    # data written to each stream is disassembled on its own
+    with capture.CaptureReader(path) as reader:
+        disassemblers = {}
+        records = reader.records(stream=stream, direction=middleware.WRITE)
+        for record in records:
+            disassembler = disassemblers.get(record.stream)
+            if disassembler is None:
+                disassembler = Disassembler(table=table)
+                disassemblers[record.stream] = disassembler
+            for instruction in disassembler.feed(record.data):
+                yield instruction
+        for stream_id, disassembler in sorted(disassemblers.items()):
+            for instruction in disassembler.close():
+                yield instruction
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
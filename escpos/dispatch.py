@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/dispatch.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Broadcast a single job to many printers at once.
+
+.. sourcecode:: python
+
+    from escpos import NetworkConnection
+    from escpos.dispatch import Target
+    from escpos.dispatch import broadcast
+    from escpos.impl.epson import TMT20
+
+    targets = [
+            Target(name, NetworkConnection.create(address), TMT20)
+            for name, address in KITCHEN_PRINTERS
+        ]
+
+    report = broadcast(targets, [
+            'init',
+            ('text', ('Daily Menu',)),
+            'cut',
+        ], timeout=20)
+
+    for result in report.failures:
+        print(result.name, result.status, result.error)
+
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import logging
+import time
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+
+from .exceptions import TimeoutException
+from .spool import release
+
+
+DEFAULT_TIMEOUT = 30
+"""Default time (in seconds) for a single target to complete."""
+
+DEFAULT_MAX_WORKERS = 64
+
+logger = logging.getLogger('escpos.dispatch')
+
+STATUS_OK = 'ok'
+STATUS_FAILED = 'failed'
+STATUS_TIMEOUT = 'timeout'
+
+DISPATCH_STATUSES = (
+        (STATUS_OK, 'Sent'),
+        (STATUS_FAILED, 'Failed'),
+        (STATUS_TIMEOUT, 'Timed out'),
+    )
+"""Possible status for a single target in a dispatch report."""
+
+
+Target = namedtuple('Target', [
+        'name',
+        'connection',
+        'impl',  # implementation class, used to compile jobs
+    ])
+
+
+TargetResult = namedtuple('TargetResult', [
+        'name',
+        'status',  # one of DISPATCH_STATUSES
+        'elapsed',  # seconds, or None if timed out
+        'error',  # exception instance or None
+    ])
+
+
+class DispatchReport(object):
+    """Consolidated result of a :func:`broadcast`, holding a
+    :class:`TargetResult` for each target, in the order targets were given.
+    """
+
+    def __init__(self, results, elapsed):
+        super(DispatchReport, self).__init__()
+        self.results = results
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        return '<{} ok={} failed={} timeout={} elapsed={:.3f}>'.format(
+                self.__class__.__name__,
+                len(self.succeeded),
+                len(self._with_status(STATUS_FAILED)),
+                len(self._with_status(STATUS_TIMEOUT)),
+                self.elapsed
+            )
+
+    @property
+    def ok(self):
+        """Whether the job has been sent to all targets."""
+        return not self.failures
+
+    @property
+    def succeeded(self):
+        return self._with_status(STATUS_OK)
+
+    @property
+    def failures(self):
+        """Results of targets that failed or timed out."""
+        return [r for r in self.results if r.status != STATUS_OK]
+
+    def _with_status(self, status):
+        return [r for r in self.results if r.status == status]
+
+
+def broadcast(
+        targets,
+        job,
+        timeout=DEFAULT_TIMEOUT,
+        max_workers=DEFAULT_MAX_WORKERS):
+    """Send the same job to all targets in parallel. The job is compiled
+    just once per implementation class, so each target costs only a write.
+    A target that cannot complete within ``timeout`` seconds (for example,
+    a printer still retrying to connect) is reported as timed out and does
+    not hold up the others.
+
+    A timed out target never starts writing the job after the deadline, so
+    it is safe to retry it, except that a write already under way when time
+    runs out is not interrupted and may still be completed (and printed).
+
+    :param targets: An iterable of :class:`Target`.
+
+    :param job: Compiled bytes, a list of operations or a callable, just as
+        the argument to :meth:`~escpos.impl.epson.GenericESCPOS.compile`.
+
+    :param float timeout: Optional. Maximum time (in seconds) for each
+        target to complete, counted from the beginning of the dispatch.
+
+    :param int max_workers: Optional. Maximum number of targets being sent to
+        at the same time. If there are more targets than workers, the last
+        ones will have less time to complete.
+
+    :rtype: DispatchReport
+
+    """
+    targets = list(targets)
+    start = time.time()
+    deadline = start + timeout
+    compiled = {}
+    futures = []
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(
+            max_workers,
+            len(targets))))
+    try:
+        for target in targets:
+            data = _compile(job, target.impl, compiled)
+            futures.append(executor.submit(_send, target, data, deadline))
+        wait(futures, timeout=timeout)
+    finally:
+        # do not wait for targets that timed out
+        executor.shutdown(wait=False)
+
+    results = []
+    for target, future in zip(targets, futures):
+        if not future.done():
+            future.cancel()  # only if not running; see _send
+            logger.warning('dispatch to %r timed out', target.name)
+            results.append(TargetResult(
+                    target.name, STATUS_TIMEOUT, None, None))
+        elif future.exception() is not None:
+            ex = future.exception()
+            logger.warning('dispatch to %r failed: %r', target.name, ex)
+            results.append(TargetResult(
+                    target.name, STATUS_FAILED, None, ex))
+        else:
+            results.append(TargetResult(
+                    target.name, STATUS_OK, future.result(), None))
+
+    return DispatchReport(results, time.time() - start)
+
+
+def _compile(job, impl, compiled):
+    if isinstance(job, (bytes, bytearray)):
+        return bytes(job)
+    if impl not in compiled:
+        compiled[impl] = impl.compile(job)
+    return compiled[impl]
+
+
+def _send(target, data, deadline):
+    start = time.time()
+    try:
+        target.connection.catch()
+        if time.time() >= deadline:
+            # already reported as timed out, so printing now could end up
+            # duplicating the job if the caller retries this target
+            raise TimeoutException('dispatch deadline exceeded')
+        target.connection.write(data)
+    finally:
+        release(target.connection)
+    return time.time() - start
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/emulator/__init__.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from .interpreter import Emulator  # noqa: F401
+from .tokenizer import Tokenizer  # noqa: F401
+from .tokenizer import command_table  # noqa: F401
+from .tokenizer import tokenize  # noqa: F401
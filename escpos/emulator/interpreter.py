@@ -0,0 +1,373 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/emulator/interpreter.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Interprets ESC/POS command streams into the page model in
+:mod:`escpos.emulator.page`, as a printer would.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import codecs
+import io
+import logging
+
+import six
+
+from .. import constants
+from . import page as _page
+from . import tokenizer as _tokenizer
+
+
+DEFAULT_CHUNK_SIZE = 65536
+
+READY_STATUS = b'\x12\x12\x12\x12'
+"""Answers to ``DLE EOT`` 1 to 4 of an online printer, with no errors and
+with paper.
+"""
+
+logger = logging.getLogger('escpos.emulator')
+
+
+_FULL_CUTS = frozenset([0x00, 0x30, 0x41, 0x61, 0x67])
+
+_JUSTIFICATIONS = {
+        0: _page.JUSTIFY_LEFT,
+        1: _page.JUSTIFY_CENTER,
+        2: _page.JUSTIFY_RIGHT,
+    }
+
+
+class Emulator(object):
+    """A virtual ESC/POS printer. Bytes fed to it are interpreted into pages
+    (see :mod:`escpos.emulator.page`), each page ending with a paper cut.
+    Only the page being printed is kept in memory, so input of any size can
+    be checked with constant memory.
+
+    .. sourcecode:: python
+
+        emulator = Emulator()
+        printer = GenericESCPOS(emulator)
+        printer.init()
+        printer.text('Hello World!')
+        printer.cut()
+        page, = emulator.close()
+
+    Since it has the connection interface (``catch``, ``write``, ``read``
+    and ``release``), the emulator can take the place of a connection, as
+    above, and answers real-time status requests (``DLE EOT``) and
+    transmission response requests (``GS ( H``) as a ready printer would.
+    To check output saved through :class:`~escpos.conn.dummy.DummyConnection`
+    or :class:`~escpos.conn.file.FileConnection`, feed it or use
+    :meth:`read_pages`.
+
+    :param str encoding: Optional. Encoding used to decode text.
+
+    :param dict table: Optional. Command table for the tokenizer. See
+        :const:`~escpos.emulator.tokenizer.ESCPOS_COMMANDS`. For output of
+        implementations with their own dialect, use
+        :func:`~escpos.emulator.tokenizer.command_table`.
+
+    :param on_page: Optional. Callable called with every complete page.
+
+    :param bytes status: Optional. Answers to ``DLE EOT`` 1 to 4, in order.
+        Defaults to :const:`READY_STATUS`. May be changed at any time through
+        the :attr:`status` attribute, to emulate printer errors.
+
+    """
+
+    def __init__(
+            self,
+            encoding=constants.DEFAULT_ENCODING,
+            table=None,
+            on_page=None,
+            status=READY_STATUS):
+        super(Emulator, self).__init__()
+        self.encoding = encoding
+        self.on_page = on_page
+        self.status = status
+        self.tokenizer = _tokenizer.Tokenizer(table=table)
+        self.bytes_received = 0
+        self.commands = 0
+        self.unknown_commands = 0
+        self.pages = 0
+        self.drawer_kicks = 0
+        self._decoder = codecs.getincrementaldecoder(encoding)('replace')
+        self._responses = bytearray()
+        self._qrcode_data = b''
+        self._handlers = {
+                'LF': self._lf,
+                'ESC @': self._esc_at,
+                'ESC !': self._esc_bang,
+                'ESC -': self._esc_dash,
+                'ESC E': self._esc_e,
+                'ESC F': self._esc_f,
+                'ESC G': self._esc_g,
+                'ESC M': self._esc_m_font,
+                'ESC a': self._esc_a,
+                'ESC d': self._esc_d,
+                'ESC j': self._esc_a,
+                'ESC i': self._esc_i,
+                'ESC m': self._esc_m,
+                'ESC p': self._esc_p,
+                'GS !': self._gs_bang,
+                'GS V': self._gs_v,
+                'GS k': self._gs_k,
+                'GS ( k': self._gs_paren_k,
+                'GS ( L': self._gs_paren_l,
+                'GS ( H': self._gs_paren_h,
+                'GS v 0': self._gs_v_0,
+                'DLE EOT': self._dle_eot,
+            }
+        self._reset()
+        self._lines = []
+        self._line = []
+        self._line_justification = None
+
+    def __repr__(self):
+        return '{}(encoding={!r})'.format(
+                self.__class__.__name__,
+                self.encoding
+            )
+
+    def __str__(self):
+        return 'emulator'
+
+    @property
+    def style(self):
+        """Current :class:`~escpos.emulator.page.Style`."""
+        return self._style
+
+    @property
+    def justification(self):
+        return self._justification
+
+    def catch(self):
+        pass
+
+    def write(self, data):
+        self.feed(data)
+
+    def read(self):
+        """Answers to the requests received since the last read, if any."""
+        if not self._responses:
+            return None
+        data = bytes(self._responses)
+        del self._responses[:]
+        return data
+
+    def release(self):
+        pass
+
+    def feed(self, data):
+        """Interpret the given data, returning a list of the pages completed
+        (cut) by it.
+        """
+        self.bytes_received += len(data)
+        return self._interpret(self.tokenizer.feed(data))
+
+    def close(self):
+        """Flush the emulator, returning a list of the pages completed by any
+        data left, including a last page not cut yet.
+        """
+        pages = self._interpret(self.tokenizer.close())
+        self._text(b'', final=True)
+        if self._line or self._lines:
+            pages.append(self._finish_page(_page.CUT_NONE))
+        return pages
+
+    def read_pages(self, source, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Interpret all the data in ``source`` (a file name or a binary
+        file object), yielding pages as they are completed.
+        """
+        if isinstance(source, six.string_types):
+            with io.open(source, 'rb') as fileobj:
+                for page in self.read_pages(fileobj, chunk_size=chunk_size):
+                    yield page
+            return
+        while True:
+            data = source.read(chunk_size)
+            if not data:
+                break
+            for page in self.feed(data):
+                yield page
+        for page in self.close():
+            yield page
+
+    def _interpret(self, tokens):
+        pages = []
+        handlers = self._handlers
+        for token in tokens:
+            kind = token.kind
+            if kind == _tokenizer.TEXT:
+                self._text(token.raw)
+                continue
+            if kind == _tokenizer.UNKNOWN:
+                self.unknown_commands += 1
+                logger.debug('unknown command: %s', token.name)
+                continue
+            if kind == _tokenizer.COMMAND:
+                self.commands += 1
+            handler = handlers.get(token.name)
+            if handler is not None:
+                page = handler(token.args)
+                if page is not None:
+                    pages.append(page)
+        return pages
+
+    def _reset(self):
+        self._style = _page.DEFAULT_STYLE
+        self._justification = _page.JUSTIFY_LEFT
+
+    def _text(self, raw, final=False):
+        text = self._decoder.decode(raw, final)
+        if not text:
+            return
+        if not self._line:
+            self._line_justification = self._justification
+        elif (isinstance(self._line[-1], _page.TextRun)
+                and self._line[-1].style == self._style):
+            text = self._line.pop().text + text
+        self._line.append(_page.TextRun(text, self._style))
+
+    def _element(self, element):
+        self._text(b'', final=True)
+        if not self._line:
+            self._line_justification = self._justification
+        self._line.append(element)
+
+    def _end_line(self):
+        self._text(b'', final=True)
+        self._lines.append(_page.Line(
+                self._line_justification or self._justification,
+                tuple(self._line)))
+        self._line = []
+        self._line_justification = None
+
+    def _finish_page(self, cut):
+        if self._line:
+            self._end_line()
+        page = _page.Page(tuple(self._lines), cut)
+        self._lines = []
+        self.pages += 1
+        if self.on_page is not None:
+            self.on_page(page)
+        return page
+
+    def _set_style(self, **kwargs):
+        self._style = self._style._replace(**kwargs)
+
+    def _lf(self, args):
+        self._end_line()
+
+    def _esc_at(self, args):
+        self._reset()
+
+    def _esc_bang(self, args):
+        n = six.indexbytes(args, 0)
+        self._set_style(
+                font=n & 0x01,
+                bold=bool(n & 0x08),
+                height=2 if n & 0x10 else 1,
+                width=2 if n & 0x20 else 1,
+                underline=1 if n & 0x80 else 0)
+
+    def _esc_dash(self, args):
+        self._set_style(underline=six.indexbytes(args, 0) & 0x03)
+
+    def _esc_e(self, args):
+        # without a parameter (in some vendor dialects) it just turns on
+        on = not args or six.indexbytes(args, 0) & 0x01
+        self._set_style(bold=bool(on))
+
+    def _esc_f(self, args):
+        self._set_style(bold=False)
+
+    def _esc_g(self, args):
+        self._set_style(double_strike=bool(six.indexbytes(args, 0) & 0x01))
+
+    def _esc_m_font(self, args):
+        self._set_style(font=six.indexbytes(args, 0) & 0x0F)
+
+    def _esc_a(self, args):
+        n = six.indexbytes(args, 0) & 0x0F
+        self._justification = _JUSTIFICATIONS.get(n, _page.JUSTIFY_LEFT)
+
+    def _esc_d(self, args):
+        for i in range(six.indexbytes(args, 0)):
+            self._end_line()
+
+    def _esc_i(self, args):
+        return self._finish_page(_page.CUT_FULL)
+
+    def _esc_m(self, args):
+        return self._finish_page(_page.CUT_PARTIAL)
+
+    def _esc_p(self, args):
+        self.drawer_kicks += 1
+
+    def _gs_bang(self, args):
+        n = six.indexbytes(args, 0)
+        self._set_style(width=((n >> 4) & 0x07) + 1, height=(n & 0x07) + 1)
+
+    def _gs_v(self, args):
+        m = six.indexbytes(args, 0)
+        cut = _page.CUT_FULL if m in _FULL_CUTS else _page.CUT_PARTIAL
+        return self._finish_page(cut)
+
+    def _gs_k(self, args):
+        m = six.indexbytes(args, 0)
+        if m <= 6:
+            # function A (NUL terminated) symbologies match function B ones
+            symbology, data = six.int2byte(m + 0x41), args[1:-1]
+        else:
+            symbology, data = six.int2byte(m), args[2:]
+        self._element(_page.Barcode(symbology, data))
+
+    def _gs_paren_k(self, args):
+        # pL pH cn fn [parameters]
+        if len(args) < 4 or six.indexbytes(args, 2) != 0x31:
+            return  # not a QRCode function
+        fn = six.indexbytes(args, 3)
+        if fn == 0x50:  # store data (after m)
+            self._qrcode_data = args[5:]
+        elif fn == 0x51:  # print
+            self._element(_page.QRCode(self._qrcode_data))
+
+    def _gs_paren_l(self, args):
+        # pL pH m fn [parameters]; function 69 prints NV graphics
+        if len(args) >= 6 and six.indexbytes(args, 3) == 0x45:
+            key = args[4:6].decode('ascii', 'replace')
+            self._element(_page.NVGraphics(key))
+
+    def _gs_paren_h(self, args):
+        # pL pH fn m d1 d2 d3 d4 (function 48, transmission response)
+        if len(args) == 8 and six.indexbytes(args, 2) == 0x30:
+            self._responses.extend(b'\x37\x22' + args[4:8] + b'\x00')
+
+    def _gs_v_0(self, args):
+        values = bytearray(args[:5])
+        width = (values[1] + values[2] * 256) * 8
+        height = values[3] + values[4] * 256
+        self._element(_page.RasterImage(width, height))
+
+    def _dle_eot(self, args):
+        n = six.indexbytes(args, 0)
+        if 1 <= n <= 4:
+            self._responses.append(six.indexbytes(self.status, n - 1))
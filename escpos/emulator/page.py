@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/emulator/page.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""In-memory page model built by the emulator. A page is everything printed
+between two paper cuts, as a sequence of lines holding text runs, barcodes
+and images.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from collections import namedtuple
+
+
+JUSTIFY_LEFT = 'left'
+JUSTIFY_CENTER = 'center'
+JUSTIFY_RIGHT = 'right'
+
+JUSTIFICATIONS = (
+        (JUSTIFY_LEFT, 'Left'),
+        (JUSTIFY_CENTER, 'Center'),
+        (JUSTIFY_RIGHT, 'Right'),
+    )
+
+
+CUT_NONE = None
+CUT_FULL = 'full'
+CUT_PARTIAL = 'partial'
+
+CUTS = (
+        (CUT_NONE, 'No cut'),
+        (CUT_FULL, 'Full cut'),
+        (CUT_PARTIAL, 'Partial cut'),
+    )
+
+
+Style = namedtuple('Style', [
+        'bold',
+        'underline',  # 0 (none), 1 or 2 dots thick
+        'double_strike',
+        'font',  # 0 for font A, 1 for font B, and so on
+        'width',  # character width multiplier, 1 to 8
+        'height',  # character height multiplier, 1 to 8
+    ])
+
+DEFAULT_STYLE = Style(
+        bold=False,
+        underline=0,
+        double_strike=False,
+        font=0,
+        width=1,
+        height=1,
+    )
+
+
+TextRun = namedtuple('TextRun', 'text style')
+
+Barcode = namedtuple('Barcode', [
+        'symbology',  # as in escpos.barcode.SYMBOLOGIES (eg. CODE128)
+        'data',  # bytes, as sent to the printer
+    ])
+
+QRCode = namedtuple('QRCode', 'data')
+
+RasterImage = namedtuple('RasterImage', [
+        'width',  # in dots
+        'height',  # in dots
+    ])
+
+NVGraphics = namedtuple('NVGraphics', 'key')
+
+Line = namedtuple('Line', 'justification elements')
+
+Page = namedtuple('Page', 'lines cut')
+
+
+def page_text(page):
+    """Plain text of the given page, one line of text per line."""
+    return '\n'.join(
+            ''.join(e.text for e in line.elements if isinstance(e, TextRun))
+            for line in page.lines
+        )
@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/emulator/serialport.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""A serial printer stand-in over a pseudo-terminal (POSIX only), for testing
+and benchmarking serial connections without a COM port. The printer drains
+its input buffer at the baud rate and signals whether it is ready to receive
+through the CTS and DSR lines, as the buffer fills and drains.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import errno
+import fcntl
+import logging
+import os
+import select
+import struct
+import termios
+import threading
+import time
+import tty
+
+from ..conn.serial import DSRDTR
+from ..conn.serial import RTSCTS
+from ..conn.serial import DSRDTRConnection
+from ..conn.serial import RTSCTSConnection
+from ..conn.serial import SerialSettings
+from .interpreter import READY_STATUS
+from .interpreter import Emulator
+
+
+DEFAULT_BAUDRATE = 9600
+
+DEFAULT_BUFFER_SIZE = 4096
+
+DEFAULT_TICK = 0.005
+
+logger = logging.getLogger('escpos.emulator.serialport')
+
+
+class PtyComport(object):
+    """The host end of a :class:`SerialPrinter` pseudo-terminal. Implements
+    the subset of the PySerial ``Serial`` interface used by
+    :class:`~escpos.conn.serial.SerialConnection`, with modem lines driven by
+    the printer.
+    """
+
+    def __init__(self, printer, fd, timeout=1.0):
+        super(PtyComport, self).__init__()
+        self.printer = printer
+        self.fd = fd
+        self.timeout = timeout
+        self.rts = True
+        self.dtr = True
+        self._open = True
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.name)
+
+    @property
+    def name(self):
+        return self.printer.port_name
+
+    def isOpen(self):
+        return self._open
+
+    def open(self):
+        self._open = True
+
+    def close(self):
+        # the pseudo-terminal itself is closed by the printer
+        self._open = False
+
+    def write(self, data):
+        view = memoryview(data)
+        while view:
+            written = os.write(self.fd, view)
+            view = view[written:]
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def inWaiting(self):
+        value = fcntl.ioctl(self.fd, termios.FIONREAD, b'\x00' * 4)
+        return struct.unpack(b'i', value)[0]
+
+    @property
+    def in_waiting(self):
+        return self.inWaiting()
+
+    def read(self, size=1):
+        data = bytearray()
+        deadline = time.time() + self.timeout
+        while len(data) < size:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            readable, writable, in_error = select.select(
+                    [self.fd], [], [], remaining)
+            if readable:
+                data.extend(os.read(self.fd, size - len(data)))
+        return bytes(data)
+
+    def getCTS(self):
+        return self.printer.ready
+
+    def getDSR(self):
+        return self.printer.ready
+
+    def setRTS(self, level=True):
+        self.rts = bool(level)
+
+    def setDTR(self, level=True):
+        self.dtr = bool(level)
+
+    def flushInput(self):
+        termios.tcflush(self.fd, termios.TCIFLUSH)
+
+    def flushOutput(self):
+        pass
+
+
+class _SimulatedPortMixin(object):
+
+    def __init__(self, printer, **kwargs):
+        super(_SimulatedPortMixin, self).__init__(
+                printer.settings(self.PROTOCOL),
+                **kwargs)
+        self.printer = printer
+
+    def catch(self):
+        self._comport = self.printer.comport
+        if not self.comport.isOpen():
+            self.comport.open()
+        self.comport.setRTS(1)
+        self.comport.setDTR(1)
+        self.comport.flushInput()
+        self.comport.flushOutput()
+
+
+class SimulatedRTSCTSConnection(_SimulatedPortMixin, RTSCTSConnection):
+    """A :class:`~escpos.conn.serial.RTSCTSConnection` to a
+    :class:`SerialPrinter`.
+    """
+
+    PROTOCOL = RTSCTS
+
+
+class SimulatedDSRDTRConnection(_SimulatedPortMixin, DSRDTRConnection):
+    """A :class:`~escpos.conn.serial.DSRDTRConnection` to a
+    :class:`SerialPrinter`.
+    """
+
+    PROTOCOL = DSRDTR
+
+
+class SerialPrinter(object):
+    """A serial printer on the other end of a pseudo-terminal. Incoming data
+    is taken into a finite input buffer, drained at the rate the baud rate
+    allows (ten bits per byte, as in 8N1) and interpreted by an
+    :class:`~escpos.emulator.interpreter.Emulator`, which answers status
+    requests. The printer is not ready (CTS and DSR low) once the buffer
+    reaches ``high_water`` bytes, until it drains down to ``low_water``.
+
+    .. sourcecode:: python
+
+        with SerialPrinter(baudrate=19200, buffer_size=1024) as printer:
+            conn = printer.connect()  # an RTSCTSConnection
+            impl = GenericESCPOS(conn)
+            impl.text('Hello World!')
+        print(printer.bytes_printed, printer.stalls)
+
+    :param int baudrate: Optional. Line speed, which limits draining.
+
+    :param int buffer_size: Optional. Size of the input buffer (in bytes).
+        Data beyond it is left in the pseudo-terminal, so writers that
+        ignore flow control eventually block.
+
+    :param int high_water: Optional. Defaults to three quarters of the
+        buffer size.
+
+    :param int low_water: Optional. Defaults to a quarter of the buffer
+        size.
+
+    :param bytes status: Optional. Answers to ``DLE EOT`` 1 to 4.
+
+    :param on_page: Optional. Callable called with every page printed.
+
+    """
+
+    def __init__(
+            self,
+            baudrate=DEFAULT_BAUDRATE,
+            buffer_size=DEFAULT_BUFFER_SIZE,
+            high_water=None,
+            low_water=None,
+            status=READY_STATUS,
+            on_page=None):
+        super(SerialPrinter, self).__init__()
+        self.baudrate = baudrate
+        self.buffer_size = buffer_size
+        self.high_water = high_water
+        if high_water is None:
+            self.high_water = buffer_size * 3 // 4
+        self.low_water = low_water
+        if low_water is None:
+            self.low_water = buffer_size // 4
+        self.emulator = Emulator(on_page=on_page, status=status)
+        self.bytes_received = 0
+        self.bytes_printed = 0
+        self.stalls = 0
+        self.stalled_time = 0.0
+        self._buffer = bytearray()
+        self._ready = True
+        self._stalled_at = None
+        self._master = None
+        self._slave = None
+        self._comport = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __repr__(self):
+        return '{}(baudrate={!r}, buffer_size={!r})'.format(
+                self.__class__.__name__,
+                self.baudrate,
+                self.buffer_size
+            )
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @property
+    def ready(self):
+        """Whether the printer is ready to receive (CTS and DSR high)."""
+        return self._ready
+
+    @property
+    def buffered(self):
+        """Number of bytes in the input buffer, waiting to be printed."""
+        return len(self._buffer)
+
+    @property
+    def port_name(self):
+        """Name of the pseudo-terminal device on the host end."""
+        return os.ttyname(self._slave) if self._slave is not None else None
+
+    @property
+    def comport(self):
+        """The :class:`PtyComport` for the host end."""
+        return self._comport
+
+    def settings(self, protocol=RTSCTS):
+        """A :class:`~escpos.conn.serial.SerialSettings` matching this
+        printer, for the given flow control protocol.
+        """
+        return SerialSettings(
+                baudrate=self.baudrate,
+                databits=8,
+                stopbits=1,
+                parity='N',
+                protocol=protocol)
+
+    def connect(self, protocol=RTSCTS, **kwargs):
+        """Return a serial connection to this printer, for the given flow
+        control protocol (:const:`~escpos.conn.serial.RTSCTS` or
+        :const:`~escpos.conn.serial.DSRDTR`). Keyword arguments are passed
+        to the connection constructor.
+        """
+        if protocol == DSRDTR:
+            return SimulatedDSRDTRConnection(self, **kwargs)
+        return SimulatedRTSCTSConnection(self, **kwargs)
+
+    def start(self):
+        if self._thread is not None:
+            raise RuntimeError('Serial printer already started')
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._master)
+        tty.setraw(self._slave)
+        self._comport = PtyComport(self, self._slave)
+        self._stop.clear()
+        self._thread = threading.Thread(
+                target=self._run,
+                name='escpos-serial-printer')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for fd in (self._master, self._slave):
+            if fd is not None:
+                os.close(fd)
+        self._master = self._slave = None
+
+    def _run(self):
+        rate = self.baudrate / 10.0  # bytes per second
+        credit = 0.0
+        last = time.time()
+        while not self._stop.is_set():
+            room = self.buffer_size - len(self._buffer)
+            timeout = DEFAULT_TICK if self._buffer or room <= 0 else 0.05
+            readable, writable, in_error = select.select(
+                    [self._master] if room > 0 else [], [], [], timeout)
+            if readable:
+                self._receive(room)
+            now = time.time()
+            credit = min(credit + (now - last) * rate, self.buffer_size)
+            last = now
+            if self._buffer and credit >= 1:
+                count = min(int(credit), len(self._buffer))
+                credit -= count
+                self._print(count)
+            elif not self._buffer:
+                credit = 0.0
+            self._update_ready(now)
+
+    def _receive(self, room):
+        try:
+            data = os.read(self._master, room)
+        except OSError as ex:
+            if ex.errno != errno.EIO:  # EIO means host end closed
+                raise
+            return
+        self._buffer.extend(data)
+        self.bytes_received += len(data)
+
+    def _print(self, count):
+        data = bytes(self._buffer[:count])
+        del self._buffer[:count]
+        self.bytes_printed += count
+        self.emulator.feed(data)
+        response = self.emulator.read()
+        if response:
+            os.write(self._master, response)
+
+    def _update_ready(self, now):
+        size = len(self._buffer)
+        if self._ready and size >= self.high_water:
+            self._ready = False
+            self._stalled_at = now
+            self.stalls += 1
+        elif not self._ready and size <= self.low_water:
+            self._ready = True
+            self.stalled_time += now - self._stalled_at
@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/emulator/server.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""A local raw TCP/IP (port 9100 like) printer simulator, for testing and
+benchmarking network connections without printers. It emulates print speed,
+receive buffer size, status answers, slow accepts and connection resets.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import logging
+import select
+import socket
+import struct
+import threading
+import time
+
+from .interpreter import READY_STATUS
+from .interpreter import Emulator
+
+
+DEFAULT_CHUNK_SIZE = 4096
+
+DEFAULT_SELECT_TIMEOUT = 0.05
+
+logger = logging.getLogger('escpos.emulator.server')
+
+
+class ConnectionStats(object):
+    """Statistics of a single connection accepted by :class:`PrinterServer`.
+    """
+
+    def __init__(self, peer):
+        super(ConnectionStats, self).__init__()
+        self.peer = peer
+        self.connected_at = time.time()
+        self.closed_at = None
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self.reset = False
+
+    def __repr__(self):
+        return (
+                '{}(peer={!r}, bytes_received={!r}, throughput={:.1f}, '
+                'reset={!r})'
+            ).format(
+                self.__class__.__name__,
+                self.peer,
+                self.bytes_received,
+                self.throughput,
+                self.reset
+            )
+
+    @property
+    def elapsed(self):
+        """Time (in seconds) the connection is (or was) open."""
+        return (self.closed_at or time.time()) - self.connected_at
+
+    @property
+    def throughput(self):
+        """Bytes received per second."""
+        elapsed = self.elapsed
+        return self.bytes_received / elapsed if elapsed > 0 else 0.0
+
+
+class PrinterServer(object):
+    """A threaded TCP server that accepts raw ESC/POS commands as a network
+    printer would, each connection served by its own thread.
+
+    .. sourcecode:: python
+
+        with PrinterServer(print_speed=20000, reset_after=1024) as server:
+            conn = NetworkConnection.create(server.address)
+            printer = GenericESCPOS(conn)
+            printer.text('Hello World!')
+            ...
+        print(server.connections)
+
+    Received data is interpreted by an
+    :class:`~escpos.emulator.interpreter.Emulator`, which answers status
+    (``DLE EOT``) and transmission response (``GS ( H``) requests.
+
+    :param str host: Optional. Address to listen on.
+
+    :param int port: Optional. Port to listen on. Defaults to ``0``, that is,
+        any free port (see :attr:`address`).
+
+    :param int print_speed: Optional. Bytes per second the printer consumes
+        (data is counted as received once printed) or ``None`` (the
+        default) for no limit. Once the receive buffer is full, writes by
+        clients will block, as with busy printers.
+
+    :param int receive_buffer: Optional. Size of the receive buffer (in
+        bytes) of accepted sockets. Defaults to the system default.
+
+    :param float accept_delay: Optional. Time (in seconds) to wait before
+        accepting each connection.
+
+    :param int reset_after: Optional. Reset (``ECONNRESET``) connections
+        after receiving this many bytes through them.
+
+    :param int max_resets: Optional. Stop resetting connections after this
+        many resets. Defaults to ``None``, no limit.
+
+    :param bytes status: Optional. Answers to ``DLE EOT`` 1 to 4. May be
+        changed at any time through the :attr:`status` attribute.
+
+    :param bool interpret: Optional. If false, received data is just counted,
+        and no request is answered.
+
+    :param on_page: Optional. Callable called with every page printed, as
+        given by the emulator.
+
+    """
+
+    def __init__(
+            self,
+            host='127.0.0.1',
+            port=0,
+            print_speed=None,
+            receive_buffer=None,
+            accept_delay=0.0,
+            reset_after=None,
+            max_resets=None,
+            status=READY_STATUS,
+            interpret=True,
+            on_page=None):
+        super(PrinterServer, self).__init__()
+        self.host = host
+        self.port = port
+        self.print_speed = print_speed
+        self.receive_buffer = receive_buffer
+        self.accept_delay = accept_delay
+        self.reset_after = reset_after
+        self.max_resets = max_resets
+        self.status = status
+        self.interpret = interpret
+        self.on_page = on_page
+        self.resets = 0
+        self._connections = []
+        self._sockets = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._socket = None
+        self._thread = None
+
+    def __repr__(self):
+        return '{}({!r}, {!r})'.format(
+                self.__class__.__name__,
+                self.host,
+                self.port
+            )
+
+    def __str__(self):
+        return self.address
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @property
+    def address(self):
+        """Address the server is listening on, as ``host:port``, suitable
+        for :meth:`NetworkConnection.create()
+        <escpos.conn.network.NetworkConnection.create>`.
+        """
+        return '{}:{}'.format(self.host, self.port)
+
+    @property
+    def connections(self):
+        """A list of :class:`ConnectionStats`, one for every connection
+        accepted, in order.
+        """
+        with self._lock:
+            return list(self._connections)
+
+    @property
+    def bytes_received(self):
+        return sum(c.bytes_received for c in self.connections)
+
+    def start(self):
+        if self._thread is not None:
+            raise RuntimeError('Printer server already started')
+        self._stop.clear()
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if self.receive_buffer:
+            # accepted sockets inherit it
+            self._socket.setsockopt(
+                    socket.SOL_SOCKET,
+                    socket.SO_RCVBUF,
+                    self.receive_buffer)
+        self._socket.bind((self.host, self.port))
+        self._socket.listen(16)
+        self.port = self._socket.getsockname()[1]
+        self._thread = threading.Thread(
+                target=self._serve,
+                name='escpos-printer-server')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        with self._lock:
+            for sock in list(self._sockets):
+                _close(sock)
+
+    def reset_all(self):
+        """Reset all open connections right now."""
+        with self._lock:
+            sockets = list(self._sockets)
+        for sock in sockets:
+            _reset(sock)
+
+    def _serve(self):
+        while not self._stop.is_set():
+            readable, writable, in_error = select.select(
+                    [self._socket], [], [], DEFAULT_SELECT_TIMEOUT)
+            if not readable:
+                continue
+            if self.accept_delay and self._stop.wait(self.accept_delay):
+                break
+            try:
+                sock, peer = self._socket.accept()
+            except socket.error:
+                continue
+            stats = ConnectionStats(peer)
+            with self._lock:
+                self._connections.append(stats)
+                self._sockets.add(sock)
+            thread = threading.Thread(
+                    target=self._handle,
+                    args=(sock, stats),
+                    name='escpos-printer-server-conn')
+            thread.daemon = True
+            thread.start()
+
+    def _handle(self, sock, stats):
+        emulator = None
+        if self.interpret:
+            emulator = Emulator(on_page=self.on_page, status=self.status)
+        chunk_size = self.receive_buffer or DEFAULT_CHUNK_SIZE
+        if self.print_speed:
+            # about 20 chunks per second, so printing pace is steady
+            chunk_size = max(1, min(chunk_size, self.print_speed // 20))
+        try:
+            while not self._stop.is_set():
+                readable, writable, in_error = select.select(
+                        [sock], [], [], DEFAULT_SELECT_TIMEOUT)
+                if not readable:
+                    continue
+                data = sock.recv(chunk_size)
+                if not data:
+                    break  # closed by client
+                if self.print_speed:
+                    time.sleep(len(data) / float(self.print_speed))
+                stats.bytes_received += len(data)
+                if self._should_reset(stats):
+                    stats.reset = True
+                    _reset(sock)
+                    break
+                if emulator is not None:
+                    emulator.status = self.status
+                    emulator.feed(data)
+                    response = emulator.read()
+                    if response:
+                        sock.sendall(response)
+                        stats.bytes_sent += len(response)
+        except (socket.error, ValueError) as ex:
+            # includes sockets closed by reset_all() or stop()
+            logger.debug('connection from %r failed: %r', stats.peer, ex)
+        finally:
+            stats.closed_at = time.time()
+            with self._lock:
+                self._sockets.discard(sock)
+            _close(sock)
+
+    def _should_reset(self, stats):
+        if self.reset_after is None or stats.bytes_received < self.reset_after:
+            return False
+        with self._lock:
+            if self.max_resets is not None and self.resets >= self.max_resets:
+                return False
+            self.resets += 1
+            return True
+
+
+def _reset(sock):
+    # closing with a zero linger timeout sends a RST instead of a FIN, so the
+    # peer gets ECONNRESET (or EPIPE) on its next operation
+    try:
+        sock.setsockopt(
+                socket.SOL_SOCKET,
+                socket.SO_LINGER,
+                struct.pack(b'ii', 1, 0))
+    except socket.error:
+        pass
+    _close(sock)
+
+
+def _close(sock):
+    try:
+        sock.close()
+    except socket.error:
+        pass
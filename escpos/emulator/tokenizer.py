@@ -0,0 +1,405 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/emulator/tokenizer.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Streaming, table-driven ESC/POS tokenizer.
+
+Incoming bytes are split into text runs, single byte control codes (such as
+``LF``) and commands, whose lengths are given by a table of command prefixes.
+Only an incomplete command at the end of a chunk is kept between calls, so
+memory usage does not depend on the size of the input.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import re
+
+from collections import namedtuple
+
+from .. import asc
+
+
+TEXT = 'text'
+CONTROL = 'control'
+COMMAND = 'command'
+UNKNOWN = 'unknown'
+
+TOKEN_KINDS = (
+        (TEXT, 'Text run'),
+        (CONTROL, 'Single byte control code'),
+        (COMMAND, 'Command'),
+        (UNKNOWN, 'Unknown command'),
+    )
+
+
+Token = namedtuple('Token', [
+        'kind',  # one of TOKEN_KINDS
+        'name',  # command mnemonic, such as 'ESC E' (None for text)
+        'raw',  # all the bytes of this token, as received
+        'args',  # bytes following the command prefix
+    ])
+
+
+MAX_TEXT_RUN = 4096
+"""Text runs longer than this are split in more than one token."""
+
+_PREFIX_BYTES = frozenset([asc.ESC, asc.GS, asc.FS, asc.DLE])
+
+_TEXT_RUN = re.compile(b'[\\x20-\\xff]+')
+
+_CONTROL_NAMES = dict(asc.MNEMONIC_TABLE)
+
+
+def fixed(count):
+    """Command length spec for commands with a fixed number of parameter
+    bytes following its prefix.
+    """
+    def spec(buf, start, prefix_length):
+        return start + prefix_length + count
+    return spec
+
+
+def _nul_terminated(buf, start, prefix_length):
+    end = buf.find(b'\x00', start + prefix_length)
+    return None if end < 0 else end + 1
+
+
+def _gs_paren(buf, start, prefix_length):
+    # GS ( x pL pH [data]
+    if len(buf) < start + 5:
+        return None
+    return start + 5 + buf[start + 3] + buf[start + 4] * 256
+
+
+def _gs_8_l(buf, start, prefix_length):
+    # GS 8 L p1 p2 p3 p4 [data]
+    if len(buf) < start + 7:
+        return None
+    size = (
+            buf[start + 3]
+            + (buf[start + 4] << 8)
+            + (buf[start + 5] << 16)
+            + (buf[start + 6] << 24)
+        )
+    return start + 7 + size
+
+
+def _gs_k(buf, start, prefix_length):
+    # GS k m d1...dk NUL (m from 0 to 6) or GS k m n d1...dn (m >= 65)
+    if len(buf) < start + 3:
+        return None
+    if buf[start + 2] <= 6:
+        return _nul_terminated(buf, start, 3)
+    if len(buf) < start + 4:
+        return None
+    return start + 4 + buf[start + 3]
+
+
+def _gs_v_0(buf, start, prefix_length):
+    # GS v 0 m xL xH yL yH [data]
+    if len(buf) < start + 8:
+        return None
+    width = buf[start + 4] + buf[start + 5] * 256
+    height = buf[start + 6] + buf[start + 7] * 256
+    return start + 8 + width * height
+
+
+def _gs_v_cut(buf, start, prefix_length):
+    # GS V m or GS V m n (function B, C and D)
+    if len(buf) < start + 3:
+        return None
+    if buf[start + 2] in (0x41, 0x42, 0x61, 0x62, 0x67, 0x68):
+        return start + 4
+    return start + 3
+
+
+def _esc_star(buf, start, prefix_length):
+    # ESC * m nL nH [data]; 24-dot modes take three bytes per column
+    if len(buf) < start + 5:
+        return None
+    columns = buf[start + 3] + buf[start + 4] * 256
+    return start + 5 + columns * (3 if buf[start + 2] in (32, 33) else 1)
+
+
+def _esc_b_daruma(buf, start, prefix_length):
+    # ESC b symbology width height hri d1...dk NUL
+    if len(buf) < start + 6:
+        return None
+    return _nul_terminated(buf, start, 6)
+
+
+def _esc_81_daruma(buf, start, prefix_length):
+    # ESC 81h nL nH [module size, ECC level, d1...dk] (nL + nH * 256 bytes)
+    if len(buf) < start + 4:
+        return None
+    return start + 4 + buf[start + 2] + buf[start + 3] * 256
+
+
+def _gs_k_q_bematech(buf, start, prefix_length):
+    # GS k Q p1 p2 p3 p4 sL sH d1...dk (QRCode)
+    if len(buf) < start + 9:
+        return None
+    return start + 9 + buf[start + 7] + buf[start + 8] * 256
+
+
+def _fs_q(buf, start, prefix_length):
+    # FS q n [xL xH yL yH d1...dk]1...[...]n (define NV bit image)
+    if len(buf) < start + 3:
+        return None
+    end = start + 3
+    for i in range(buf[start + 2]):
+        if len(buf) < end + 4:
+            return None
+        width = buf[end] + buf[end + 1] * 256
+        height = buf[end + 2] + buf[end + 3] * 256
+        end += 4 + width * height * 8
+    return end
+
+
+ESCPOS_COMMANDS = {
+        b'\x1B\x40': ('ESC @', fixed(0)),
+        b'\x1B\x21': ('ESC !', fixed(1)),
+        b'\x1B\x2A': ('ESC *', _esc_star),
+        b'\x1B\x2D': ('ESC -', fixed(1)),
+        b'\x1B\x32': ('ESC 2', fixed(0)),
+        b'\x1B\x33': ('ESC 3', fixed(1)),
+        b'\x1B\x45': ('ESC E', fixed(1)),
+        b'\x1B\x47': ('ESC G', fixed(1)),
+        b'\x1B\x4A': ('ESC J', fixed(1)),
+        b'\x1B\x4D': ('ESC M', fixed(1)),
+        b'\x1B\x52': ('ESC R', fixed(1)),
+        b'\x1B\x56': ('ESC V', fixed(1)),
+        b'\x1B\x57': ('ESC W', fixed(8)),
+        b'\x1B\x61': ('ESC a', fixed(1)),
+        b'\x1B\x64': ('ESC d', fixed(1)),
+        b'\x1B\x69': ('ESC i', fixed(0)),
+        b'\x1B\x6D': ('ESC m', fixed(0)),
+        b'\x1B\x70': ('ESC p', fixed(1)),  # as GenericESCPOS emits it
+        b'\x1B\x74': ('ESC t', fixed(1)),
+        b'\x1B\x7B': ('ESC {', fixed(1)),
+        b'\x1D\x21': ('GS !', fixed(1)),
+        b'\x1D\x28\x41': ('GS ( A', _gs_paren),
+        b'\x1D\x28\x48': ('GS ( H', _gs_paren),
+        b'\x1D\x28\x4B': ('GS ( K', _gs_paren),
+        b'\x1D\x28\x4C': ('GS ( L', _gs_paren),
+        b'\x1D\x28\x6B': ('GS ( k', _gs_paren),
+        b'\x1D\x28': ('GS (', _gs_paren),
+        b'\x1D\x38\x4C': ('GS 8 L', _gs_8_l),
+        b'\x1D\x42': ('GS B', fixed(1)),
+        b'\x1D\x48': ('GS H', fixed(1)),
+        b'\x1D\x4C': ('GS L', fixed(2)),
+        b'\x1D\x56': ('GS V', _gs_v_cut),
+        b'\x1D\x57': ('GS W', fixed(2)),
+        b'\x1D\x61': ('GS a', fixed(1)),
+        b'\x1D\x66': ('GS f', fixed(1)),
+        b'\x1D\x68': ('GS h', fixed(1)),
+        b'\x1D\x6B': ('GS k', _gs_k),
+        b'\x1D\x72': ('GS r', fixed(1)),
+        b'\x1D\x76\x30': ('GS v 0', _gs_v_0),
+        b'\x1D\x77': ('GS w', fixed(1)),
+        b'\x10\x04': ('DLE EOT', fixed(1)),
+        b'\x10\x05': ('DLE ENQ', fixed(1)),
+        b'\x10\x14': ('DLE DC4', fixed(3)),
+        b'\x1C\x70': ('FS p', fixed(2)),
+        b'\x1C\x71': ('FS q', _fs_q),
+    }
+"""Command table for the ESC/POS command set, mapping command prefixes (two
+or three bytes) to their mnemonic and their length spec. A length spec is a
+callable ``spec(buf, start, prefix_length)`` returning the index where the
+command starting at ``start`` ends or ``None`` if more bytes are needed.
+"""
+
+VENDOR_COMMANDS = {
+        'escpos.impl.bematech.MP4200TH': {
+            b'\x1B\x0F': ('ESC SI', fixed(0)),  # condensed on
+            b'\x1B\x45': ('ESC E', fixed(0)),
+            b'\x1B\x46': ('ESC F', fixed(0)),
+            b'\x1B\x48': ('ESC H', fixed(0)),  # condensed off
+            b'\x1B\x57': ('ESC W', fixed(1)),  # double width
+            b'\x1B\x76': ('ESC v', fixed(1)),  # cash drawer #1 pulse
+            b'\x1B\x80': ('ESC 80', fixed(1)),  # cash drawer #2 pulse
+            b'\x1D\x6B\x51': ('GS k Q', _gs_k_q_bematech),
+        },
+        'escpos.impl.daruma.DarumaGeneric': {
+            b'\x1B\x57': ('ESC W', fixed(1)),  # double width
+            b'\x1B\x62': ('ESC b', _esc_b_daruma),
+            b'\x1B\x6A': ('ESC j', fixed(1)),  # justification
+            b'\x1B\x70': ('ESC p', fixed(0)),
+            b'\x1B\x81': ('ESC 81', _esc_81_daruma),
+        },
+        'escpos.impl.elgin.ElginI9': {
+            b'\x1B\x70': ('ESC p', fixed(3)),  # ESC p m t1 t2
+        },
+        'escpos.impl.unknown.CB55C': {
+            b'\x1B\x45': ('ESC E', fixed(0)),
+            b'\x1B\x46': ('ESC F', fixed(0)),
+            b'\x1B\x57': ('ESC W', fixed(1)),  # double width
+        },
+    }
+"""Changes to :const:`ESCPOS_COMMANDS` for the dialects of implementations
+(and their subclasses) that do not emit standard ESC/POS, by the fully
+qualified name of the implementation class. See :func:`command_table`.
+"""
+
+
+def command_table(impl):
+    """The command table for the commands the given implementation (a class
+    or an instance) emits: :const:`ESCPOS_COMMANDS` updated by the nearest
+    entry in :const:`VENDOR_COMMANDS` for the implementation or one of its
+    base classes.
+
+    .. sourcecode:: python
+
+        from escpos.impl.daruma import DR700
+
+        data = DR700.compile(['init', ('text', ('Hello',)), 'cut'])
+        tokens = tokenize(data, table=command_table(DR700))
+
+    """
+    changes = vendor_entry(impl, VENDOR_COMMANDS)
+    if changes is None:
+        return ESCPOS_COMMANDS
+    table = dict(ESCPOS_COMMANDS)
+    table.update(changes)
+    return table
+
+
+def vendor_entry(impl, entries):
+    """The value in ``entries`` (a dictionary keyed by fully qualified class
+    names, as :const:`VENDOR_COMMANDS`) for the given implementation (a class
+    or an instance) or its nearest base class, or ``None``.
+    """
+    cls = impl if isinstance(impl, type) else type(impl)
+    for base in cls.__mro__:
+        name = '{}.{}'.format(base.__module__, base.__name__)
+        if name in entries:
+            return entries[name]
+    return None
+
+
+class Tokenizer(object):
+    """Split a stream of ESC/POS bytes into tokens.
+
+    .. sourcecode:: python
+
+        tokenizer = Tokenizer()
+        for chunk in chunks:
+            for token in tokenizer.feed(chunk):
+                print(token.kind, token.name)
+        tokenizer.close()
+
+    Unknown commands (a prefix byte followed by a byte not in the table) are
+    taken as two bytes long and reported as :const:`UNKNOWN` tokens.
+
+    :param dict table: Optional. The command table. Defaults to
+        :const:`ESCPOS_COMMANDS`. Vendor specific dialects may be supported
+        by an updated copy of it.
+
+    """
+
+    def __init__(self, table=None):
+        super(Tokenizer, self).__init__()
+        self.table = ESCPOS_COMMANDS if table is None else table
+        self._pending = bytearray()
+
+    @property
+    def pending(self):
+        """Number of bytes of an incomplete command held from last feed."""
+        return len(self._pending)
+
+    def feed(self, data):
+        """Tokenize the given data, returning a list of complete tokens. An
+        incomplete command at the end of data is held until the next feed.
+        """
+        if self._pending:
+            buf = self._pending
+            buf.extend(data)
+        else:
+            buf = bytearray(data)
+        tokens = []
+        append = tokens.append
+        table = self.table
+        text_run = _TEXT_RUN.match
+        size = len(buf)
+        i = 0
+        while i < size:
+            value = buf[i]
+            if value >= 0x20:
+                match = text_run(buf, i, min(size, i + MAX_TEXT_RUN))
+                end = match.end()
+                raw = bytes(buf[i:end])
+                append(Token(TEXT, None, raw, raw))
+                i = end
+                continue
+
+            if value not in _PREFIX_BYTES:
+                raw = bytes(buf[i:i + 1])
+                append(Token(CONTROL, _CONTROL_NAMES[value], raw, b''))
+                i += 1
+                continue
+
+            if i + 1 >= size:
+                break  # need at least the second byte of the prefix
+
+            prefix = bytes(buf[i:i + 3])
+            entry = table.get(prefix)
+            if entry is None:
+                prefix = prefix[:2]
+                entry = table.get(prefix)
+                if entry is None and i + 2 >= size and any(
+                        key.startswith(prefix) for key in table
+                        if len(key) == 3):
+                    break  # three-byte prefix may still be completed
+            if entry is None:
+                raw = bytes(buf[i:i + 2])
+                append(Token(UNKNOWN, _unknown_name(raw), raw, b''))
+                i += 2
+                continue
+
+            name, spec = entry
+            end = spec(buf, i, len(prefix))
+            if end is None or end > size:
+                break  # incomplete command
+            raw = bytes(buf[i:end])
+            append(Token(COMMAND, name, raw, raw[len(prefix):]))
+            i = end
+
+        self._pending = bytearray(buf[i:]) if i < size else bytearray()
+        return tokens
+
+    def close(self):
+        """Flush the tokenizer, returning any incomplete command left as an
+        :const:`UNKNOWN` token (as a list, possibly empty).
+        """
+        if not self._pending:
+            return []
+        raw = bytes(self._pending)
+        self._pending = bytearray()
+        return [Token(UNKNOWN, _unknown_name(raw[:2]), raw, b'')]
+
+
+def tokenize(data, table=None):
+    """Tokenize all the given data at once, returning a list of tokens."""
+    tokenizer = Tokenizer(table=table)
+    return tokenizer.feed(data) + tokenizer.close()
+
+
+def _unknown_name(raw):
+    names = [_CONTROL_NAMES.get(b, '{:02X}'.format(b)) for b in bytearray(raw)]
+    return ' '.join(names)
@@ -35,3 +35,11 @@ class NonWritableSocketError(Exception):
 
 class NonReadableSocketError(Exception):
     pass
+
+
+class NoPrinterAvailableError(Exception):
+    pass
+
+
+class CaptureFormatError(Exception):
+    pass
@@ -29,6 +29,7 @@ CUTTER = 'cutter'
 CASHDRAWER_PORTS = 'cashdrawer-ports'
 CASHDRAWER_AVAILABLE_PORTS = 'cashdrawer-available-ports'
 PORTABLE = 'portable'
+DOTS_PER_LINE = 'dots-per-line'
 
 
 Columns = namedtuple('Columns', 'normal expanded condensed')
@@ -53,5 +54,6 @@ _SET = {
         CASHDRAWER_PORTS: True,
         CASHDRAWER_AVAILABLE_PORTS: 2,
         PORTABLE: False,
+        DOTS_PER_LINE: 576,
     }
 """Default features set."""
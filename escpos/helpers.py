@@ -20,6 +20,7 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import binascii
 import inspect
 import time
 
@@ -27,7 +28,6 @@ from collections import namedtuple
 from itertools import takewhile
 from operator import attrgetter
 
-from builtins import chr
 from builtins import bytes
 
 import six
@@ -144,28 +144,22 @@ def to_bytes(content, encoding='utf-8', errors='strict'):
 
 
 def hexdump(content, encoding='utf-8', errors='strict', eol='\n', panel_gap=2):
-    b_content = to_bytes(content, encoding=encoding, errors=errors)
-    hex_panel, char_panel = hexdump_bytes(b_content)
-    gap = ' ' * panel_gap
+    b_content = _hexdump_input(content, encoding, errors)
+    chars = b_content.translate(_HEXDUMP_CHARS).decode('ascii')
+    line_format = '{:<47}' + (' ' * panel_gap) + '{:<16}'
     return eol.join(
-            '{}{}{}'.format(h, gap, c)
-            for h, c in zip(hex_panel, char_panel)
+            line_format.format(_hex_line(b_content[i:i + 16]), chars[i:i + 16])
+            for i in range(0, len(b_content), 16)
         )
 
 
 def hexdump_bytes(data, fill_last_line=True):
-    def _hex_values():
-        return ['{:02x}'.format(b) for b in data]
+    data = _hexdump_input(data, 'utf-8', 'strict')
+    chars = data.translate(_HEXDUMP_CHARS).decode('ascii')
+    offsets = range(0, len(data), 16)
 
-    def _chr_values():
-        return [chr(b) if 32 <= b <= 126 else '.' for b in data]
-
-    def _cut(sequence, size):
-        for i in range(0, len(sequence), size):
-            yield sequence[i:i + size]
-
-    hex_panel = [' '.join(line) for line in _cut(_hex_values(), 16)]
-    char_panel = [''.join(line) for line in _cut(_chr_values(), 16)]
+    hex_panel = [_hex_line(data[i:i + 16]) for i in offsets]
+    char_panel = [chars[i:i + 16] for i in offsets]
 
     if hex_panel and fill_last_line:
         hex_panel[-1] = hex_panel[-1] + (' ' * (47 - len(hex_panel[-1])))
@@ -176,6 +170,34 @@ def hexdump_bytes(data, fill_last_line=True):
     return hex_panel, char_panel
 
 
+_HEXDUMP_CHARS = bytes(bytearray(
+        b if 32 <= b <= 126 else ord('.') for b in range(256)))
+# translation table for the character panel of hexdumps
+
+
+def _hexdump_input(content, encoding, errors):
+    # bytes and bytearrays are dumped as they are, sparing a copy
+    if isinstance(content, (six.binary_type, bytearray)):
+        return content
+    return to_bytes(content, encoding=encoding, errors=errors)
+
+
+def _hex_line_sep(chunk):
+    return chunk.hex(' ')
+
+
+def _hex_line_hexlify(chunk):
+    digits = binascii.hexlify(chunk).decode('ascii')
+    return ' '.join(digits[i:i + 2] for i in range(0, len(digits), 2))
+
+
+try:
+    b''.hex(' ')  # Python 3.8+
+    _hex_line = _hex_line_sep
+except (AttributeError, TypeError):
+    _hex_line = _hex_line_hexlify
+
+
 def is_value_in(constants_group, value):
     """Checks whether value can be found in the given constants group,
     which in turn, must be a Django-like choices tuple.
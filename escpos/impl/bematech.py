@@ -20,8 +20,6 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import unicode_literals
 
-import time
-
 import six
 from six.moves import range
 
@@ -80,20 +78,20 @@ class _ESCBematech(_CommandSet):
 
     def set_expanded(self, flag):
         onoff = b'\x31' if flag else b'\x30'
-        self._impl.device.write(b'\x1B\x57' + onoff)  # ESC W n
+        self._impl._write(b'\x1B\x57' + onoff)  # ESC W n
 
     def set_condensed(self, flag):
         onoff = b'\x0F' if flag else b'\x48'
-        self._impl.device.write(b'\x1B' + onoff)
+        self._impl._write(b'\x1B' + onoff)
 
     def set_emphasized(self, flag):
         onoff = b'\x45' if flag else b'\x46'
-        self._impl.device.write(b'\x1B' + onoff)
+        self._impl._write(b'\x1B' + onoff)
 
     def _barcode_configure(self, **kwargs):
         if 'barcode_height' in kwargs:
             barcode_height = kwargs.get('barcode_height')
-            self._impl.device.write(b'\x1D\x68' + six.int2byte(barcode_height))
+            self._impl._write(b'\x1D\x68' + six.int2byte(barcode_height))
 
         if 'barcode_width' in kwargs:
             widths = {
@@ -102,7 +100,7 @@ class _ESCBematech(_CommandSet):
                     barcode.BARCODE_QUADRUPLE_WIDTH: 4,
                 }
             barcode_width = widths.get(kwargs.get('barcode_width'))
-            self._impl.device.write(b'\x1D\x77' + six.int2byte(barcode_width))
+            self._impl._write(b'\x1D\x77' + six.int2byte(barcode_width))
 
         if 'barcode_hri' in kwargs:
             values = {
@@ -112,12 +110,11 @@ class _ESCBematech(_CommandSet):
                     barcode.BARCODE_HRI_BOTH: 3,
                 }
             barcode_hri = values.get(kwargs.get('barcode_hri'))
-            self._impl.device.write(b'\x1D\x48' + six.int2byte(barcode_hri))
+            self._impl._write(b'\x1D\x48' + six.int2byte(barcode_hri))
 
     def _barcode_render(self, command):
-        self._impl.device.write(command)
-        time.sleep(0.25)
-        return self._impl.device.read()
+        self._impl._write(command)
+        return self._impl._wait_completion(0.25)
 
     def code128(self, data, **kwargs):
         self._barcode_configure(**kwargs)
@@ -164,10 +161,8 @@ class _ESCBematech(_CommandSet):
                 + qr_data
             )
 
-        self._impl.device.write(command)
-        time.sleep(1)  # sleeps one second for qrcode to be printed
-        response = self._impl.device.read()
-        return response
+        self._impl._write(command)
+        return self._impl._wait_completion(1)  # wait for qrcode to be printed
 
     def kick_drawer(self, port=0, **kwargs):
         # although concrete implementations may have any number of available
@@ -194,11 +189,11 @@ class _ESCBematech(_CommandSet):
 
         if port == 0:
             # activate cash drawer #1 (ESC 76h)
-            self._impl.device.write(b'\x1B\x76' + six.int2byte(duration))
+            self._impl._write(b'\x1B\x76' + six.int2byte(duration))
 
         elif port == 1:
             # activate cash drawer #2 (ESC 80h)
-            self._impl.device.write(b'\x1B\x80' + six.int2byte(duration))
+            self._impl._write(b'\x1B\x80' + six.int2byte(duration))
 
         else:
             raise CashDrawerException((
@@ -228,18 +223,24 @@ class MP4200TH(epson.GenericESCPOS):
         self._escbema = _ESCBematech(self)
 
     def set_expanded(self, flag):
-        self._escbema.set_expanded(flag)
+        if self._state_changed('expanded', bool(flag)):
+            self._escbema.set_expanded(flag)
+            self._remember_state('expanded', bool(flag))
 
     def set_condensed(self, flag):
-        self._escbema.set_condensed(flag)
+        if self._state_changed('condensed', bool(flag)):
+            self._escbema.set_condensed(flag)
+            self._remember_state('condensed', bool(flag))
 
     def set_emphasized(self, flag):
-        self._escbema.set_emphasized(flag)
+        if self._state_changed('emphasized', bool(flag)):
+            self._escbema.set_emphasized(flag)
+            self._remember_state('emphasized', bool(flag))
 
     def cut(self, partial=True):
         if self.hardware_features.get(feature.CUTTER, False):
             param = b'\x6D' if partial else b'\x69'
-            self.device.write(b'\x1B' + param)
+            self._write(b'\x1B' + param)
 
     def _code128_impl(self, data, **kwargs):
         return self._escbema.code128(data, **kwargs)
@@ -20,8 +20,6 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import unicode_literals
 
-import time
-
 import six
 
 from .. import asc
@@ -62,25 +60,37 @@ class DarumaGeneric(GenericESCPOS):
         self.hardware_features.update(features)
 
     def justify_center(self):
-        self.device.write(b'\x1B\x6A\x01')
+        if self._state_changed('justification', 'center'):
+            self._write(b'\x1B\x6A\x01')
+            self._remember_state('justification', 'center')
 
     def justify_left(self):
-        self.device.write(b'\x1B\x6A\x00')
+        if self._state_changed('justification', 'left'):
+            self._write(b'\x1B\x6A\x00')
+            self._remember_state('justification', 'left')
 
     def justify_right(self):
-        self.device.write(b'\x1B\x6A\x02')
+        if self._state_changed('justification', 'right'):
+            self._write(b'\x1B\x6A\x02')
+            self._remember_state('justification', 'right')
 
     def set_expanded(self, flag):
         param = b'\x01' if flag else b'\x00'
-        self.device.write(b'\x1B\x57' + param)
+        if self._state_changed('expanded', bool(flag)):
+            self._write(b'\x1B\x57' + param)
+            self._remember_state('expanded', bool(flag))
 
     def set_condensed(self, flag):
         param = asc.SI if flag else asc.DC2
-        self.device.write(six.int2byte(param))
+        if self._state_changed('condensed', bool(flag)):
+            self._write(six.int2byte(param))
+            self._remember_state('condensed', bool(flag))
 
     def set_emphasized(self, flag):
         param = asc.DC1 if flag else asc.DC3
-        self.device.write(six.int2byte(param))
+        if self._state_changed('emphasized', bool(flag)):
+            self._write(six.int2byte(param))
+            self._remember_state('emphasized', bool(flag))
 
     def cut(self, partial=True, feed=0):
         """Trigger cutter to perform full paper cut.
@@ -92,7 +102,7 @@ class DarumaGeneric(GenericESCPOS):
 
         """
         if self.hardware_features.get(feature.CUTTER, False):
-            self.device.write(b'\x1B\x6d')
+            self._write(b'\x1B\x6d')
 
     def _barcode_impl(self, data, symbology, **kwargs):
         barcode_height = _translate_barcode_height(
@@ -123,11 +133,9 @@ class DarumaGeneric(GenericESCPOS):
                 + b'\x00'
             )
 
-        self.device.write(command)
+        self._write(command)
 
-        time.sleep(0.25)
-        response = self.device.read()
-        return response
+        return self._wait_completion(0.25)
 
     def _ean13_impl(self, data, **kwargs):
         return self._barcode_impl(data[:12], _EAN13_ID, **kwargs)
@@ -168,14 +176,12 @@ class DarumaGeneric(GenericESCPOS):
                 + qr_data
             )
 
-        self.device.write(command)
+        self._write(command)
 
-        time.sleep(0.5)
-        response = self.device.read()
-        return response
+        return self._wait_completion(0.5)
 
     def _kick_drawer_impl(self, port=0, **kwargs):
-        self.device.write(b'\x1B\x70')
+        self._write(b'\x1B\x70')
 
 
 class DR700(DarumaGeneric):
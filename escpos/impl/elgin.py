@@ -78,7 +78,7 @@ class ElginI9(ElginGeneric):
         duration = kwargs.get('duration', CASHDRAWER_DEFAULT_DURATION)
         t1 = kwargs.get('t1', b'\x20')  # 32ms (t1 should be less than t2) [1]
         t2 = kwargs.get('t2', None) or six.int2byte(ord(t1) + duration)
-        self.device.write(b'\x1B\x70' + pin + t1 + t2)
+        self._write(b'\x1B\x70' + pin + t1 + t2)
 
 
 class ElginI7(ElginI9):
@@ -108,6 +108,7 @@ class ElginRM22(ElginI9):
                         normal=32,
                         expanded=16,
                         condensed=42),
+                feature.DOTS_PER_LINE: 384,
             })
         self.hardware_features.update(features)
 
@@ -20,16 +20,27 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import contextlib
+import functools
 import re
+import threading
 import time
 
+from concurrent.futures import Future
+
 import six
 from six.moves import range
 
 from .. import barcode
+from .. import completion as _completion
 from .. import constants
 from .. import feature
+from .. import raster
+from .. import status as _status
+from .. import tracing
+from ..conn.dummy import DummyConnection
 from ..exceptions import CashDrawerException
+from ..exceptions import TimeoutException
 from ..helpers import ByteValue
 from ..helpers import is_value_in
 from ..helpers import _Model
@@ -55,6 +66,8 @@ AVAILABLE_FONTS = (
         (FONT_SPECIAL_B, 'Special Font B'),
     )
 
+_UNKNOWN = object()
+
 QRCODE_ERROR_CORRECTION_MAP = {
         barcode.QRCODE_ERROR_CORRECTION_L: b'\x30',  # 48d (~7%, default)
         barcode.QRCODE_ERROR_CORRECTION_M: b'\x31',  # 49d (~15%)
@@ -133,36 +146,160 @@ class GenericESCPOS(object):
     See ``errors`` argument to ``str.encode()`` for details.
     """
 
+    cache_state = False
+    """Whether mode commands that would not change the tracked printer state
+    (font, emphasized, text size, justification, code page, etc) should be
+    skipped. The tracked state is forgotten on :meth:`init`.
+    """
+
+    completion = None
+    """Strategy for detecting when barcodes and QRCodes have been printed.
+    Defaults to :class:`~escpos.completion.FixedDelay`. See
+    :mod:`escpos.completion` for alternatives.
+    """
+
     def __init__(
             self,
             device,
             features=None,
             encoding=constants.DEFAULT_ENCODING,
-            encoding_errors=constants.DEFAULT_ENCODING_ERRORS):
+            encoding_errors=constants.DEFAULT_ENCODING_ERRORS,
+            completion=None,
+            cache_state=False):
         super(GenericESCPOS, self).__init__()
         self._feature_attrs = feature.FeatureAttributes(self)
         self.hardware_features = feature._SET.copy()
         self.hardware_features.update(features or {})
         self.encoding = encoding
         self.encoding_errors = encoding_errors
+        self.completion = completion or _completion.FixedDelay()
+        self.cache_state = cache_state
         self.device = device
+        tracing.instrument(self)
         self.device.catch()
+        self._buffer = None
+        self._buffer_size = None
+        self._on_flush = []
+        self._state = {}
+        self._process_id = 0
+        self._compiling = False  # set by compile(): nothing reaches a printer
+
+    @classmethod
+    def compile(cls, operations, **kwargs):
+        """Compile operations into the exact bytes this implementation would
+        send to the device, without any I/O: there is no real device to catch,
+        nothing is read and no waits are made for barcodes or QRCodes.
+
+        .. sourcecode:: python
+
+            data = TMT20.compile([
+                    'init',
+                    ('set_emphasized', (True,)),
+                    ('text', ('RECEIPT #5678',)),
+                    ('cut', (), {'partial': False}),
+                ])
+
+        :param operations: An iterable of operations. Each operation is a
+            method name or a tuple of a method name, optionally followed by a
+            tuple of positional arguments and a dictionary of keyword
+            arguments. It may also be a callable that will be called with the
+            printer instance as its only argument, so you can compile any
+            existing printing routine.
+
+        :param kwargs: Keyword arguments for the implementation constructor,
+            such as ``features`` and ``encoding``.
+
+        :returns: The compiled ESC/POS commands.
+        :rtype: bytes
+
+        """
+        device = DummyConnection()
+        printer = cls(device, **kwargs)
+        printer._compiling = True
+        with printer.buffered():
+            if callable(operations):
+                operations(printer)
+            else:
+                for operation in operations:
+                    _apply_operation(printer, operation)
+        return device.output
 
     @property
     def feature(self):
         return self._feature_attrs
 
+    @contextlib.contextmanager
+    def buffered(self, size=None):
+        """Context manager that holds every command in memory and sends them
+        to the device in a single write when the block exits, instead of one
+        write per command.
+
+        .. sourcecode:: python
+
+            with printer.buffered():
+                printer.init()
+                printer.justify_center()
+                printer.text('Hello World!')
+                printer.cut()
+
+        While buffering, barcode and QRCode methods will not wait for the
+        symbol to be printed and will not read any response from the device,
+        returning ``None`` instead, since their commands have not been sent
+        yet. Nested blocks are merged into the outermost one. If an exception
+        is raised inside the block, pending commands are discarded.
+
+        :param int size: Optional. Flush pending commands as soon as the
+            buffer reaches this number of bytes. Defaults to ``None``, which
+            means flush only on exit or on an explicit call to :meth:`flush`.
+
+        """
+        if self._buffer is not None:
+            # nested block; outermost block is in charge of flushing
+            yield self
+            return
+
+        self._buffer = bytearray()
+        self._buffer_size = size
+        try:
+            yield self
+        except BaseException:
+            # including KeyboardInterrupt and GeneratorExit, so the printer
+            # is never left buffering
+            self._state.clear()  # discarded commands may have changed it
+            raise
+        else:
+            self.flush()
+        finally:
+            self._buffer = None
+            self._buffer_size = None
+            del self._on_flush[:]  # pending commands were discarded
+
+    def flush(self):
+        """Write any buffered commands to the device in a single write. This
+        is a no-op if there is no pending commands or if the printer is not
+        in buffered mode. See :meth:`buffered`.
+        """
+        if self._buffer:
+            data = bytes(self._buffer)
+            del self._buffer[:]
+            self.device.write(data)
+        callbacks = self._on_flush[:]
+        del self._on_flush[:]
+        for callback in callbacks:
+            callback()
+
     def init(self):
-        self.device.write(b'\x1B\x40')
+        self._write(b'\x1B\x40')
+        self._state.clear()
 
     def lf(self, lines=1):
         """Line feed. Issues a line feed to printer *n*-times."""
-        for i in range(lines):
-            self.device.write(b'\x0A')
+        if lines > 0:
+            self._write(b'\x0A' * lines)
 
     def textout(self, text):
         """Write text without line feed."""
-        self.device.write(text.encode(self.encoding, self.encoding_errors))
+        self._write(text.encode(self.encoding, self.encoding_errors))
 
     def text(self, text):
         """Write text followed by a line feed."""
@@ -175,13 +312,19 @@ class GenericESCPOS(object):
         self.text(text)
 
     def justify_center(self):
-        self.device.write(b'\x1B\x61\x01')
+        if self._state_changed('justification', 'center'):
+            self._write(b'\x1B\x61\x01')
+            self._remember_state('justification', 'center')
 
     def justify_left(self):
-        self.device.write(b'\x1B\x61\x00')
+        if self._state_changed('justification', 'left'):
+            self._write(b'\x1B\x61\x00')
+            self._remember_state('justification', 'left')
 
     def justify_right(self):
-        self.device.write(b'\x1B\x61\x02')
+        if self._state_changed('justification', 'right'):
+            self._write(b'\x1B\x61\x02')
+            self._remember_state('justification', 'right')
 
     def set_code_page(self, code_page):
         """Set code page for character printing.
@@ -254,7 +397,9 @@ class GenericESCPOS(object):
                     'Code page value should be between 0 and 255;'
                     'got: {!r}'
                 ).format(code_page))
-        self.device.write(b'\x1B\x74' + six.int2byte(code_page))
+        if self._state_changed('code_page', code_page):
+            self._write(b'\x1B\x74' + six.int2byte(code_page))
+            self._remember_state('code_page', code_page)
 
     def set_font(self, font=FONT_A):
         """Set font to one of :attr:`AVAILABLE_FONTS`."""
@@ -264,7 +409,9 @@ class GenericESCPOS(object):
                     (
                         'Invalid font: {!r} (valid fonts are {!r})'
                     ).format(font, valid_fonts))
-        self.device.write(b'\x1B\x4D' + font)  # ESC M <n>
+        if self._state_changed('font', font):
+            self._write(b'\x1B\x4D' + font)  # ESC M <n>
+            self._remember_state('font', font)
 
     def set_mode(
             self,
@@ -297,8 +444,14 @@ class GenericESCPOS(object):
 
         commands.insert(0, b'\x1B\x21' + param.byte)  # ESC !
 
+        # ESC ! overrides character size and vendor specific modes
+        self._forget_state(
+                'condensed', 'expanded', 'text_size', 'font', 'emphasized')
+
         for cmd in commands:
-            self.device.write(cmd)
+            self._write(cmd)
+
+        self._state.update(font=font, emphasized=bool(emphasized))
 
     def set_text_size(self, width, height):
         """Set text size to ``width`` and ``height``.
@@ -314,7 +467,9 @@ class GenericESCPOS(object):
         """
         if (0 <= width <= 7) and (0 <= height <= 7):
             size = 16 * width + height
-            self.device.write(b'\x1D\x21' + six.int2byte(size))
+            if self._state_changed('text_size', (width, height)):
+                self._write(b'\x1D\x21' + six.int2byte(size))
+                self._remember_state('text_size', (width, height))
         else:
             raise ValueError((
                     'Width and height should be between 0 and 7 '
@@ -334,7 +489,10 @@ class GenericESCPOS(object):
             # set character size to double width and height
             param.set_bit(4)  # bits 6, 5, 4 = 0, 0, 1 (x2 width)
             param.set_bit(0)  # bits 2, 1, 0 = 0, 0, 1 (x2 height)
-        self.device.write(b'\x1D\x21' + param.byte)  # GS !
+        size = (1, 1) if flag else (0, 0)
+        if self._state_changed('text_size', size):
+            self._write(b'\x1D\x21' + param.byte)  # GS !
+            self._remember_state('text_size', size)
 
     def set_condensed(self, flag):
         """Turns on/off condensed mode by switching between :attr:`FONT_A`
@@ -344,7 +502,9 @@ class GenericESCPOS(object):
 
         """
         param = FONT_B if flag else FONT_A
-        self.set_font(font=param)
+        if self._state_changed('font', param):
+            self._write(b'\x1B\x4D' + param)  # ESC M <n>
+            self._remember_state('font', param)
 
     def set_emphasized(self, flag):
         """Turns on/off emphasized mode. See :meth:`set_double_strike`.
@@ -353,7 +513,9 @@ class GenericESCPOS(object):
 
         """
         param = b'\x01' if flag else b'\x00'
-        self.device.write(b'\x1B\x45' + param)  # ESC E
+        if self._state_changed('emphasized', bool(flag)):
+            self._write(b'\x1B\x45' + param)  # ESC E
+            self._remember_state('emphasized', bool(flag))
 
     def set_double_strike(self, flag):
         """Turns on/off double strike mode. In practice, double strike and
@@ -363,7 +525,9 @@ class GenericESCPOS(object):
 
         """
         param = b'\x01' if flag else b'\x00'
-        self.device.write(b'\x1B\x47' + param)  # ESC G
+        if self._state_changed('double_strike', bool(flag)):
+            self._write(b'\x1B\x47' + param)  # ESC G
+            self._remember_state('double_strike', bool(flag))
 
     def ean8(self, data, **kwargs):
         """Render given data as **JAN-8/EAN-8** barcode symbology.
@@ -386,10 +550,9 @@ class GenericESCPOS(object):
                 **kwargs
             )
         for cmd in commands:
-            self.device.write(cmd)
+            self._write(cmd)
 
-        time.sleep(0.25)  # wait for barcode to be printed
-        return self.device.read()
+        return self._wait_completion(0.25)  # wait for barcode to be printed
 
     def ean13(self, data, **kwargs):
         """Render given data as **JAN-13/EAN-13** barcode symbology.
@@ -412,10 +575,9 @@ class GenericESCPOS(object):
                 **kwargs
             )
         for cmd in commands:
-            self.device.write(cmd)
+            self._write(cmd)
 
-        time.sleep(0.25)  # wait for barcode to be printed
-        return self.device.read()
+        return self._wait_completion(0.25)  # wait for barcode to be printed
 
     def code128(self, data, **kwargs):
         """Renders given data as **Code 128** barcode symbology.
@@ -459,10 +621,9 @@ class GenericESCPOS(object):
                 **kwargs
             )
         for cmd in commands:
-            self.device.write(cmd)
+            self._write(cmd)
 
-        time.sleep(0.25)  # wait for barcode to be printed
-        return self.device.read()
+        return self._wait_completion(0.25)  # wait for barcode to be printed
 
     def qrcode(self, data, **kwargs):
         """Render given data as `QRCode <http://www.qrcode.com/en/>`_.
@@ -527,10 +688,169 @@ class GenericESCPOS(object):
             )
 
         for cmd in commands:
-            self.device.write(cmd)
+            self._write(cmd)
 
-        time.sleep(1)  # sleeps one second for qrcode to be printed
-        return self.device.read()
+        return self._wait_completion(1)  # wait for qrcode to be printed
+
+    def image(
+            self,
+            image,
+            width=None,
+            dither=raster.DITHER_THRESHOLD,
+            threshold=raster.DEFAULT_THRESHOLD,
+            cache=True):
+        """Print an image using raster bit image command (``GS v 0``).
+        Images wider than the printable area, given by hardware feature
+        :attr:`~escpos.feature.DOTS_PER_LINE`, are scaled down to fit.
+
+        Encoded commands are kept in the process-wide
+        :attr:`escpos.raster.cache`, keyed by the image contents and the
+        conversion arguments, so printing the same image again (such as a
+        logo on every receipt) skips the conversion entirely.
+
+        Requires `NumPy <https://numpy.org/>`_ library. You may want to
+        install PyESCPOS through ``pip install pyescpos[image]``.
+
+        :param image: A Pillow image or a NumPy array. See
+            :func:`escpos.raster.rasterize` for details.
+
+        :param int width: Optional. Width (in dots) to scale the image to,
+            preserving the aspect ratio.
+
+        :param str dither: Optional. How to convert the image to monochrome.
+            Should be one of :attr:`escpos.raster.DITHERING_MODES`. Defaults
+            to :attr:`escpos.raster.DITHER_THRESHOLD`.
+
+        :param int threshold: Optional. Gray level (0 to 255) below which a
+            pixel is printed, when not dithering.
+
+        :param cache: Optional. Whether to use the shared raster cache
+            (``True``, the default) or not (``False``). May also be a
+            :class:`~escpos.raster.RasterCache` instance.
+
+        """
+        if cache is True:
+            cache = raster.cache
+        elif cache is False:
+            cache = None
+        data = raster.encode(
+                image,
+                width=width,
+                max_width=self.hardware_features.get(feature.DOTS_PER_LINE),
+                dither=dither,
+                threshold=threshold,
+                cache=cache
+            )
+        self._write(data)
+
+    def nv_graphics(
+            self,
+            key,
+            image,
+            width=None,
+            dither=raster.DITHER_THRESHOLD,
+            threshold=raster.DEFAULT_THRESHOLD,
+            double_width=False,
+            double_height=False,
+            registry=True):
+        """Print an image stored in the printer non-volatile memory under the
+        given key code, uploading it first only if the registry does not know
+        that the very same image is already stored there. Printing a logo
+        this way costs a few bytes instead of the whole raster image.
+
+        The registry identifies printers by their connection string (the
+        string representation of the device, such as ``192.168.0.100:9100``)
+        so it must be discarded for a printer whose memory was changed by
+        other means (see :meth:`~escpos.raster.NVGraphicsRegistry.discard`).
+
+        :param str key: Two characters key code, such as ``'LG'``.
+
+        :param image: A Pillow image or a NumPy array. See :meth:`image` for
+            details on ``width``, ``dither`` and ``threshold``.
+
+        :param registry: Optional. Whether to use the shared registry
+            :attr:`escpos.raster.nv_registry` (``True``, the default) or to
+            always upload the image (``False``). May also be a
+            :class:`~escpos.raster.NVGraphicsRegistry` instance.
+
+        """
+        if registry is True:
+            registry = raster.nv_registry
+        elif registry is False:
+            registry = None
+
+        if self._compiling:
+            # compiled commands may never reach this (or any) printer
+            registry = None
+
+        printer_id = str(self.device)
+        image_digest = raster.digest(image, width, dither, threshold)
+        if registry is None or registry.get(printer_id, key) != image_digest:
+            self.define_nv_graphics(
+                    key,
+                    image,
+                    width=width,
+                    dither=dither,
+                    threshold=threshold
+                )
+            if registry is not None:
+                self._after_write(functools.partial(
+                        registry.set, printer_id, key, image_digest))
+
+        self.print_nv_graphics(
+                key,
+                double_width=double_width,
+                double_height=double_height
+            )
+
+    def define_nv_graphics(
+            self,
+            key,
+            image,
+            width=None,
+            dither=raster.DITHER_THRESHOLD,
+            threshold=raster.DEFAULT_THRESHOLD):
+        """Store an image in the printer non-volatile memory under the given
+        key code (``GS ( L``, function 67), replacing any graphics stored
+        under the same key. See :meth:`image` for details on arguments.
+
+        .. note::
+
+            Non-volatile memory endures a limited number of writes, so avoid
+            defining graphics on every print. Prefer :meth:`nv_graphics`.
+
+        """
+        dots = raster.rasterize(
+                image,
+                width=width,
+                max_width=self.hardware_features.get(feature.DOTS_PER_LINE),
+                dither=dither,
+                threshold=threshold
+            )
+        self._write(raster.gs_l_define_nv_graphics(key, dots))
+
+    def print_nv_graphics(self, key, double_width=False, double_height=False):
+        """Print graphics stored in the printer non-volatile memory under the
+        given key code (``GS ( L``, function 69).
+        """
+        self._write(raster.gs_l_print_nv_graphics(
+                key,
+                double_width=double_width,
+                double_height=double_height
+            ))
+
+    def delete_nv_graphics(self, key, registry=True):
+        """Delete graphics stored in the printer non-volatile memory under the
+        given key code (``GS ( L``, function 66), also removing it from the
+        registry (see :meth:`nv_graphics`).
+        """
+        if registry is True:
+            registry = raster.nv_registry
+        elif registry is False:
+            registry = None
+        self._write(raster.gs_l_delete_nv_graphics(key))
+        if registry is not None:
+            registry.discard(str(self.device), key)
 
     def cut(self, partial=True, feed=0):
         """Trigger cutter to perform partial (default) or full paper cut.
@@ -564,7 +884,7 @@ class GenericESCPOS(object):
             #
             func_b = b'\x42' if partial else b'\x41'  # function B
             feed_n = six.int2byte(feed)
-            self.device.write(b'\x1D\x56' + func_b + feed_n)  # GS V m n
+            self._write(b'\x1D\x56' + func_b + feed_n)  # GS V m n
 
     def kick_drawer(self, port=0, **kwargs):
         """Kick drawer connected to the given port.
@@ -597,6 +917,190 @@ class GenericESCPOS(object):
 
             return self._kick_drawer_impl(port=port, **kwargs)
 
+    def status(self, timeout=1.0, interval=0.05):
+        """Request the real-time printer status (``DLE EOT`` 1 to 4).
+
+        Status requests are sent straight to the device, even in buffered
+        mode, and are answered by the printer right away, even if it is
+        offline, out of paper or has its cover open.
+
+        :param float timeout: Optional. Maximum time (in seconds) to wait for
+            the printer to answer.
+
+        :param float interval: Optional. Time (in seconds) between reads, for
+            connections that cannot be polled.
+
+        :returns: A :class:`~escpos.status.PrinterStatus` or ``None`` if the
+            printer did not answer (or the connection cannot read at all).
+
+        """
+        deadline = time.time() + timeout
+        self.device.write(_status.DLE_EOT_QUERY)
+        # connections that support it are polled, since reading would
+        # reconnect (and retry) while an offline printer does not answer
+        poll = getattr(self.device, 'poll', None)
+        data = bytearray()
+        while True:
+            remaining = deadline - time.time()
+            if poll is not None:
+                incoming = poll(max(0, remaining))
+            else:
+                incoming = self.device.read()
+            if incoming:
+                data.extend(bytearray(incoming))
+                if len(data) >= 4:
+                    break
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            if poll is None:
+                time.sleep(min(interval, remaining))
+        # any leftover answer to a previous command comes first
+        return _status.parse(bytes(data[-4:]))
+
+    def end_job(self, ack=True, timeout=30, block=True, interval=0.05):
+        """Mark the end of a job, sending any buffered commands. If ``ack``
+        is true (the default) a transmission response request (``GS ( H``)
+        is sent along, which the printer answers only after processing all
+        previous data, so this tells when the job has really been printed.
+
+        .. sourcecode:: python
+
+            printer.text('Hello World!')
+            printer.cut()
+            elapsed = printer.end_job(timeout=10)
+
+        :param bool ack: Optional. Whether to wait for the printer to
+            acknowledge the job.
+
+        :param float timeout: Optional. Maximum time (in seconds) to wait
+            for the acknowledgement.
+
+        :param bool block: Optional. If false, returns a
+            :class:`concurrent.futures.Future` right away, instead of waiting.
+
+        :param float interval: Optional. Time (in seconds) between reads.
+
+        In buffered mode (and so when compiling) the request is just added to
+        the buffer and nothing is waited for.
+
+        :returns: Time (in seconds) from the request to the acknowledgement,
+            or ``None`` if ``ack`` is false or in buffered mode.
+
+        :raises TimeoutException: If the printer does not acknowledge the job
+            within ``timeout``.
+
+        """
+        if not ack:
+            self.flush()
+            return None
+
+        request, expected = self._job_ack_request()
+        self._write(request)
+        if self._buffer is not None:
+            return None
+        start = time.time()
+
+        if block:
+            return self._wait_response(expected, start, timeout, interval)
+
+        future = Future()
+
+        def wait_response():
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(self._wait_response(
+                            expected, start, timeout, interval))
+                except Exception as ex:
+                    future.set_exception(ex)
+
+        thread = threading.Thread(
+                target=wait_response,
+                name='escpos-end-job')
+        thread.daemon = True
+        thread.start()
+        return future
+
+    def _job_ack_request(self):
+        # transmission response request for the next process ID and the
+        # response that acknowledges it
+        self._process_id = (self._process_id + 1) % 10000
+        process_id = '{:04d}'.format(self._process_id).encode('ascii')
+        request = (
+                b'\x1D\x28\x48\x06\x00\x30\x30'  # GS ( H pL pH fn m
+                + process_id  # d1..d4
+            )
+        return request, b'\x37\x22' + process_id + b'\x00'
+
+    def _write(self, data):
+        if self._buffer is None:
+            self.device.write(data)
+        else:
+            self._buffer.extend(data)
+            if self._buffer_size and len(self._buffer) >= self._buffer_size:
+                self.flush()
+
+    def _after_write(self, callback):
+        # call back once everything written so far has actually reached the
+        # device, which in buffered mode means after the next flush
+        if self._buffer is None:
+            callback()
+        else:
+            self._on_flush.append(callback)
+
+    def _read(self):
+        self.flush()
+        return self.device.read()
+
+    def _wait_response(self, expected, start, timeout, interval):
+        # polls the device until the expected response arrives; connections
+        # that support it are polled without reconnecting on idle reads
+        poll = getattr(self.device, 'poll', None)
+        deadline = start + timeout
+        data = bytearray()
+        while True:
+            remaining = deadline - time.time()
+            if poll is not None:
+                incoming = poll(max(0, min(interval, remaining)))
+            else:
+                incoming = self.device.read()
+            if incoming:
+                data.extend(bytearray(incoming))
+                if expected in data:
+                    return time.time() - start
+            elif poll is None and remaining > 0:
+                time.sleep(min(interval, remaining))
+            if remaining <= 0:
+                raise TimeoutException((
+                        'printer did not acknowledge job within {!r} seconds'
+                    ).format(timeout))
+
+    def _state_changed(self, key, value):
+        # track printer state, returning False if the command that sets the
+        # given state can be skipped, since it would not change anything;
+        # otherwise the state is unknown until the command is written and
+        # remembered (see _remember_state), so failed writes are not cached
+        if self.cache_state and self._state.get(key, _UNKNOWN) == value:
+            return False
+        self._state.pop(key, None)
+        return True
+
+    def _remember_state(self, key, value):
+        self._state[key] = value
+
+    def _forget_state(self, *keys):
+        for key in keys:
+            self._state.pop(key, None)
+
+    def _wait_completion(self, delay):
+        # wait for a lengthy operation (such as barcodes and QRCodes) to be
+        # completed, returning whatever the device responded
+        if self._buffer is not None:
+            # commands are still pending; there is nothing to wait for
+            return None
+        with tracing.span('completion.wait', delay=delay):
+            return self.completion.wait(self.device, delay)
+
     def _kick_drawer_impl(self, port=0, **kwargs):
         if port not in range(2):
             raise CashDrawerException((
@@ -604,7 +1108,7 @@ class GenericESCPOS(object):
                 ).format(port))
 
         param = b'\x00' if port == 0 else b'\x01'  # pulse to pin 2 or 5
-        self.device.write(b'\x1B\x70' + param)
+        self._write(b'\x1B\x70' + param)
 
 
 class TMT20(GenericESCPOS):
@@ -622,6 +1126,17 @@ class TMT20(GenericESCPOS):
         self.hardware_features.update(features)
 
 
+def _apply_operation(printer, operation):
+    if isinstance(operation, six.string_types):
+        operation = (operation,)
+    name = operation[0]
+    args = operation[1] if len(operation) > 1 else ()
+    kwargs = operation[2] if len(operation) > 2 else {}
+    if name.startswith('_') or not callable(getattr(printer, name, None)):
+        raise ValueError('Unknown operation: {!r}'.format(name))
+    return getattr(printer, name)(*args, **kwargs)
+
+
 def _get_qrcode_error_correction(**kwargs):
     # adapt from PyESCPOS to Epson's own QRCode ECC level byte value
     return QRCODE_ERROR_CORRECTION_MAP.get(
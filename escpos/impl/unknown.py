@@ -58,15 +58,23 @@ class CB55C(GenericESCPOS):
     def set_expanded(self, flag):
         # ESC W m : double width mode
         param = b'\x01' if flag else b'\x00'  # <m> 0=disable; 1=enable
-        self.device.write(b'\x1B\x57' + param)
+        if self._state_changed('expanded', bool(flag)):
+            self._write(b'\x1B\x57' + param)
+            self._remember_state('expanded', bool(flag))
 
     def set_condensed(self, flag):
         # ESC ! n : formatting characters
         param = b'\x01' if flag else b'\x00'  # <n> 0=disable; 1=enable (bit 0)
-        self.device.write(b'\x1B\x21' + param)
+        if self._state_changed('condensed', bool(flag)):
+            self._write(b'\x1B\x21' + param)
+            # ESC ! also turns off emphasized mode and character size
+            self._forget_state('emphasized', 'font', 'text_size')
+            self._remember_state('condensed', bool(flag))
 
     def set_emphasized(self, flag):
         # ESC E : Enable emphasized mode
         # ESC F : Disable emphasized mode
         param = b'\x45' if flag else b'\x46'
-        self.device.write(b'\x1B' + param)
+        if self._state_changed('emphasized', bool(flag)):
+            self._write(b'\x1B' + param)
+            self._remember_state('emphasized', bool(flag))
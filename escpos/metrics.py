@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/metrics.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Connection metrics: counters and a write latency histogram for every
+printer connection, kept by connection type and label (the connection
+string, such as ``10.0.0.5:9100``), so connections to the same printer share
+their metrics. Read them as a snapshot or export them in Prometheus text
+format:
+
+.. sourcecode:: python
+
+    from escpos import metrics
+
+    metrics.snapshot()['network:10.0.0.5:9100']['retries']
+    print(metrics.prometheus_text())
+
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import bisect
+import threading
+
+
+DEFAULT_LATENCY_BUCKETS = (
+        0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+        0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+    )
+"""Upper bounds (in seconds) of the write latency histogram buckets."""
+
+PROMETHEUS_PREFIX = 'escpos_connection'
+
+COUNTERS = (
+        ('bytes_written', 'Bytes written to the device.'),
+        ('bytes_read', 'Bytes read from the device.'),
+        ('writes', 'Write calls.'),
+        ('reads', 'Read calls.'),
+        ('errors', 'Write calls that failed, after any retries.'),
+        ('retries', 'Backoff retries.'),
+        ('reconnects', 'Reconnections.'),
+        ('stall_seconds', 'Time spent waiting for flow control to write.'),
+    )
+
+
+class Histogram(object):
+    """A cumulative histogram, as in Prometheus. Not thread-safe on its own;
+    :class:`ConnectionMetrics` guards it.
+    """
+
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        super(Histogram, self).__init__()
+        self.buckets = tuple(sorted(buckets))
+        self.reset()
+
+    def reset(self):
+        self._counts = [0] * (len(self.buckets) + 1)  # last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self._counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self):
+        """A dictionary with the cumulative ``buckets`` (a list of upper
+        bound and count pairs, the last bound being ``float('inf')``),
+        ``sum`` and ``count``.
+        """
+        cumulative, buckets = 0, []
+        for bound, count in zip(self.buckets + (float('inf'),), self._counts):
+            cumulative += count
+            buckets.append((bound, cumulative))
+        return {'buckets': buckets, 'sum': self.sum, 'count': self.count}
+
+
+class ConnectionMetrics(object):
+    """Metrics of connections of a given type to a given printer. Get
+    instances through :func:`connection_metrics`.
+    """
+
+    def __init__(self, type_name, label, buckets=DEFAULT_LATENCY_BUCKETS):
+        super(ConnectionMetrics, self).__init__()
+        self.type_name = type_name
+        self.label = label
+        self.write_latency = Histogram(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __repr__(self):
+        return '{}({!r}, {!r})'.format(
+                self.__class__.__name__,
+                self.type_name,
+                self.label
+            )
+
+    def reset(self):
+        with self._lock:
+            self._values = dict((name, 0) for name, help_text in COUNTERS)
+            self._values['stall_seconds'] = 0.0
+            self.write_latency.reset()
+
+    def record_write(self, nbytes, elapsed):
+        with self._lock:
+            self._values['writes'] += 1
+            self._values['bytes_written'] += nbytes
+            self.write_latency.observe(elapsed)
+
+    def record_error(self):
+        with self._lock:
+            self._values['errors'] += 1
+
+    def record_read(self, nbytes):
+        with self._lock:
+            self._values['reads'] += 1
+            self._values['bytes_read'] += nbytes
+
+    def record_retry(self):
+        with self._lock:
+            self._values['retries'] += 1
+
+    def record_reconnect(self):
+        with self._lock:
+            self._values['reconnects'] += 1
+
+    def record_stall(self, seconds):
+        with self._lock:
+            self._values['stall_seconds'] += seconds
+
+    def snapshot(self):
+        """A dictionary with every counter and the ``write_latency``
+        histogram (see :meth:`Histogram.snapshot`).
+        """
+        with self._lock:
+            data = dict(self._values)
+            data['write_latency'] = self.write_latency.snapshot()
+        data['type'] = self.type_name
+        data['connection'] = self.label
+        return data
+
+
+class MetricsRegistry(object):
+    """Holds the :class:`ConnectionMetrics` of every printer connected to.
+    """
+
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        super(MetricsRegistry, self).__init__()
+        self.buckets = buckets
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def get(self, type_name, label):
+        key = '{}:{}'.format(type_name, label)
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            with self._lock:
+                metrics = self._metrics.get(key)
+                if metrics is None:
+                    metrics = ConnectionMetrics(
+                            type_name,
+                            label,
+                            buckets=self.buckets)
+                    self._metrics[key] = metrics
+        return metrics
+
+    def clear(self):
+        with self._lock:
+            self._metrics.clear()
+
+    def snapshot(self):
+        """A dictionary mapping ``type:label`` keys (such as
+        ``network:10.0.0.5:9100``) to :meth:`ConnectionMetrics.snapshot`.
+        """
+        with self._lock:
+            items = list(self._metrics.items())
+        return dict((key, metrics.snapshot()) for key, metrics in items)
+
+    def prometheus_text(self, prefix=PROMETHEUS_PREFIX):
+        """All metrics in the Prometheus text exposition format."""
+        snapshots = [s for k, s in sorted(self.snapshot().items())]
+        lines = []
+        for name, help_text in COUNTERS:
+            metric = '{}_{}_total'.format(prefix, name)
+            lines.append('# HELP {} {}'.format(metric, help_text))
+            lines.append('# TYPE {} counter'.format(metric))
+            for data in snapshots:
+                lines.append('{}{{{}}} {}'.format(
+                        metric, _labels(data), _number(data[name])))
+        metric = '{}_write_duration_seconds'.format(prefix)
+        lines.append('# HELP {} Write latency, including retries.'.format(
+                metric))
+        lines.append('# TYPE {} histogram'.format(metric))
+        for data in snapshots:
+            labels = _labels(data)
+            histogram = data['write_latency']
+            for bound, count in histogram['buckets']:
+                lines.append('{}_bucket{{{},le="{}"}} {}'.format(
+                        metric, labels, _number(bound), count))
+            lines.append('{}_sum{{{}}} {}'.format(
+                    metric, labels, _number(histogram['sum'])))
+            lines.append('{}_count{{{}}} {}'.format(
+                    metric, labels, histogram['count']))
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+"""Default registry, used by all connections."""
+
+
+def connection_metrics(type_name, label):
+    """Return the :class:`ConnectionMetrics` for connections of the given
+    type (such as ``'network'``) to the printer identified by ``label``.
+    """
+    return registry.get(type_name, label)
+
+
+def snapshot():
+    """Snapshot of the default registry. See :meth:`MetricsRegistry.snapshot`.
+    """
+    return registry.snapshot()
+
+
+def prometheus_text(prefix=PROMETHEUS_PREFIX):
+    """Export the default registry in Prometheus text format."""
+    return registry.prometheus_text(prefix=prefix)
+
+
+def _labels(data):
+    return 'type="{}",connection="{}"'.format(
+            _escape(data['type']),
+            _escape(data['connection']))
+
+
+def _escape(value):
+    return (
+            '{}'.format(value)
+            .replace('\\', '\\\\')
+            .replace('"', '\\"')
+            .replace('\n', '\\n')
+        )
+
+
+def _number(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(value) if isinstance(value, float) else str(value)
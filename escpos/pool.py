@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/pool.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Pools of interchangeable printers.
+
+.. sourcecode:: python
+
+    from escpos.pool import PrinterPool
+
+    pool = PrinterPool({
+            'counter-1': TMT20(NetworkConnection.create('10.0.0.101:9100')),
+            'counter-2': TMT20(NetworkConnection.create('10.0.0.102:9100')),
+        })
+
+    pool.submit(['init', ('text', ('Order #1234',)), 'cut'])
+
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import itertools
+import logging
+import socket
+import threading
+import time
+
+from .exceptions import NoPrinterAvailableError
+from .exceptions import NonReadableSocketError
+from .exceptions import NonWritableSocketError
+from .exceptions import TimeoutException
+from .spool import DEFAULT_MAX_WORKERS
+from .spool import Spooler
+from .spool import run_job
+
+
+DEFAULT_MAX_FAILURES = 3
+"""Consecutive failures after which a member is taken out of the pool."""
+
+DEFAULT_EWMA_ALPHA = 0.3
+"""Weight of the last job duration in the member latency average."""
+
+DEVICE_ERRORS = (
+        socket.error,
+        IOError,
+        OSError,
+        NonReadableSocketError,
+        NonWritableSocketError,
+        TimeoutException,
+    )
+"""Exceptions that count as member failures. Any other exception raised by
+a job (such as a ``ValueError`` from a malformed operation) is blamed on the
+job, not on the printer.
+"""
+
+logger = logging.getLogger('escpos.pool')
+
+
+class PrinterPool(object):
+    """Groups equivalent printers and routes each job to the least busy
+    healthy member. How busy a member is comes from its number of pending
+    jobs times its recent job duration (an exponentially weighted moving
+    average), so a slower printer gets fewer jobs.
+
+    A member whose jobs fail ``max_failures`` times in a row (with one of
+    :const:`DEVICE_ERRORS`) is considered unhealthy and receives no more
+    jobs until :meth:`restore` is called. The job that failed is not retried
+    on another member; its future holds the exception.
+
+    Jobs are run by a :class:`~escpos.spool.Spooler` and may be anything it
+    accepts.
+
+    :param printers: Optional. A mapping of member names to printer
+        implementation instances.
+
+    :param int max_failures: Optional. Defaults to
+        :const:`DEFAULT_MAX_FAILURES`.
+
+    :param float ewma_alpha: Optional. Defaults to
+        :const:`DEFAULT_EWMA_ALPHA`.
+
+    :param int max_workers: Optional. Number of worker threads, which should
+        be at least the number of members. Defaults to the number of initial
+        members or :const:`~escpos.spool.DEFAULT_MAX_WORKERS`, whichever is
+        greater.
+
+    """
+
+    def __init__(
+            self,
+            printers=None,
+            max_failures=DEFAULT_MAX_FAILURES,
+            ewma_alpha=DEFAULT_EWMA_ALPHA,
+            max_workers=None):
+        super(PrinterPool, self).__init__()
+        printers = dict(printers or {})
+        self.max_failures = max_failures
+        self.ewma_alpha = ewma_alpha
+        self._spooler = Spooler(max_workers=max_workers or max(
+                len(printers),
+                DEFAULT_MAX_WORKERS))
+        self._lock = threading.Lock()
+        self._members = {}
+        self._sequence = itertools.count()
+        for name, printer in sorted(printers.items()):
+            self.add(name, printer)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown(wait=True)
+        return False
+
+    @property
+    def members(self):
+        """Names of all members, healthy or not."""
+        with self._lock:
+            return sorted(self._members.keys())
+
+    @property
+    def healthy(self):
+        """Names of members that can receive jobs."""
+        with self._lock:
+            return sorted(n for n, m in self._members.items() if m.healthy)
+
+    def add(self, name, printer):
+        with self._lock:
+            self._spooler.add_printer(name, printer)
+            self._members[name] = _Member(name)
+
+    def remove(self, name, release=True):
+        """Remove the member with the given name, returning its printer.
+        Jobs already routed to it are still run.
+        """
+        with self._lock:
+            del self._members[name]
+        return self._spooler.remove_printer(name, release=release)
+
+    def restore(self, name):
+        """Put an unhealthy member back in the pool, for example after the
+        printer has been fixed.
+        """
+        with self._lock:
+            member = self._members[name]
+            member.healthy = True
+            member.failures = 0
+
+    def stats(self):
+        """Returns a dictionary of member names to their statistics."""
+        with self._lock:
+            return dict((name, {
+                    'healthy': m.healthy,
+                    'pending': self._spooler.pending(name),
+                    'latency': m.latency,
+                    'jobs': m.jobs,
+                    'failures': m.failures,
+                }) for name, m in self._members.items())
+
+    def submit(self, job):
+        """Route a job to the least busy healthy member.
+
+        :returns: A :class:`concurrent.futures.Future`. See
+            :meth:`~escpos.spool.Spooler.submit`.
+
+        :raises NoPrinterAvailableError: If no member is healthy.
+
+        """
+        with self._lock:
+            member = self._choose()
+            member.last_chosen = next(self._sequence)
+        logger.debug('routing job to %r', member.name)
+        return self._spooler.submit(
+                member.name,
+                lambda printer: self._run(member, printer, job))
+
+    def shutdown(self, wait=True):
+        self._spooler.shutdown(wait=wait)
+
+    def _choose(self):
+        # must be called while holding the lock
+        candidates = [m for m in self._members.values() if m.healthy]
+        if not candidates:
+            raise NoPrinterAvailableError((
+                    'No healthy printer in pool (members: {})'
+                ).format(', '.join(sorted(self._members.keys())) or 'none'))
+
+        known = [m.latency for m in candidates if m.latency is not None]
+        default_latency = sum(known) / len(known) if known else 0.0
+        now = time.time()
+
+        def cost(member):
+            pending = self._spooler.pending(member.name)
+            latency = member.latency
+            if latency is None:
+                latency = default_latency
+            if member.started is not None:
+                # a job running for too long is a hint of a slow printer
+                latency = max(latency, now - member.started)
+            return (
+                    (pending + 1) * latency,
+                    pending,
+                    member.last_chosen,
+                )
+
+        return min(candidates, key=cost)
+
+    def _run(self, member, printer, job):
+        start = member.started = time.time()
+        try:
+            result = run_job(printer, job)
+        except DEVICE_ERRORS:
+            with self._lock:
+                member.started = None
+                member.failures += 1
+                if member.healthy and member.failures >= self.max_failures:
+                    member.healthy = False
+                    logger.warning(
+                            'printer %r removed from pool after %d '
+                            'consecutive failures',
+                            member.name,
+                            member.failures
+                        )
+            raise
+        except Exception:
+            with self._lock:
+                member.started = None
+            raise
+        elapsed = time.time() - start
+        with self._lock:
+            member.started = None
+            member.failures = 0
+            member.jobs += 1
+            if member.latency is None:
+                member.latency = elapsed
+            else:
+                member.latency += self.ewma_alpha * (elapsed - member.latency)
+        return result
+
+
+class _Member(object):
+
+    def __init__(self, name):
+        super(_Member, self).__init__()
+        self.name = name
+        self.healthy = True
+        self.failures = 0
+        self.jobs = 0
+        self.latency = None
+        self.started = None
+        self.last_chosen = -1
@@ -0,0 +1,637 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/raster.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Raster image conversion. Images are converted to a two-dimensional array
+of dots (where ``True`` means a dot to be printed) and then packed into the
+1-bit-per-pixel format expected by raster bit image commands.
+
+All operations are vectorized through `NumPy <https://numpy.org/>`_, which is
+required. `Pillow <https://python-pillow.org/>`_ is required to print Pillow
+images and for Floyd-Steinberg dithering.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import functools
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import threading
+
+from collections import OrderedDict
+
+import six
+
+from . import config
+
+try:
+    import numpy as np
+    _lib_numpy = True
+except ImportError:
+    # NumPy library is optional
+    _lib_numpy = False
+
+try:
+    from PIL import Image
+    _lib_pil = True
+except ImportError:
+    # Pillow library is optional
+    _lib_pil = False
+
+
+DITHER_THRESHOLD = 'threshold'
+DITHER_ORDERED = 'ordered'
+DITHER_FLOYD_STEINBERG = 'floyd-steinberg'
+
+DITHERING_MODES = (
+        (DITHER_THRESHOLD, 'Threshold (no dithering)'),
+        (DITHER_ORDERED, 'Ordered dithering (8x8 Bayer matrix)'),
+        (DITHER_FLOYD_STEINBERG, 'Floyd-Steinberg error diffusion'),
+    )
+"""Possible dithering modes for converting images to monochrome."""
+
+DEFAULT_THRESHOLD = 128
+"""Gray level (0 to 255) below which a pixel is printed as a dot."""
+
+DEFAULT_BAND_HEIGHT = 256
+"""Maximum number of rows sent in a single raster bit image command."""
+
+NV_GRAPHICS_MAX_WIDTH = 8192
+NV_GRAPHICS_MAX_HEIGHT = 2304
+
+
+def depends_on_numpy_lib(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _lib_numpy:
+            raise RuntimeError(
+                    'In order to print images you must install NumPy '
+                    'library. Alternatively you may want to install '
+                    'PyESCPOS using \'pip install pyescpos[image]\' to '
+                    'automatically install dependencies for images.'
+                )
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def depends_on_pil_lib(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _lib_pil:
+            raise RuntimeError(
+                    'This operation requires Pillow library. Alternatively '
+                    'you may want to install PyESCPOS using \'pip install '
+                    'pyescpos[image]\' to automatically install dependencies '
+                    'for images.'
+                )
+        return func(*args, **kwargs)
+    return wrapper
+
+
+@depends_on_numpy_lib
+def rasterize(
+        image,
+        width=None,
+        max_width=None,
+        dither=DITHER_THRESHOLD,
+        threshold=DEFAULT_THRESHOLD):
+    """Convert an image into a two-dimensional boolean array of dots.
+
+    :param image: A Pillow image or a NumPy array. Arrays may be boolean
+        (where ``True`` means a dot), grayscale (2D) or RGB/RGBA (3D) either
+        in integers ranging from 0 to 255 or floats ranging from 0 to 1.
+
+    :param int width: Optional. Width (in dots) to scale the image to,
+        preserving the aspect ratio.
+
+    :param int max_width: Optional. If image (or the given ``width``) is wider
+        than this, it will be scaled down to fit.
+
+    :param str dither: Optional. One of :attr:`DITHERING_MODES`.
+
+    :param int threshold: Optional. Gray level for :attr:`DITHER_THRESHOLD`.
+
+    :rtype: numpy.ndarray
+
+    """
+    if dither not in [k for k, v in DITHERING_MODES]:
+        raise ValueError('Unknown dithering mode: {!r}'.format(dither))
+
+    gray = to_grayscale(image)
+
+    width = width or gray.shape[1]
+    if max_width and width > max_width:
+        width = max_width
+
+    return monochrome(scale(gray, width), dither=dither, threshold=threshold)
+
+
+@depends_on_numpy_lib
+def to_grayscale(image):
+    """Convert an image to a two-dimensional array of gray levels (``uint8``)
+    where ``0`` is black and ``255`` is white.
+    """
+    if _lib_pil and isinstance(image, Image.Image):
+        if image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info:
+            # flatten transparent areas over a white background
+            rgba = image.convert('RGBA')
+            background = Image.new('RGBA', rgba.size, (255, 255, 255, 255))
+            image = Image.alpha_composite(background, rgba)
+        return np.asarray(image.convert('L'), dtype=np.uint8)
+
+    data = np.asarray(image)
+
+    if data.dtype == np.bool_:
+        return np.where(data, 0, 255).astype(np.uint8)
+
+    if data.dtype.kind == 'f':
+        data = data * 255.0
+
+    if data.ndim == 3:
+        data = data.astype(np.float64)
+        if data.shape[2] == 4:
+            alpha = data[:, :, 3:4] / 255.0
+            data = data[:, :, :3] * alpha + 255.0 * (1.0 - alpha)
+        # ITU-R 601-2 luma transform (same as Pillow)
+        data = data[:, :, :3].dot([0.299, 0.587, 0.114])
+
+    if data.ndim != 2:
+        raise ValueError((
+                'Cannot convert array of shape {!r} to an image'
+            ).format(data.shape))
+
+    return np.clip(np.rint(data), 0, 255).astype(np.uint8)
+
+
+@depends_on_numpy_lib
+def scale(gray, width):
+    """Scale a grayscale array to the given width (in dots) preserving its
+    aspect ratio. Downscaling averages the area covered by each dot, while
+    upscaling just repeats the nearest pixel.
+    """
+    height, image_width = gray.shape
+    if width == image_width:
+        return gray
+
+    if width < 1:
+        raise ValueError('Invalid image width: {!r}'.format(width))
+
+    new_height = max(1, int(round(height * width / float(image_width))))
+
+    if width < image_width:
+        row_starts = (np.arange(new_height) * height) // new_height
+        col_starts = (np.arange(width) * image_width) // width
+        row_counts = np.diff(np.append(row_starts, height))
+        col_counts = np.diff(np.append(col_starts, image_width))
+        sums = np.add.reduceat(
+                np.add.reduceat(gray.astype(np.uint32), row_starts, axis=0),
+                col_starts,
+                axis=1
+            )
+        area = np.outer(row_counts, col_counts)
+        return ((sums + area // 2) // area).astype(np.uint8)
+
+    rows = (np.arange(new_height) * height) // new_height
+    cols = (np.arange(width) * image_width) // width
+    return gray[rows[:, np.newaxis], cols]
+
+
+@depends_on_numpy_lib
+def monochrome(gray, dither=DITHER_THRESHOLD, threshold=DEFAULT_THRESHOLD):
+    """Convert a grayscale array to a boolean array of dots."""
+    if dither == DITHER_THRESHOLD:
+        return gray < threshold
+
+    if dither == DITHER_ORDERED:
+        height, width = gray.shape
+        tiles = (-(-height // 8), -(-width // 8))
+        matrix = np.tile(_bayer_threshold_map(), tiles)[:height, :width]
+        return gray < matrix
+
+    if dither == DITHER_FLOYD_STEINBERG:
+        return _floyd_steinberg(gray)
+
+    raise ValueError('Unknown dithering mode: {!r}'.format(dither))
+
+
+@depends_on_numpy_lib
+def pack(dots):
+    """Pack a boolean array of dots into rows of bytes (most significant bit
+    first), padding each row to a whole number of bytes.
+
+    :returns: A tuple containing the number of bytes per row, the number of
+        rows and the packed data.
+
+    :rtype: tuple
+
+    """
+    packed = np.packbits(dots.astype(np.uint8), axis=1)
+    rows, bytes_per_row = packed.shape
+    return bytes_per_row, rows, packed.tobytes()
+
+
+@depends_on_numpy_lib
+def gs_v_0(dots, band_height=DEFAULT_BAND_HEIGHT, mode=0):
+    """Build ``GS v 0`` raster bit image commands for the given dots, one
+    command for each band of at most ``band_height`` rows, so that large
+    images do not overflow the printer receive buffer.
+
+    :param dots: A two-dimensional boolean array, as returned by
+        :func:`rasterize`.
+
+    :param int band_height: Optional. Maximum number of rows per command.
+
+    :param int mode: Optional. Raster bit image mode: ``0`` (normal),
+        ``1`` (double width), ``2`` (double height) or ``3`` (quadruple).
+
+    :return: A list of commands (bytes), ready to be sent to the device.
+    :rtype: list
+
+    """
+    if mode not in range(4):
+        raise ValueError('Invalid raster bit image mode: {!r}'.format(mode))
+
+    commands = []
+    for start in range(0, dots.shape[0], band_height):
+        bytes_per_row, rows, data = pack(dots[start:start + band_height])
+        commands.append(
+                b'\x1D\x76\x30'  # GS v 0
+                + six.int2byte(mode)
+                + struct.pack('<HH', bytes_per_row, rows)  # xL xH yL yH
+                + data
+            )
+    return commands
+
+
+class RasterCache(object):
+    """A thread-safe, size-bounded LRU cache of encoded raster commands,
+    so that images printed over and over again (like store logos) are
+    converted and packed just once.
+
+    :param int max_bytes: Optional. Memory budget for cached commands (in
+        bytes). Least recently used entries are evicted when the budget is
+        exceeded. Defaults to :attr:`escpos.config.RASTER_CACHE_MAX_BYTES`.
+
+    :param str directory: Optional. A directory where encoded commands are
+        persisted as well, so they survive across processes. Entries found
+        on disk are loaded back into memory. The directory is never pruned.
+
+    """
+
+    def __init__(self, max_bytes=None, directory=None):
+        super(RasterCache, self).__init__()
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._size = 0
+        self.max_bytes = config.RASTER_CACHE_MAX_BYTES \
+            if max_bytes is None else max_bytes
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self):
+        """Number of bytes currently held in memory."""
+        return self._size
+
+    def stats(self):
+        """Returns a dictionary of counters for tuning the cache."""
+        with self._lock:
+            return dict(
+                    hits=self.hits,
+                    misses=self.misses,
+                    disk_hits=self.disk_hits,
+                    entries=len(self._entries),
+                    size=self._size,
+                    max_bytes=self.max_bytes
+                )
+
+    def get(self, key):
+        """Returns cached data for the given key or ``None``."""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries[key] = self._entries.pop(key)  # most recent
+                self.hits += 1
+                return data
+
+        data = self._load(key)
+        with self._lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.disk_hits += 1
+                self._store(key, data)
+        return data
+
+    def put(self, key, data):
+        with self._lock:
+            self._store(key, data)
+        self._save(key, data)
+
+    def clear(self):
+        """Evicts all entries from memory and resets counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = self.misses = self.disk_hits = 0
+
+    def _store(self, key, data):
+        if key in self._entries:
+            self._size -= len(self._entries.pop(key))
+        if len(data) > self.max_bytes:
+            return  # would evict everything else and still not fit
+        self._entries[key] = data
+        self._size += len(data)
+        while self._size > self.max_bytes:
+            self._size -= len(self._entries.popitem(last=False)[1])
+
+    def _filename(self, key):
+        name = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, name + '.bin')
+
+    def _load(self, key):
+        if self.directory is None:
+            return None
+        try:
+            with open(self._filename(key), 'rb') as f:
+                return f.read()
+        except (IOError, OSError):
+            return None
+
+    def _save(self, key, data):
+        if self.directory is None:
+            return
+        # write to a temporary file then rename, so that concurrent readers
+        # never find a partially written file
+        fd, temp_name = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            _replace(temp_name, self._filename(key))
+        except (IOError, OSError):
+            if os.path.exists(temp_name):
+                os.remove(temp_name)
+
+
+cache = RasterCache()
+"""Raster cache shared by all printers in the process."""
+
+
+@depends_on_numpy_lib
+def digest(image, *params):
+    """Returns a hexadecimal digest of the image contents, suitable for
+    identifying images whose contents are exactly the same, optionally along
+    with the given conversion parameters (such as width and dithering), so
+    the same image converted differently gets a different digest.
+    """
+    h = hashlib.sha1()
+    if params:
+        h.update(':'.join(str(p) for p in params).encode('utf-8'))
+    if _lib_pil and isinstance(image, Image.Image):
+        h.update('{}:{!r}:'.format(image.mode, image.size).encode('ascii'))
+        h.update(image.tobytes())
+    else:
+        data = np.ascontiguousarray(image)
+        h.update('{}:{!r}:'.format(data.dtype.str, data.shape).encode('ascii'))
+        h.update(data.tobytes())
+    return h.hexdigest()
+
+
+def encode(
+        image,
+        width=None,
+        max_width=None,
+        dither=DITHER_THRESHOLD,
+        threshold=DEFAULT_THRESHOLD,
+        band_height=DEFAULT_BAND_HEIGHT,
+        cache=None):
+    """Rasterize an image and build its ``GS v 0`` commands as a single
+    chunk of bytes, looking them up in the given cache first. See
+    :func:`rasterize` for details on arguments.
+
+    :param cache: Optional. A :class:`RasterCache` instance. Defaults to
+        ``None``, which means no cache at all.
+
+    :rtype: bytes
+
+    """
+    key = None
+    if cache is not None:
+        key = (digest(image), width, max_width, dither, threshold, band_height)
+        data = cache.get(key)
+        if data is not None:
+            return data
+
+    dots = rasterize(
+            image,
+            width=width,
+            max_width=max_width,
+            dither=dither,
+            threshold=threshold
+        )
+    data = b''.join(gs_v_0(dots, band_height=band_height))
+
+    if cache is not None:
+        cache.put(key, data)
+
+    return data
+
+
+@depends_on_numpy_lib
+def gs_l_define_nv_graphics(key, dots):
+    """Build the ``GS ( L`` (function 67) command that stores the given
+    dots as monochrome raster graphics in the printer non-volatile memory,
+    under the given key code. Switches to ``GS 8 L`` for data that does not
+    fit the two-byte parameter length.
+
+    :param key: Two characters key code, each ranging from 32 to 126, as
+        :func:`nv_graphics_key` would accept.
+
+    :param dots: A two-dimensional boolean array, as returned by
+        :func:`rasterize`.
+
+    :rtype: bytes
+
+    """
+    kc = nv_graphics_key(key)
+    height, width = dots.shape
+    if not (1 <= width <= NV_GRAPHICS_MAX_WIDTH
+            and 1 <= height <= NV_GRAPHICS_MAX_HEIGHT):
+        raise ValueError((
+                'NV graphics must be up to {}x{} dots; got {}x{}'
+            ).format(
+                NV_GRAPHICS_MAX_WIDTH,
+                NV_GRAPHICS_MAX_HEIGHT,
+                width,
+                height
+            ))
+
+    bytes_per_row, rows, data = pack(dots)
+    params = (
+            b'\x30\x43\x30'  # m=48, fn=67, a=48 (monochrome)
+            + kc
+            + b'\x01'  # b (number of colors)
+            + struct.pack('<HH', width, height)  # xL xH yL yH
+            + b'\x31'  # c (color 1)
+            + data
+        )
+    if len(params) <= 0xFFFF:
+        return b'\x1D\x28\x4C' + struct.pack('<H', len(params)) + params
+    return b'\x1D\x38\x4C' + struct.pack('<I', len(params)) + params
+
+
+def gs_l_print_nv_graphics(key, double_width=False, double_height=False):
+    """Build the ``GS ( L`` (function 69) command that prints NV graphics
+    stored under the given key code.
+
+    :rtype: bytes
+
+    """
+    return (
+            b'\x1D\x28\x4C\x06\x00\x30\x45'  # GS ( L pL pH m fn
+            + nv_graphics_key(key)
+            + (b'\x02' if double_width else b'\x01')
+            + (b'\x02' if double_height else b'\x01')
+        )
+
+
+def gs_l_delete_nv_graphics(key):
+    """Build the ``GS ( L`` (function 66) command that deletes NV graphics
+    stored under the given key code.
+
+    :rtype: bytes
+
+    """
+    return b'\x1D\x28\x4C\x04\x00\x30\x42' + nv_graphics_key(key)
+
+
+def nv_graphics_key(key):
+    """Validate a NV graphics key code returning it as bytes. A key code is
+    made of two characters (or bytes) ranging from 32 to 126, for example
+    ``'LG'``.
+    """
+    kc = key.encode('ascii') if isinstance(key, six.text_type) else key
+    if len(kc) != 2 or not all(32 <= b <= 126 for b in bytearray(kc)):
+        raise ValueError('Invalid NV graphics key code: {!r}'.format(key))
+    return bytes(kc)
+
+
+class NVGraphicsRegistry(object):
+    """Remembers which image (by its :func:`digest`) is stored under which
+    key code in the non-volatile memory of each printer, so that graphics are
+    uploaded only when their contents change. Printers are identified by an
+    arbitrary string, usually the connection string.
+
+    :param str filename: Optional. A JSON file where the registry is
+        persisted, since graphics stored in non-volatile memory outlive the
+        process. If the file exists, its contents are loaded.
+
+    """
+
+    def __init__(self, filename=None):
+        super(NVGraphicsRegistry, self).__init__()
+        self._lock = threading.Lock()
+        self._printers = {}
+        self.filename = filename
+        if filename is not None and os.path.exists(filename):
+            with open(filename, 'r') as f:
+                self._printers = json.load(f)
+
+    def get(self, printer_id, key):
+        """Returns the digest of the image stored under the given key code
+        or ``None`` if it is unknown.
+        """
+        with self._lock:
+            return self._printers.get(printer_id, {}).get(_key_str(key))
+
+    def set(self, printer_id, key, digest):
+        with self._lock:
+            self._printers.setdefault(printer_id, {})[_key_str(key)] = digest
+            self._save()
+
+    def discard(self, printer_id, key=None):
+        """Forget the given key code or, if not specified, everything known
+        about the given printer (for example, after a printer replacement).
+        """
+        with self._lock:
+            if key is None:
+                self._printers.pop(printer_id, None)
+            else:
+                self._printers.get(printer_id, {}).pop(_key_str(key), None)
+            self._save()
+
+    def _save(self):
+        if self.filename is None:
+            return
+        temp_name = self.filename + '.tmp'
+        with open(temp_name, 'w') as f:
+            json.dump(self._printers, f, indent=2, sort_keys=True)
+        _replace(temp_name, self.filename)
+
+
+nv_registry = NVGraphicsRegistry()
+"""NV graphics registry shared by all printers in the process."""
+
+
+def _key_str(key):
+    return nv_graphics_key(key).decode('ascii')
+
+
+def _replace(source, target):
+    # os.rename() does not overwrite existing files on Windows and Python 2
+    # has no os.replace(), so there the target is removed and the rename is
+    # tried again, which is not atomic, but the best that can be done
+    replace = getattr(os, 'replace', None)
+    if replace is not None:
+        replace(source, target)
+        return
+    try:
+        os.rename(source, target)
+    except OSError:
+        if not os.path.exists(target):
+            raise
+        os.remove(target)
+        os.rename(source, target)
+
+
+def _bayer_threshold_map():
+    matrix = np.array([[0, 2], [3, 1]])
+    while matrix.shape[0] < 8:
+        matrix = np.block([
+                [4 * matrix, 4 * matrix + 2],
+                [4 * matrix + 3, 4 * matrix + 1],
+            ])
+    return (matrix + 0.5) * (256.0 / matrix.size)
+
+
+@depends_on_pil_lib
+def _floyd_steinberg(gray):
+    # Pillow error diffusion runs in C, much faster than any Python loop;
+    # in the resulting image, white pixels are true
+    image = Image.fromarray(gray).convert('1')
+    return ~np.asarray(image, dtype=np.bool_)
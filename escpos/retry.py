@@ -24,6 +24,7 @@ import logging
 import time
 
 from . import constants
+from . import tracing
 
 
 logger = logging.getLogger('escpos.retry')
@@ -83,20 +84,7 @@ def backoff(
     :type exceptions: tuple[Exception]
 
     """
-    if max_tries <= 0:
-        raise ValueError((
-                'Max tries must be greater than 0; got {!r}'
-            ).format(max_tries))
-
-    if delay <= 0:
-        raise ValueError((
-                'Delay must be greater than 0; got {!r}'
-            ).format(delay))
-
-    if factor <= 1:
-        raise ValueError((
-                'Backoff factor must be greater than 1; got {!r}'
-            ).format(factor))
+    _validate_backoff_args(max_tries, delay, factor)
 
     def outter(f):
         def inner(*args, **kwargs):
@@ -120,9 +108,11 @@ def backoff(
                                 delay,
                                 factor
                             )
-                        before_delay_handler(ex)
-                        time.sleep(m_delay)  # wait...
-                        after_delay_handler(ex)
+                        tracing.record_retry()
+                        with tracing.span('backoff', delay=m_delay):
+                            before_delay_handler(ex)
+                            time.sleep(m_delay)  # wait...
+                            after_delay_handler(ex)
                         m_delay *= factor  # make future wait longer
                     else:
                         # exception handler gave up
@@ -132,3 +122,20 @@ def backoff(
                     return retval
         return inner
     return outter
+
+
+def _validate_backoff_args(max_tries, delay, factor):
+    if max_tries <= 0:
+        raise ValueError((
+                'Max tries must be greater than 0; got {!r}'
+            ).format(max_tries))
+
+    if delay <= 0:
+        raise ValueError((
+                'Delay must be greater than 0; got {!r}'
+            ).format(delay))
+
+    if factor <= 1:
+        raise ValueError((
+                'Backoff factor must be greater than 1; got {!r}'
+            ).format(factor))
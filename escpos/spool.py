@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/spool.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Print spooler. Jobs are run on a bounded pool of worker threads, so the
+caller never waits for printer I/O, while jobs for the same printer are
+always run one at a time, in the order they were submitted.
+
+.. sourcecode:: python
+
+    from escpos.spool import Spooler
+
+    spooler = Spooler(max_workers=4)
+    spooler.add_printer('kitchen', TMT20(conn))
+
+    future = spooler.submit('kitchen', [
+            'init',
+            ('text', ('Order #1234',)),
+            'cut',
+        ])
+
+    future.result(timeout=30)  # only if you really want to wait for it
+
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import logging
+import threading
+
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+
+import six
+
+from .impl.epson import _apply_operation
+
+
+DEFAULT_MAX_WORKERS = 4
+
+logger = logging.getLogger('escpos.spool')
+
+
+class Spooler(object):
+    """Runs print jobs on a bounded pool of worker threads with strict
+    per-printer ordering. The spooler owns the printers (and so their
+    connections) added to it, releasing them on :meth:`shutdown`.
+
+    A job may be one of:
+
+    * compiled ESC/POS commands (bytes), as returned by
+      :meth:`~escpos.impl.epson.GenericESCPOS.compile`, which are written
+      straight to the printer device;
+
+    * a list of operations, in the same form accepted by
+      :meth:`~escpos.impl.epson.GenericESCPOS.compile`, which are run on the
+      printer in buffered mode, resulting in a single write;
+
+    * a callable that will be called with the printer instance as its only
+      argument.
+
+    :param int max_workers: Optional. Maximum number of worker threads, which
+        is also the maximum number of printers being written to at the same
+        time. Defaults to :const:`DEFAULT_MAX_WORKERS`.
+
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS):
+        super(Spooler, self).__init__()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._queues = {}
+        self._running = set()
+        self._shutdown = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown(wait=True)
+        return False
+
+    @property
+    def printers(self):
+        """Names of the printers known to this spooler."""
+        with self._lock:
+            return sorted(self._queues.keys())
+
+    def add_printer(self, name, printer):
+        """Add a printer (an implementation instance) under the given name.
+
+        :raises ValueError: If there is already a printer with that name.
+        """
+        with self._lock:
+            if name in self._queues:
+                raise ValueError((
+                        'Printer {!r} already added to spooler'
+                    ).format(name))
+            self._queues[name] = _PrinterQueue(name, printer)
+
+    def remove_printer(self, name, release=True):
+        """Remove the printer with the given name, returning it. Jobs already
+        submitted are still run. If ``release`` is true (the default) the
+        printer device will be released after the last pending job.
+        """
+        with self._lock:
+            queue = self._queues.pop(name)
+        if release:
+            queue.closing = True
+            self._release_if_idle(queue)
+        return queue.printer
+
+    def get_printer(self, name):
+        with self._lock:
+            return self._queues[name].printer
+
+    def pending(self, name):
+        """Number of jobs submitted to the given printer that have not been
+        completed yet, including the one running, if any.
+        """
+        with self._lock:
+            return self._queues[name].depth
+
+    def submit(self, name, job):
+        """Submit a job to the printer with the given name.
+
+        :returns: A :class:`concurrent.futures.Future` which will hold the
+            job result (the return value of a callable job, otherwise
+            ``None``) or the exception raised while running the job.
+
+        :raises KeyError: If there is no printer with the given name.
+
+        :raises RuntimeError: If the spooler has been shut down.
+
+        """
+        future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError('Cannot submit jobs after shutdown')
+            queue = self._queues[name]
+            queue.jobs.append((job, future))
+            queue.depth += 1
+            schedule = not queue.running
+            queue.running = True
+            self._running.add(queue)
+        if schedule:
+            self._executor.submit(self._run_next, queue)
+        return future
+
+    def shutdown(self, wait=True):
+        """Stop accepting jobs and release every printer device. If ``wait``
+        is true (the default) pending jobs are run before it returns,
+        otherwise jobs not started yet may be cancelled.
+        """
+        with self._lock:
+            self._shutdown = True
+            while wait and self._running:
+                self._idle.wait()
+            queues = list(self._queues.values())
+            self._queues.clear()
+        self._executor.shutdown(wait=wait)
+        for queue in queues:
+            queue.closing = True
+            self._release_if_idle(queue)
+
+    def _run_next(self, queue):
+        # runs a single job and then schedules the next one (instead of
+        # draining the queue) so that a busy printer does not keep a worker
+        # thread away from other printers
+        with self._lock:
+            job, future = queue.jobs.popleft()
+
+        if future.set_running_or_notify_cancel():
+            try:
+                result = run_job(queue.printer, job)
+            except Exception as ex:
+                logger.exception('job failed for printer %r', queue.name)
+                future.set_exception(ex)
+            else:
+                future.set_result(result)
+
+        with self._lock:
+            queue.depth -= 1
+            if queue.jobs:
+                schedule = True
+            else:
+                schedule = queue.running = False
+                self._set_idle(queue)
+
+        if schedule:
+            try:
+                self._executor.submit(self._run_next, queue)
+            except RuntimeError:
+                # executor has been shut down without waiting
+                self._cancel_pending(queue)
+        else:
+            self._release_if_idle(queue)
+
+    def _cancel_pending(self, queue):
+        with self._lock:
+            jobs = list(queue.jobs)
+            queue.jobs.clear()
+            queue.depth -= len(jobs)
+            queue.running = False
+            self._set_idle(queue)
+        for job, future in jobs:
+            future.cancel()
+        self._release_if_idle(queue)
+
+    def _set_idle(self, queue):
+        # must be called while holding the lock
+        self._running.discard(queue)
+        if not self._running:
+            self._idle.notify_all()
+
+    def _release_if_idle(self, queue):
+        with self._lock:
+            if not queue.closing or queue.running or queue.released:
+                return
+            queue.released = True
+        release(queue.printer.device)
+
+
+class _PrinterQueue(object):
+
+    def __init__(self, name, printer):
+        super(_PrinterQueue, self).__init__()
+        self.name = name
+        self.printer = printer
+        self.jobs = deque()
+        self.depth = 0
+        self.running = False
+        self.closing = False
+        self.released = False
+
+
+def run_job(printer, job):
+    """Run a single job on the given printer. See :class:`Spooler` for the
+    possible kinds of jobs.
+    """
+    if isinstance(job, (bytes, bytearray)):
+        printer.device.write(bytes(job))
+        return None
+    if callable(job):
+        return job(printer)
+    if isinstance(job, six.string_types):
+        raise ValueError((
+                'Expecting bytes, list of operations or callable; '
+                'got text {!r}'
+            ).format(job))
+    with printer.buffered():
+        for operation in job:
+            _apply_operation(printer, operation)
+    return None
+
+
+def release(device):
+    """Release a connection, whatever is its flavour."""
+    for name in ('release', 'close'):
+        method = getattr(device, name, None)
+        if method is not None:
+            try:
+                method()
+            except Exception:
+                logger.exception('cannot release device %r', device)
+            return
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/status.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Real-time printer status, as answered to ``DLE EOT n`` commands.
+
+Real-time commands are executed by the printer as soon as they are received,
+even if the printer is offline or out of paper, so they are the way to ask
+whether a printer is able to print at all.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import logging
+import threading
+import time
+
+from collections import namedtuple
+
+
+DLE_EOT_PRINTER = b'\x10\x04\x01'
+DLE_EOT_OFFLINE_CAUSE = b'\x10\x04\x02'
+DLE_EOT_ERROR_CAUSE = b'\x10\x04\x03'
+DLE_EOT_PAPER_SENSOR = b'\x10\x04\x04'
+
+DLE_EOT_QUERY = (
+        DLE_EOT_PRINTER
+        + DLE_EOT_OFFLINE_CAUSE
+        + DLE_EOT_ERROR_CAUSE
+        + DLE_EOT_PAPER_SENSOR
+    )
+"""The four status requests, sent at once by
+:meth:`~escpos.impl.epson.GenericESCPOS.status`.
+"""
+
+DEFAULT_POLLING_INTERVAL = 5.0
+
+logger = logging.getLogger('escpos.status')
+
+
+PrinterStatus = namedtuple('PrinterStatus', [
+        # DLE EOT 1 (printer status)
+        'online',
+        'drawer_pin_high',  # drawer kick-out connector pin 3
+        'waiting_online_recovery',
+        'feed_button_pressed',
+        # DLE EOT 2 (offline cause)
+        'cover_open',
+        'paper_fed_by_button',
+        'stopped_by_paper_end',
+        'error',
+        # DLE EOT 3 (error cause)
+        'autocutter_error',
+        'unrecoverable_error',
+        'auto_recoverable_error',
+        # DLE EOT 4 (roll paper sensor)
+        'paper_near_end',
+        'paper_end',
+        # the four status bytes, as received
+        'raw',
+    ])
+
+
+ASBStatus = namedtuple('ASBStatus', [
+        # first byte
+        'online',
+        'drawer_pin_high',
+        'cover_open',
+        'feed_button_pressed',
+        # second byte
+        'autocutter_error',
+        'unrecoverable_error',
+        'auto_recoverable_error',
+        # third byte
+        'paper_near_end',
+        'paper_end',
+        # the four status bytes, as received
+        'raw',
+    ])
+
+
+def is_status_byte(value):
+    """Whether the given byte value has the fixed bits of a ``DLE EOT``
+    answer (bits 1 and 4 set, bits 0 and 7 not set).
+    """
+    return value & 0x93 == 0x12
+
+
+def parse(data):
+    """Parse the answers to the four requests in :const:`DLE_EOT_QUERY`,
+    returning a :class:`PrinterStatus` or ``None`` if the data is not a valid
+    answer.
+
+    :param bytes data: Four bytes, answering ``DLE EOT`` 1 to 4, in order.
+
+    """
+    values = bytearray(data or b'')
+    if len(values) != 4 or not all(is_status_byte(v) for v in values):
+        return None
+    printer, offline, error, paper = values
+    return PrinterStatus(
+            online=not printer & 0x08,
+            drawer_pin_high=bool(printer & 0x04),
+            waiting_online_recovery=bool(printer & 0x20),
+            feed_button_pressed=bool(printer & 0x40),
+            cover_open=bool(offline & 0x04),
+            paper_fed_by_button=bool(offline & 0x08),
+            stopped_by_paper_end=bool(offline & 0x20),
+            error=bool(offline & 0x40),
+            autocutter_error=bool(error & 0x08),
+            unrecoverable_error=bool(error & 0x20),
+            auto_recoverable_error=bool(error & 0x40),
+            paper_near_end=bool(paper & 0x0C),
+            paper_end=bool(paper & 0x60),
+            raw=bytes(values),
+        )
+
+
+def is_asb_header(value):
+    """Whether the given byte value has the fixed bits of the first byte of
+    an Automatic Status Back (``GS a``) status (bit 4 set, bits 0, 1 and 7
+    not set). Since answers to ``DLE EOT`` always have bit 1 set, this tells
+    unsolicited statuses apart from those answers.
+    """
+    return value & 0x93 == 0x10
+
+
+def is_asb_byte(value):
+    """Whether the given byte value has the fixed bits of the second to
+    fourth bytes of an Automatic Status Back status (bits 4 and 7 not set).
+    """
+    return value & 0x90 == 0x00
+
+
+def parse_asb(data):
+    """Parse the four bytes of an Automatic Status Back status, returning an
+    :class:`ASBStatus` or ``None`` if the data is not a valid status.
+    """
+    values = bytearray(data or b'')
+    if (len(values) != 4
+            or not is_asb_header(values[0])
+            or not all(is_asb_byte(v) for v in values[1:])):
+        return None
+    first, second, third = values[:3]
+    return ASBStatus(
+            online=not first & 0x08,
+            drawer_pin_high=bool(first & 0x04),
+            cover_open=bool(first & 0x20),
+            feed_button_pressed=bool(first & 0x40),
+            autocutter_error=bool(second & 0x08),
+            unrecoverable_error=bool(second & 0x20),
+            auto_recoverable_error=bool(second & 0x40),
+            paper_near_end=bool(third & 0x03),
+            paper_end=bool(third & 0x0C),
+            raw=bytes(values),
+        )
+
+
+class StatusPoller(object):
+    """Refreshes the status of a printer on a background thread, so callers
+    can check the last known status without any I/O, for example to skip
+    offline printers right away.
+
+    .. sourcecode:: python
+
+        poller = StatusPoller(printer, interval=10)
+        poller.start()
+        ...
+        if poller.available:
+            printer.text('Hello World!')
+
+    Since status requests share the printer connection, if the printer is
+    used by other threads give the poller the same lock those threads hold
+    while printing.
+
+    :param printer: A printer implementation instance.
+
+    :param float interval: Optional. Time (in seconds) between refreshes.
+
+    :param lock: Optional. A lock acquired around each status request.
+
+    :param float timeout: Optional. Passed to
+        :meth:`~escpos.impl.epson.GenericESCPOS.status`.
+
+    """
+
+    def __init__(
+            self,
+            printer,
+            interval=DEFAULT_POLLING_INTERVAL,
+            lock=None,
+            timeout=1.0):
+        super(StatusPoller, self).__init__()
+        self.printer = printer
+        self.interval = interval
+        self.lock = lock
+        self.timeout = timeout
+        self._status = None
+        self._updated_at = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def status(self):
+        """Last known :class:`PrinterStatus` or ``None`` if the printer did
+        not answer the last request.
+        """
+        return self._status
+
+    @property
+    def updated_at(self):
+        """Time (as given by :func:`time.time`) of the last refresh or
+        ``None`` if no refresh has been made yet.
+        """
+        return self._updated_at
+
+    @property
+    def available(self):
+        """Whether the printer was last known to be online, with no errors
+        and with paper.
+        """
+        status = self._status
+        return (
+                status is not None
+                and status.online
+                and not status.error
+                and not status.paper_end
+            )
+
+    def is_fresh(self, max_age):
+        """Whether the last refresh was made at most ``max_age`` seconds ago.
+        """
+        return (
+                self._updated_at is not None
+                and time.time() - self._updated_at <= max_age
+            )
+
+    def refresh(self):
+        """Request the printer status right now, returning it."""
+        try:
+            if self.lock is None:
+                status = self.printer.status(timeout=self.timeout)
+            else:
+                with self.lock:
+                    status = self.printer.status(timeout=self.timeout)
+        except Exception:
+            logger.exception('cannot get status from %r', self.printer)
+            status = None
+        self._status = status
+        self._updated_at = time.time()
+        return status
+
+    def start(self):
+        if self._thread is not None:
+            raise RuntimeError('Status poller already started')
+        self._stop.clear()
+        self._thread = threading.Thread(
+                target=self._run,
+                name='escpos-status-poller')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.refresh()
+            self._stop.wait(self.interval)
@@ -0,0 +1,386 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/tracing.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tracing of printer commands and connection operations as timed spans.
+
+Tracing is off by default and costs nothing while off, since printers are
+only instrumented when a tracer is set before they are created:
+
+.. sourcecode:: python
+
+    from escpos import tracing
+
+    tracing.set_tracer(tracing.SlowOperationReporter(threshold=0.5))
+
+    printer = GenericESCPOS(conn)
+    with tracing.span('receipt'):
+        printer.text('Hello World!')
+        printer.qrcode('https://github.com/base4sistemas/pyescpos')
+        printer.cut()
+
+Every public method of the printer (such as ``escpos.qrcode``) and every
+``catch``, ``write`` and ``read`` of its connection (such as
+``network.write``) becomes a span, as do the internal waits that usually
+explain slow jobs: ``completion.wait`` (barcodes and QRCodes), ``backoff``
+(delay between retries), ``network.select`` (waiting for the socket to be
+writable or readable) and ``serial.wait_to_write`` (flow control). Spans
+nest, so the time of a job adds up from its commands.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import functools
+import inspect
+import logging
+import threading
+import time
+
+try:
+    from opentelemetry import trace as _otel_trace
+    _lib_opentelemetry = True
+except ImportError:
+    # OpenTelemetry API is optional
+    _lib_opentelemetry = False
+
+
+logger = logging.getLogger('escpos.tracing')
+
+UNTRACED_METHODS = frozenset(['buffered'])
+"""Public printer methods that are not turned into spans."""
+
+CONNECTION_METHODS = ('catch', 'write', 'read')
+
+_tracer = None
+
+_local = threading.local()
+
+
+def depends_on_opentelemetry_lib(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _lib_opentelemetry:
+            raise RuntimeError(
+                    'In order to export spans to OpenTelemetry you must '
+                    'install the OpenTelemetry API. Alternatively you may '
+                    'want to install PyESCPOS using \'pip install '
+                    'pyescpos[tracing]\' to automatically install '
+                    'dependencies for tracing.'
+                )
+        return func(*args, **kwargs)
+    return wrapper
+
+
+class Span(object):
+    """A timed operation. Spans are created through :func:`span` and are
+    given to the tracer when they start and when they finish.
+    """
+
+    def __init__(self, tracer, name, attributes, parent=None):
+        super(Span, self).__init__()
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        self.parent = parent
+        self.bytes = None
+        """Number of bytes written or read, if any."""
+
+        self.retries = 0
+        """Number of backoff retries made within this span."""
+
+        self.error = None
+        """The exception that ended this span, if any."""
+
+        self.start_time = None
+        self.end_time = None
+        self.context = None
+        """Free for the tracer to keep anything along with the span."""
+
+    def __repr__(self):
+        return '{}({!r}, duration={!r}, bytes={!r}, retries={!r})'.format(
+                self.__class__.__name__,
+                self.name,
+                self.duration,
+                self.bytes,
+                self.retries
+            )
+
+    def __enter__(self):
+        self.start_time = time.time()
+        _local.span = self
+        self.tracer.start(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.end_time = time.time()
+        if exc_value is not None:
+            self.error = exc_value
+        _local.span = self.parent
+        self.tracer.finish(self)
+        return False
+
+    @property
+    def duration(self):
+        """Time (in seconds) the span took, or ``None`` if not finished."""
+        if self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+
+class _NoOpSpan(object):
+    # what span() gives while tracing is off
+
+    name = None
+    attributes = {}
+    bytes = None
+    retries = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def set_attribute(self, key, value):
+        pass
+
+
+_NOOP_SPAN = _NoOpSpan()
+
+
+class Tracer(object):
+    """Base tracer, which does nothing. Subclasses override :meth:`start`
+    and :meth:`finish`, which are called in the thread running the span.
+    """
+
+    def start(self, span):
+        pass
+
+    def finish(self, span):
+        pass
+
+
+class CallbackTracer(Tracer):
+    """Calls ``on_finish`` (and ``on_start``, if given) with every span.
+
+    .. sourcecode:: python
+
+        tracing.set_tracer(tracing.CallbackTracer(spans.append))
+
+    """
+
+    def __init__(self, on_finish, on_start=None):
+        super(CallbackTracer, self).__init__()
+        self.on_finish = on_finish
+        self.on_start = on_start
+
+    def start(self, span):
+        if self.on_start is not None:
+            self.on_start(span)
+
+    def finish(self, span):
+        self.on_finish(span)
+
+
+class SlowOperationReporter(Tracer):
+    """Logs every span that takes longer than ``threshold`` seconds.
+
+    :param float threshold: Optional. Minimum duration (in seconds) of spans
+        to be logged.
+
+    :param logger: Optional. Logger to log to. Defaults to the
+        ``escpos.tracing`` logger.
+
+    :param int level: Optional. Logging level. Defaults to ``WARNING``.
+
+    """
+
+    def __init__(self, threshold=1.0, logger=None, level=logging.WARNING):
+        super(SlowOperationReporter, self).__init__()
+        self.threshold = threshold
+        self.logger = logger or logging.getLogger('escpos.tracing')
+        self.level = level
+
+    def finish(self, span):
+        if span.duration < self.threshold:
+            return
+        self.logger.log(
+                self.level,
+                'slow %s: %.3fs (bytes=%r, retries=%r, within=%r%s)',
+                span.name,
+                span.duration,
+                span.bytes,
+                span.retries,
+                span.parent.name if span.parent is not None else None,
+                ', error={!r}'.format(span.error) if span.error else ''
+            )
+
+
+class OpenTelemetryTracer(Tracer):
+    """Exports spans to OpenTelemetry, through the OpenTelemetry API. Spans
+    started inside an OpenTelemetry span (of your application, for
+    instance) become its children.
+
+    :param tracer: Optional. An OpenTelemetry tracer. Defaults to the one
+        given by the global tracer provider.
+
+    """
+
+    @depends_on_opentelemetry_lib
+    def __init__(self, tracer=None):
+        super(OpenTelemetryTracer, self).__init__()
+        self.tracer = tracer or _otel_trace.get_tracer('escpos')
+
+    def start(self, span):
+        context = None
+        if span.parent is not None and span.parent.context is not None:
+            context = _otel_trace.set_span_in_context(span.parent.context)
+        span.context = self.tracer.start_span(
+                span.name,
+                context=context,
+                attributes=_otel_attributes(span.attributes),
+                start_time=_nanoseconds(span.start_time))
+
+    def finish(self, span):
+        otel_span = span.context
+        if span.bytes is not None:
+            otel_span.set_attribute('escpos.bytes', span.bytes)
+        otel_span.set_attribute('escpos.retries', span.retries)
+        if span.error is not None:
+            otel_span.record_exception(span.error)
+            otel_span.set_status(_otel_trace.Status(
+                    _otel_trace.StatusCode.ERROR,
+                    '{}'.format(span.error)))
+        otel_span.end(end_time=_nanoseconds(span.end_time))
+
+
+def set_tracer(tracer):
+    """Set the tracer (a :class:`Tracer`) for printers created from now on,
+    or ``None`` to turn tracing off.
+    """
+    global _tracer
+    _tracer = tracer
+
+
+def get_tracer():
+    return _tracer
+
+
+def span(name, **attributes):
+    """A context manager for a span with the given name and attributes,
+    child of the current span, if any. While tracing is off, it is a shared
+    no-op object.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP_SPAN
+    return Span(tracer, name, attributes, getattr(_local, 'span', None))
+
+
+def current_span():
+    """The span being run in this thread, if any."""
+    return getattr(_local, 'span', None)
+
+
+def record_retry():
+    """Count a backoff retry in the current span and all its parents."""
+    current = getattr(_local, 'span', None)
+    while current is not None:
+        current.retries += 1
+        current = current.parent
+
+
+def instrument(printer):
+    """Turn the public methods of a printer instance, and the ``catch``,
+    ``write`` and ``read`` methods of its connection, into spans. This is
+    done by :class:`~escpos.impl.epson.GenericESCPOS` itself when a tracer
+    is set, and does nothing otherwise.
+    """
+    if _tracer is None or getattr(printer, '_escpos_traced', False):
+        return
+    for name in _public_methods(type(printer)):
+        method = getattr(printer, name)
+        setattr(printer, name, _traced_method('escpos.' + name, method))
+    printer._escpos_traced = True
+    instrument_connection(printer.device)
+
+
+def instrument_connection(conn):
+    """Turn ``catch``, ``write`` and ``read`` of a connection instance into
+    spans named after the connection type, such as ``network.write``.
+    """
+    if _tracer is None or getattr(conn, '_escpos_traced', False):
+        return
+    metrics = getattr(conn, 'metrics', None)
+    prefix = metrics.type_name if metrics else type(conn).__name__.lower()
+    for name in CONNECTION_METHODS:
+        method = getattr(conn, name, None)
+        if method is None:
+            continue
+        wrapper = _traced_write if name == 'write' else _traced_method
+        setattr(conn, name, wrapper('{}.{}'.format(prefix, name), method))
+    conn._escpos_traced = True
+
+
+def _public_methods(cls):
+    names = set()
+    for klass in inspect.getmro(cls):
+        for name, value in vars(klass).items():
+            if (not name.startswith('_')
+                    and name not in UNTRACED_METHODS
+                    and inspect.isfunction(value)):
+                names.add(name)
+    return sorted(names)
+
+
+def _traced_method(name, method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        tracer = _tracer
+        if tracer is None:
+            return method(*args, **kwargs)
+        with Span(tracer, name, {}, getattr(_local, 'span', None)) as s:
+            result = method(*args, **kwargs)
+            if isinstance(result, (bytes, bytearray)):
+                s.bytes = len(result)
+            return result
+    return wrapper
+
+
+def _traced_write(name, method):
+    @functools.wraps(method)
+    def wrapper(data, *args, **kwargs):
+        tracer = _tracer
+        if tracer is None:
+            return method(data, *args, **kwargs)
+        with Span(tracer, name, {}, getattr(_local, 'span', None)) as s:
+            s.bytes = len(data)
+            return method(data, *args, **kwargs)
+    return wrapper
+
+
+def _otel_attributes(attributes):
+    return dict(('escpos.{}'.format(k), v) for k, v in attributes.items())
+
+
+def _nanoseconds(timestamp):
+    return int(timestamp * 1e9)
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/wirelog.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Wire logging: hexdumps of the data written to printers, at ``DEBUG``
+level, cheap enough to leave on in production. Dumps are only formatted if
+a handler actually emits the record, and can be further limited to
+:const:`~escpos.config.WIRELOG_MAX_BYTES` bytes each (no limit by default)
+and to one in :const:`~escpos.config.WIRELOG_SAMPLE` writes. Both limits can
+be set through the ``ESCPOS_WIRELOG_MAX_BYTES`` and ``ESCPOS_WIRELOG_SAMPLE``
+environment variables.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import itertools
+import logging
+
+from future.utils import python_2_unicode_compatible
+
+from . import config
+from .helpers import hexdump
+
+
+@python_2_unicode_compatible
+class LazyHexdump(object):
+    """Formats a hexdump of (at most ``max_bytes`` of, if given) the data
+    only when converted to text, that is, when a log record is emitted.
+    """
+
+    __slots__ = ('data', 'max_bytes')
+
+    def __init__(self, data, max_bytes=None):
+        self.data = data
+        self.max_bytes = max_bytes
+
+    def __str__(self):
+        size = len(self.data)
+        if not self.max_bytes or size <= self.max_bytes:
+            return hexdump(self.data)
+        return '{}\n... {} more bytes (of {})'.format(
+                hexdump(self.data[:self.max_bytes]),
+                size - self.max_bytes,
+                size)
+
+
+class WireLogger(object):
+    """Logs hexdumps of data to the given logger.
+
+    .. sourcecode:: python
+
+        wire = WireLogger(logger)
+        ...
+        wire.debug('sending to %s:\\n%s', self, data)
+
+    :param logger: A :class:`logging.Logger`.
+
+    :param int max_bytes: Optional. Zero for no limit. Defaults to
+        :const:`~escpos.config.WIRELOG_MAX_BYTES`, as set at the time of
+        each call.
+
+    :param int sample: Optional. Defaults to
+        :const:`~escpos.config.WIRELOG_SAMPLE`, as set at the time of each
+        call.
+
+    """
+
+    def __init__(self, logger, max_bytes=None, sample=None):
+        super(WireLogger, self).__init__()
+        self.logger = logger
+        self.max_bytes = max_bytes
+        self.sample = sample
+        self._counter = itertools.count()
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.logger.name)
+
+    def debug(self, msg, target, data):
+        """Log ``msg`` with ``target`` (the connection, for instance) and a
+        hexdump of ``data`` as arguments, if debugging is enabled and this
+        write is sampled.
+        """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        sample = self.sample or config.WIRELOG_SAMPLE
+        if sample > 1 and next(self._counter) % sample:
+            return
+        max_bytes = self.max_bytes
+        if max_bytes is None:
+            max_bytes = config.WIRELOG_MAX_BYTES
+        self.logger.debug(msg, target, LazyHexdump(data, max_bytes))
@@ -40,6 +40,7 @@ long_description = read('README.rst')
 
 install_requires = [
         'future',
+        'futures; python_version < "3.0"',
         'six',
     ]
 
@@ -47,9 +48,16 @@ extras_require = {
         'bluetooth': [
             'PyBluez',
         ],
+        'image': [
+            'numpy',
+            'Pillow',
+        ],
         'serial': [
             'pySerial',
         ],
+        'tracing': [
+            'opentelemetry-api',
+        ],
         'usb': [
             'PyUSB'
         ],
@@ -65,6 +73,7 @@ setup(
                 'escpos',
                 'escpos.impl',
                 'escpos.conn',
+                'escpos.emulator',
             ],
         install_requires=install_requires,
         extras_require=extras_require,
@@ -21,10 +21,17 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import pytest
+import six
 
 from escpos import constants
 
 
+collect_ignore = []
+if six.PY2:
+    # asyncio support requires Python 3
+    collect_ignore.append('test_aio.py')
+
+
 class FakeDevice(object):
     """A fake device for testing printer implementations."""
 
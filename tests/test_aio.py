@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/tests/test_aio.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import socket
+
+import pytest
+
+from escpos import aio
+from escpos import config
+from escpos.exceptions import TimeoutException
+from escpos.impl.epson import GenericESCPOS
+from escpos.status import DLE_EOT_QUERY
+
+
+def _run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class FakeAsyncDevice(object):
+
+    def __init__(self):
+        self.writes = []
+        self.read_buffer = None
+
+    def __str__(self):
+        return 'fake:9100'
+
+    async def catch(self):
+        pass
+
+    async def release(self):
+        pass
+
+    async def write(self, data):
+        self.writes.append(data)
+
+    async def read(self):
+        data, self.read_buffer = self.read_buffer, None
+        return data
+
+
+def test_async_backoff_retries(monkeypatch):
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(aio.asyncio, 'sleep', fake_sleep)
+    attempts = []
+
+    @aio.async_backoff(max_tries=3, delay=1, factor=2)
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise OSError('spam')
+        return 'OK'
+
+    assert _run(flaky()) == 'OK'
+    assert delays == [1, 2]
+
+    del attempts[:], delays[:]
+
+    @aio.async_backoff(max_tries=3, delay=1, factor=2)
+    async def failing():
+        attempts.append(1)
+        raise OSError('spam')
+
+    with pytest.raises(OSError):
+        _run(failing())
+    assert len(attempts) == 3
+    assert delays == [1, 2]  # no delay after the last try
+
+    with pytest.raises(ValueError):
+        aio.async_backoff(max_tries=0)
+
+
+def test_async_backoff_cancellation():
+    attempts = []
+
+    @aio.async_backoff(max_tries=5, delay=10, factor=2)
+    async def failing():
+        attempts.append(1)
+        raise OSError('spam')
+
+    async def cancel_while_delaying():
+        task = asyncio.ensure_future(failing())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    _run(cancel_while_delaying())
+    assert len(attempts) == 1
+
+
+def test_printer_sends_commands():
+    device = FakeAsyncDevice()
+    printer = aio.AsyncPrinter(device, GenericESCPOS)
+
+    async def print_receipt():
+        await printer.init()
+        await printer.text('Hello World!')
+        async with printer.buffered():
+            await printer.set_emphasized(True)
+            await printer.text('Total')
+            await printer.cut()
+
+    _run(print_receipt())
+    assert device.writes == [
+            GenericESCPOS.compile(['init']),
+            GenericESCPOS.compile([('text', ('Hello World!',))]),
+            GenericESCPOS.compile([
+                    ('set_emphasized', (True,)),
+                    ('text', ('Total',)),
+                    'cut',
+                ]),
+        ]
+    assert printer.model.name == GenericESCPOS.model.name
+
+
+def test_printer_awaits_barcode_completion(monkeypatch):
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(aio.asyncio, 'sleep', fake_sleep)
+    device = FakeAsyncDevice()
+    device.read_buffer = b'\x00'
+    printer = aio.AsyncPrinter(device, GenericESCPOS)
+    response = _run(printer.qrcode('https://github.com/base4sistemas'))
+    assert response == b'\x00'
+    assert delays == [1]
+    assert len(device.writes) == 1
+
+
+class SlowAnswerDevice(FakeAsyncDevice):
+    # answers each write after a while, as a printer on the network would
+
+    def __init__(self, answer):
+        super(SlowAnswerDevice, self).__init__()
+        self.answer = answer
+        self._answers = asyncio.Queue()
+
+    async def write(self, data):
+        self.writes.append(data)
+        answer = self.answer(data)
+        if answer is not None:
+            asyncio.get_event_loop().call_later(
+                    0.05, self._answers.put_nowait, answer)
+
+    async def read(self):
+        try:
+            return await asyncio.wait_for(self._answers.get(), 0.02)
+        except asyncio.TimeoutError:
+            return None
+
+
+def _count_ticks(coro):
+    # run the coroutine, counting how many times other tasks got to run
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(1)
+            await asyncio.sleep(0.005)
+
+    async def main():
+        task = asyncio.ensure_future(ticker())
+        try:
+            return await coro
+        finally:
+            task.cancel()
+
+    return _run(main()), len(ticks)
+
+
+def test_printer_status_does_not_block_loop():
+    device = SlowAnswerDevice(lambda data: b'\x12\x12\x12\x12')
+    printer = aio.AsyncPrinter(device, GenericESCPOS)
+    status, ticks = _count_ticks(printer.status(timeout=1))
+    assert status.online
+    assert device.writes == [DLE_EOT_QUERY]
+    assert ticks > 2
+
+    device = SlowAnswerDevice(lambda data: None)
+    printer = aio.AsyncPrinter(device, GenericESCPOS)
+    assert _run(printer.status(timeout=0.1)) is None
+
+
+def test_printer_end_job():
+    def acknowledge(data):
+        if data.startswith(b'\x1D\x28\x48'):
+            return b'\x37\x22' + data[-4:] + b'\x00'
+
+    device = SlowAnswerDevice(acknowledge)
+    printer = aio.AsyncPrinter(device, GenericESCPOS)
+
+    async def print_receipt():
+        await printer.text('Hello World!')
+        return await printer.end_job(timeout=1)
+
+    elapsed, ticks = _count_ticks(print_receipt())
+    assert 0 < elapsed < 1
+    assert ticks > 2
+    assert device.writes[-1] == b'\x1D\x28\x48\x06\x00\x30\x300001'
+
+    device = SlowAnswerDevice(lambda data: None)
+    printer = aio.AsyncPrinter(device, GenericESCPOS)
+    with pytest.raises(TimeoutException):
+        _run(printer.end_job(timeout=0.1))
+
+
+def test_printer_end_job_in_buffered_block():
+    device = FakeAsyncDevice()
+    printer = aio.AsyncPrinter(device, GenericESCPOS)
+
+    async def print_receipt():
+        async with printer.buffered():
+            await printer.text('Hello World!')
+            assert await printer.end_job() is None
+
+    _run(print_receipt())
+    assert len(device.writes) == 1
+    assert device.writes[0].endswith(b'\x1D\x28\x48\x06\x00\x30\x300001')
+
+
+def test_printer_methods_that_read_raise():
+
+    class ReadingPrinter(GenericESCPOS):
+
+        def firmware_version(self):
+            self.device.write(b'\x1D\x49\x41')
+            return self.device.read()
+
+    device = FakeAsyncDevice()
+    printer = aio.AsyncPrinter(device, ReadingPrinter)
+    with pytest.raises(RuntimeError):
+        _run(printer.firmware_version())
+    assert device.writes == []
+
+
+def test_network_connection_to_dead_host_raises(monkeypatch):
+    monkeypatch.setattr(config, 'BACKOFF_MAXTRIES', 2)
+    monkeypatch.setattr(config, 'BACKOFF_DELAY', 0.01)
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(('127.0.0.1', 0))
+    port = sock.getsockname()[1]
+    sock.close()  # nothing listens there anymore
+    conn = aio.AsyncNetworkConnection.create('127.0.0.1:{}'.format(port))
+    with pytest.raises(OSError):
+        _run(conn.write(b'\x1B\x40'))
+    with pytest.raises(OSError):
+        _run(conn.catch())
+
+
+def test_network_connection():
+    received = []
+
+    async def handle(reader, writer):
+        received.append(await reader.read(4096))
+        writer.write(b'\x16')
+        await writer.drain()
+        writer.close()
+
+    async def print_over_network():
+        server = await asyncio.start_server(handle, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        conn = aio.AsyncNetworkConnection.create('127.0.0.1:{}'.format(port))
+        assert str(conn) == '127.0.0.1:{}'.format(port)
+        async with aio.AsyncPrinter(conn) as printer:
+            await printer.init()
+            assert await conn.read() == b'\x16'
+        server.close()
+
+    _run(print_over_network())
+    assert received == [b'\x1B\x40']
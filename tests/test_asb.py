@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/tests/test_asb.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import threading
+
+import pytest
+
+from six.moves import queue
+
+from escpos import asb
+from escpos.impl.epson import GenericESCPOS
+
+
+ASB_OK = b'\x10\x00\x00\x00'
+ASB_PAPER_END = b'\x10\x00\x0C\x00'
+
+
+class PollableDevice(pytest.FakeDevice):
+
+    def __init__(self):
+        super(PollableDevice, self).__init__()
+        self.incoming = queue.Queue()
+
+    def poll(self, timeout):
+        try:
+            return self.incoming.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+def test_feed_demultiplexes_status():
+    conn = asb.AutomaticStatusBack(PollableDevice(), read_timeout=0)
+    changes = []
+    conn.subscribe(lambda old, new: changes.append((old, new)))
+
+    # a status split across reads and mixed with a DLE EOT answer
+    conn.feed(b'\x10\x00')
+    conn.feed(b'\x0C\x00\x12')
+    conn.feed(ASB_PAPER_END)  # unchanged, no notification
+    assert conn.read() == b'\x12'
+    assert conn.read() is None
+    assert len(changes) == 1
+    assert changes[0][0] is None
+    assert changes[0][1].paper_end
+    assert conn.status.paper_end
+
+    # a header not followed by status bytes is just data
+    conn.feed(b'\x10\x12\x12')
+    assert conn.read() == b'\x10\x12\x12'
+
+
+def test_feed_job_ack():
+    conn = asb.AutomaticStatusBack(PollableDevice(), read_timeout=0)
+    # the last digit ('0', '4' or '8') has the fixed bits of a status header
+    conn.feed(b'7"0010\x00')
+    assert conn.read() == b'7"0010\x00'
+    conn.feed(b'7"00')
+    conn.feed(b'14\x00' + ASB_PAPER_END)
+    assert conn.read() == b'7"0014\x00'
+    assert conn.status.paper_end
+
+
+def test_end_job_through_asb():
+
+    class AckingDevice(PollableDevice):
+
+        def write(self, data):
+            super(AckingDevice, self).write(data)
+            if data.startswith(b'\x1D\x28\x48'):
+                self.incoming.put(b'\x37\x22' + data[-4:] + b'\x00')
+
+    device = AckingDevice()
+    conn = asb.AutomaticStatusBack(device, read_timeout=0.05)
+    printer = GenericESCPOS(conn)
+    try:
+        # process IDs 0001 to 0010, including those ending in 0, 4 and 8
+        for i in range(10):
+            assert printer.end_job(timeout=5) is not None
+    finally:
+        conn.release()
+
+
+def test_reader_thread():
+    device = PollableDevice()
+    conn = asb.AutomaticStatusBack(device, mode=asb.ASB_PAPER_SENSOR)
+    changed = threading.Event()
+    conn.subscribe(lambda old, new: changed.set())
+
+    printer = GenericESCPOS(conn)  # catches connection, enabling ASB
+    assert device.write_buffer == b'\x1D\x61\x08'
+
+    device.incoming.put(ASB_OK + b'\x12\x12\x12\x12')
+    assert changed.wait(5)
+    assert conn.status.online
+    assert printer.status(timeout=5).online  # DLE EOT answer still readable
+
+    conn.release()
+    assert device.write_buffer.endswith(b'\x1D\x61\x00')
+
+
+def test_reader_reconnects_when_connection_is_closed(monkeypatch):
+    monkeypatch.setattr(asb, 'MAX_RECONNECT_DELAY', 0.05)
+
+    class ClosingDevice(PollableDevice):
+
+        def __init__(self):
+            super(ClosingDevice, self).__init__()
+            self.polls = 0
+            self.catches = 0
+
+        def catch(self):
+            self.catches += 1
+            if self.catches == 2:
+                raise IOError('connection refused')
+
+        def poll(self, timeout):
+            self.polls += 1
+            if self.catches == 1:
+                raise IOError('connection closed by peer')
+            return super(ClosingDevice, self).poll(timeout)
+
+    device = ClosingDevice()
+    conn = asb.AutomaticStatusBack(device, poll_timeout=0.01)
+    changed = threading.Event()
+    conn.subscribe(lambda old, new: changed.set())
+    conn.catch()
+
+    device.incoming.put(ASB_OK)
+    assert changed.wait(5)
+    assert device.catches == 3  # failed once, then reconnected
+    assert device.polls < 20  # backed off instead of spinning
+    assert device.write_buffer == b'\x1D\x61\x0F' * 2
+    conn.release()
@@ -168,3 +168,12 @@ def test_with_more_cash_drawer_ports_than_escbematech_supports():
 
     with pytest.raises(CashDrawerException):
         printer.kick_drawer(port=3)
+
+
+def test_cache_state():
+    printer = MP4200TH(pytest.FakeDevice(), cache_state=True)
+    printer.set_condensed(True)
+    printer.set_condensed(True)
+    printer.set_emphasized(True)
+    printer.set_emphasized(True)
+    assert printer.device.write_buffer == b'\x1B\x0F\x1B\x45'
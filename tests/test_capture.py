@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/tests/test_capture.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import time
+
+import pytest
+
+from escpos import capture
+from escpos.conn import middleware
+from escpos.conn.dummy import DummyConnection
+from escpos.emulator import Emulator
+from escpos.exceptions import CaptureFormatError
+from escpos.impl.epson import GenericESCPOS
+from escpos.status import DLE_EOT_QUERY
+
+
+def _record(fileobj):
+    writer = capture.CaptureWriter(fileobj)
+    printer = GenericESCPOS(capture.tee(Emulator(), writer, name='counter'))
+    printer.init()
+    printer.text('Hello World!')
+    assert printer.status().online
+    other = writer.stream('kitchen')
+    time.sleep(0.05)
+    other(middleware.WRITE, b'\x1B\x40')
+    writer.close()
+    return writer
+
+
+def test_write_and_read():
+    fileobj = io.BytesIO()
+    _record(fileobj)
+    fileobj.seek(0)
+    reader = capture.CaptureReader(fileobj)
+    assert reader.indexed
+    assert reader.streams == {0: 'counter', 1: 'kitchen'}
+    assert len(reader) == 6
+    records = list(reader.records())
+    assert [(r.stream, r.direction, r.data) for r in records] == [
+            (0, middleware.WRITE, b'\x1B\x40'),
+            (0, middleware.WRITE, b'Hello World!'),
+            (0, middleware.WRITE, b'\x0A'),
+            (0, middleware.WRITE, DLE_EOT_QUERY),
+            (0, middleware.READ, b'\x12\x12\x12\x12'),
+            (1, middleware.WRITE, b'\x1B\x40'),
+        ]
+    assert records == sorted(records, key=lambda r: r.time)
+    assert [r.data for r in reader.records(direction=middleware.READ)] == [
+            b'\x12\x12\x12\x12']
+    assert [r.data for r in reader.records(start=0.04)] == [b'\x1B\x40']
+    assert [r.stream for r in reader.records(start=0.04)] == [1]
+    assert list(reader.records(start=3600)) == []
+
+
+def test_read_capture_cut_short():
+    fileobj = io.BytesIO()
+    writer = capture.CaptureWriter(fileobj)
+    recorder = writer.stream('counter')
+    recorder(middleware.WRITE, b'\x1B\x40')
+    recorder(middleware.WRITE, b'Hello')
+    data = fileobj.getvalue()[:-2]  # never closed, last record incomplete
+    reader = capture.CaptureReader(io.BytesIO(data))
+    assert not reader.indexed
+    assert [r.data for r in reader.records()] == [b'\x1B\x40']
+
+
+def test_not_a_capture():
+    with pytest.raises(CaptureFormatError):
+        capture.CaptureReader(io.BytesIO(b'\x1B\x40' * 20))
+
+
+def test_replay(tmpdir):
+    path = str(tmpdir.join('store.cap'))
+    _record(path)
+    dummy = DummyConnection()
+    result = capture.replay(path, dummy, stream=0, speed=None)
+    assert dummy.output == b'\x1B\x40Hello World!\x0A' + DLE_EOT_QUERY
+    assert result.records == 4
+    assert result.bytes == len(dummy.output)
+
+
+def test_replay_keeps_pace(tmpdir):
+    path = str(tmpdir.join('store.cap'))
+    _record(path)
+    result = capture.replay(path, DummyConnection(), speed=1.0)
+    assert result.elapsed >= 0.05
+    result = capture.replay(path, DummyConnection(), speed=None)
+    assert result.elapsed < 0.05
+
+
+def test_command_line(tmpdir, capsys):
+    path = str(tmpdir.join('store.cap'))
+    _record(path)
+    assert capture.main(['info', path]) == 0
+    out = capsys.readouterr().out
+    assert '#0 counter: 4 writes, 27 bytes' in out
+    assert '#0 counter: 1 reads, 4 bytes' in out
+    assert '#1 kitchen: 1 writes, 2 bytes' in out
+    assert capture.main(['replay', path, 'dummy', '', '--max-speed']) == 0
+    assert '5 writes, 29 bytes' in capsys.readouterr().out
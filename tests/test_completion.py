@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/tests/test_completion.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import time
+
+import pytest
+
+from escpos.completion import FixedDelay
+from escpos.completion import StatusPolling
+from escpos.completion import GS_R_PAPER_SENSOR_STATUS
+from escpos.impl.epson import GenericESCPOS
+
+
+def test_default_strategy_is_fixed_delay():
+    printer = GenericESCPOS(pytest.FakeDevice())
+    assert isinstance(printer.completion, FixedDelay)
+
+
+def test_status_polling_returns_as_soon_as_printer_answers():
+    device = pytest.FakeDevice()
+    printer = GenericESCPOS(device, completion=StatusPolling())
+    device.read_buffer = b'\x00'  # paper sensor status: paper adequate
+
+    start = time.time()
+    response = printer.qrcode('spam')
+    elapsed = time.time() - start
+
+    assert elapsed < 0.5
+    assert response == b''
+    assert device.write_buffer.endswith(GS_R_PAPER_SENSOR_STATUS)
+
+
+def test_status_polling_polls_silent_printer():
+
+    class SilentDevice(pytest.FakeDevice):
+
+        def __init__(self):
+            super(SilentDevice, self).__init__()
+            self.polls = []
+
+        def poll(self, timeout):
+            self.polls.append(timeout)
+            time.sleep(timeout)
+            return None
+
+        def read(self):
+            raise AssertionError('read() would reconnect')
+
+    device = SilentDevice()
+    strategy = StatusPolling(timeout=0.2)
+
+    start = time.time()
+    response = strategy.wait(device, 10)
+    elapsed = time.time() - start
+
+    assert 0.2 <= elapsed < 0.5
+    assert not response
+    assert device.polls and max(device.polls) <= 0.2
+
+
+def test_status_polling_falls_back_to_fixed_delay():
+    device = pytest.FakeDevice()
+    strategy = StatusPolling(interval=0.01)
+
+    start = time.time()
+    response = strategy.wait(device, 0.1)
+    elapsed = time.time() - start
+
+    assert elapsed >= 0.1
+    assert not response
+    assert device.write_buffer == GS_R_PAPER_SENSOR_STATUS
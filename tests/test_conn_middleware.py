@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/tests/test_conn_middleware.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import time
+
+import pytest
+
+from escpos import metrics
+from escpos.conn import middleware
+from escpos.conn.dummy import DummyConnection
+from escpos.emulator.server import PrinterServer
+from escpos.impl.epson import GenericESCPOS
+
+
+class FlakyConnection(DummyConnection):
+
+    def __init__(self, failures):
+        super(FlakyConnection, self).__init__()
+        self.failures = failures
+        self.catches = 0
+
+    def catch(self):
+        self.catches += 1
+
+    def write(self, data):
+        if self.failures:
+            self.failures -= 1
+            raise IOError('broken pipe')
+        super(FlakyConnection, self).write(data)
+
+
+def test_stack_order():
+    conn = middleware.stack(DummyConnection(), [
+            middleware.Metrics,
+            (middleware.Coalesce, {'size': 16}),
+        ])
+    assert isinstance(conn, middleware.Metrics)
+    assert isinstance(conn.connection, middleware.Coalesce)
+    assert conn.connection.size == 16
+    assert isinstance(middleware.unwrap(conn), DummyConnection)
+    assert conn.output == b''  # looked up in the wrapped connection
+
+
+def test_create():
+    conn = middleware.create('dummy', None, [middleware.Coalesce])
+    assert isinstance(middleware.unwrap(conn), DummyConnection)
+    with pytest.raises(ValueError):
+        middleware.create('carrier-pigeon', None)
+
+
+def test_coalesce():
+    dummy = DummyConnection()
+    conn = middleware.Coalesce(dummy, size=8)
+    conn.write(b'\x1B\x40')
+    conn.write(b'Hello')
+    assert dummy.output == b''
+    conn.write(b'World\n')  # reaches the size
+    assert dummy._output_list == [b'\x1B\x40HelloWorld\n']
+    conn.write(b'!')
+    assert conn.pending == 1
+    conn.read()  # writes pending data before reading
+    assert dummy._output_list[-1] == b'!'
+    assert not hasattr(conn, 'poll')  # since dummy connections have none
+
+
+def test_coalesced_printer_gets_answers():
+    with PrinterServer() as server:
+        conn = middleware.create('network', server.address, [
+                (middleware.Coalesce, {'size': 1024}),
+            ])
+        printer = GenericESCPOS(conn)
+        printer.init()
+        printer.text('Hello World!')
+        assert printer.end_job(timeout=5) is not None
+        conn.release()
+    stats, = server.connections
+    assert stats.bytes_received == len(
+            b'\x1B\x40Hello World!\n'
+            + b'\x1D\x28\x48\x06\x00\x30\x300001')
+
+
+def test_rate_limit():
+    dummy = DummyConnection()
+    conn = middleware.RateLimit(dummy, rate=10000, burst=100)
+    started = time.time()
+    for i in range(10):
+        conn.write(b'x' * 100)
+    elapsed = time.time() - started
+    assert dummy.output == b'x' * 1000
+    assert 0.08 <= elapsed < 1  # 900 bytes over the burst at 10 kB/s
+
+
+def test_tee():
+    recorded = []
+    emulator_like = DummyConnection()
+    emulator_like.read = lambda: b'\x12'
+    conn = middleware.Tee(
+            emulator_like,
+            lambda direction, data: recorded.append((direction, data)))
+    conn.write(b'\x10\x04\x01')
+    assert conn.read() == b'\x12'
+    assert recorded == [
+            (middleware.WRITE, b'\x10\x04\x01'),
+            (middleware.READ, b'\x12'),
+        ]
+
+
+def test_metrics():
+    conn = middleware.Metrics(DummyConnection(), label='test-metrics')
+    conn.write(b'abc')
+    data = metrics.snapshot()['stack:test-metrics']
+    assert data['writes'] == 1
+    assert data['bytes_written'] == 3
+
+
+def test_retry():
+    flaky = FlakyConnection(failures=2)
+    conn = middleware.Retry(flaky, max_tries=3, delay=0.01)
+    conn.write(b'abc')
+    assert flaky.output == b'abc'
+    assert flaky.catches == 2  # caught again before each retry
+
+
+def test_retry_gives_up():
+    conn = middleware.Retry(
+            FlakyConnection(failures=5),
+            max_tries=2,
+            delay=0.01)
+    with pytest.raises(IOError):
+        conn.write(b'abc')
+
+
+def test_retry_only_connection_errors():
+    class BrokenConnection(FlakyConnection):
+        def write(self, data):
+            self.failures += 1
+            raise ValueError('bad data')
+
+    broken = BrokenConnection(failures=0)
+    conn = middleware.Retry(broken, max_tries=3, delay=0.01)
+    with pytest.raises(ValueError):
+        conn.write(b'abc')
+    assert broken.failures == 1  # not retried
+    assert broken.catches == 0
@@ -20,9 +20,124 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import socket
+import time
 
+import pytest
+
+from escpos import config
 from escpos.conn.network import NetworkConnection
+from escpos.emulator.server import PrinterServer
+from escpos.exceptions import NonReadableSocketError
+from escpos.impl.epson import GenericESCPOS
+from escpos.status import DLE_EOT_QUERY
 
 
 def test_has_settings_example_attribute():
     assert hasattr(NetworkConnection, 'SETTINGS_EXAMPLE')
+
+
+def test_poll():
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    try:
+        conn = NetworkConnection('127.0.0.1', server.getsockname()[1])
+        assert conn.poll(0) is None  # not connected yet
+        conn.catch()
+        client, address = server.accept()
+        assert conn.poll(0.01) is None
+        client.sendall(b'\x10\x00\x00\x00')
+        assert conn.poll(5) == b'\x10\x00\x00\x00'
+        client.close()
+        conn.release()
+    finally:
+        server.close()
+
+
+def test_poll_closed_by_peer():
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    try:
+        conn = NetworkConnection('127.0.0.1', server.getsockname()[1])
+        conn.catch()
+        client, address = server.accept()
+        client.close()
+        with pytest.raises(NonReadableSocketError):
+            conn.poll(5)
+        assert conn.socket is None
+        assert conn.poll(0) is None
+    finally:
+        server.close()
+
+
+def test_status_of_silent_printer_does_not_reconnect():
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(5)
+    try:
+        conn = NetworkConnection('127.0.0.1', server.getsockname()[1])
+        printer = GenericESCPOS(conn)
+        client, address = server.accept()
+        started = time.time()
+        assert printer.status(timeout=0.2) is None
+        assert time.time() - started < 0.5
+        server.settimeout(0.01)
+        with pytest.raises(socket.timeout):
+            server.accept()  # no other connection was made
+        client.close()
+        conn.release()
+    finally:
+        server.close()
+
+
+def test_write_to_server():
+    with PrinterServer() as server:
+        conn = NetworkConnection.create(server.address)
+        printer = GenericESCPOS(conn)
+        printer.init()
+        printer.text('Hello World!')
+        assert printer.status().online
+        assert printer.end_job(timeout=5) is not None
+        conn.release()
+    stats, = server.connections
+    assert stats.bytes_received == len(
+            b'\x1B\x40Hello World!\n'
+            + DLE_EOT_QUERY
+            + b'\x1D\x28\x48\x06\x00\x30\x300001')
+    assert stats.bytes_sent == 4 + 7
+    assert stats.throughput > 0
+
+
+def test_write_reconnects_after_reset(monkeypatch):
+    monkeypatch.setattr(config, 'BACKOFF_DELAY', 0.01)
+    with PrinterServer(reset_after=1024, max_resets=1) as server:
+        conn = NetworkConnection.create(server.address)
+        conn.catch()
+        conn.write(b'x' * 2048)
+        _wait_for(lambda: server.resets == 1)
+        conn.write(b'y' * 100)  # fails, reconnects and retries
+        _wait_for(lambda: server.bytes_received >= 2048 + 100)
+        conn.release()
+    first, second = server.connections
+    assert first.reset
+    assert not second.reset
+    assert second.bytes_received == 100
+
+
+def test_print_speed():
+    with PrinterServer(print_speed=20000, interpret=False) as server:
+        conn = NetworkConnection.create(server.address)
+        conn.catch()
+        conn.write(b'x' * 4000)
+        _wait_for(lambda: server.bytes_received == 4000)
+        conn.release()
+    assert server.connections[0].elapsed >= 0.15
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, 'timed out'
+        time.sleep(0.01)
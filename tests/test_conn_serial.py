@@ -20,9 +20,64 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import os
+import time
 
+import pytest
+
+from escpos.conn.serial import DSRDTR
+from escpos.conn.serial import RTSCTS
 from escpos.conn.serial import SerialConnection
+from escpos.exceptions import TimeoutException
+from escpos.impl.epson import GenericESCPOS
+from escpos.status import DLE_EOT_QUERY
+
+if hasattr(os, 'openpty'):
+    from escpos.emulator.serialport import SerialPrinter
 
 
 def test_has_settings_example_attribute():
     assert hasattr(SerialConnection, 'SETTINGS_EXAMPLE')
+
+
+@pytest.mark.skipif(not hasattr(os, 'openpty'), reason='requires a pty')
+def test_write_to_serial_printer():
+    with SerialPrinter(baudrate=115200) as printer:
+        impl = GenericESCPOS(printer.connect())
+        impl.init()
+        impl.text('Hello World!')
+        assert impl.status().online
+        _wait_for(lambda: printer.bytes_printed == printer.bytes_received)
+    assert printer.bytes_received == len(
+            b'\x1B\x40Hello World!\n' + DLE_EOT_QUERY)
+    assert printer.stalls == 0
+
+
+@pytest.mark.skipif(not hasattr(os, 'openpty'), reason='requires a pty')
+@pytest.mark.parametrize('protocol', [RTSCTS, DSRDTR])
+def test_write_waits_for_printer(protocol):
+    with SerialPrinter(baudrate=38400, buffer_size=256) as printer:
+        conn = printer.connect(protocol=protocol)
+        conn.catch()
+        conn.write(b'x' * 2048)
+        _wait_for(lambda: printer.bytes_printed == 2048)
+    assert printer.stalls > 0
+    assert printer.stalled_time > 0
+
+
+@pytest.mark.skipif(not hasattr(os, 'openpty'), reason='requires a pty')
+def test_write_times_out_while_printer_is_busy():
+    with SerialPrinter(baudrate=300, buffer_size=64) as printer:
+        conn = printer.connect(protocol_timeout=0.2)
+        conn.catch()
+        conn.write(b'x' * 512)
+        _wait_for(lambda: not printer.ready)
+        with pytest.raises(TimeoutException):
+            conn.write(b'x')
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, 'timed out'
+        time.sleep(0.01)
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/tests/test_disasm.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+
+from escpos import capture
+from escpos import disasm
+from escpos.conn import middleware
+from escpos.emulator.tokenizer import command_table
+from escpos.impl.daruma import DR700
+from escpos.impl.epson import GenericESCPOS
+
+
+def _job():
+    return GenericESCPOS.compile([
+            'init',
+            ('set_emphasized', (True,)),
+            ('text', ('Hello World!',)),
+            ('code128', ('0123456789',)),
+            ('qrcode', ('https://example.com',)),
+            ('cut', (), {'partial': False}),
+        ])
+
+
+def test_disassemble():
+    instructions = disasm.disassemble(_job())
+    names = [i.name for i in instructions]
+    assert names[:3] == ['ESC @', 'ESC E', None]
+    assert 'GS k' in names
+    assert 'GS ( k' in names
+    assert instructions[0].offset == 0
+    assert instructions[1].offset == 2
+    assert instructions[0].category == disasm.SETUP
+    assert instructions[2].category == disasm.TEXT
+    for previous, current in zip(instructions, instructions[1:]):
+        assert current.offset == previous.offset + len(previous.raw)
+
+
+def test_length_prefixed_commands():
+    data = (
+            b'\x1D\x6B\x49\x05{B123'  # GS k, function B (m n data)
+            b'\x1D\x6B\x04ABC\x00'  # GS k, function A (NUL terminated)
+            b'\x1D\x28\x6B\x06\x00\x31\x50\x30ABC'  # GS ( k, store QRCode
+        )
+    instructions = disasm.disassemble(data)
+    assert [(i.name, i.category, len(i.raw)) for i in instructions] == [
+            ('GS k', disasm.BARCODE, 9),
+            ('GS k', disasm.BARCODE, 7),
+            ('GS ( k', disasm.SYMBOL, 11),
+        ]
+    assert disasm.describe(instructions[0]) == \
+        "Print barcode (m=73, '{B123')"
+    assert disasm.describe(instructions[1]) == "Print barcode (m=4, 'ABC')"
+    assert disasm.describe(instructions[2]) == \
+        '2D symbol (cn=49, fn=80, 6 bytes)'
+
+
+def test_streaming_across_chunks():
+    data = _job()
+    expected = disasm.disassemble(data)
+    disassembler = disasm.Disassembler()
+    instructions = []
+    for i in range(len(data)):
+        instructions.extend(disassembler.feed(data[i:i + 1]))
+    instructions.extend(disassembler.close())
+    # text runs are split by feeds, commands are not
+    assert [i for i in instructions if i.kind != 'text'] == \
+        [i for i in expected if i.kind != 'text']
+    assert b''.join(i.raw for i in instructions) == data
+
+    chunked = list(disasm.disassemble_file(io.BytesIO(data), chunk_size=7))
+    assert b''.join(i.raw for i in chunked) == data
+    assert chunked[-1].offset + len(chunked[-1].raw) == len(data)
+
+
+def test_short_parameters():
+    assert disasm.listing(b'\x1D\x28\x6B\x00\x00') == (
+            '00000000  1d 28 6b 00 00             GS ( k   2D symbol (0 0)')
+    for name, args, expected in (
+            ('GS k', b'', 'Print barcode'),
+            ('GS ( k', b'\x01\x00\x31', '2D symbol (1 0 49)'),
+            ('GS ( L', b'\x01\x00', 'Graphics (1 0)'),
+            ('GS v 0', b'\x00\x01\x00', 'Print raster bit image (0 1 0)')):
+        instruction = disasm.Instruction(
+                0, 'command', name, disasm.UNKNOWN, b'', args)
+        assert disasm.describe(instruction) == expected
+
+
+def test_vendor_dialect():
+    data = DR700.compile([('set_expanded', (True,)), 'kick_drawer'])
+    instructions = disasm.disassemble(data, table=command_table(DR700))
+    commands = disasm.command_descriptions(DR700)
+    assert [disasm.describe(i, commands=commands) for i in instructions] == [
+            'Double width mode (1)',
+            'Open cash drawer',
+        ]
+    assert disasm.command_descriptions(GenericESCPOS) is disasm.COMMANDS
+
+
+def test_main_with_impl(tmpdir):
+    path = str(tmpdir.join('job.bin'))
+    with io.open(path, 'wb') as fileobj:
+        fileobj.write(DR700.compile([('set_expanded', (True,))]))
+    out = io.StringIO()
+    assert disasm.main([path, '--impl', 'escpos.impl.daruma.DR700'],
+                       out=out) == 0
+    assert 'ESC W    Double width mode (1)' in out.getvalue()
+
+
+def test_incomplete_command_at_end():
+    instructions = disasm.disassemble(b'\x1B\x40\x1D\x6B\x49\x05AB')
+    assert [(i.name, i.category) for i in instructions] == [
+            ('ESC @', disasm.SETUP),
+            ('GS 6B', disasm.UNKNOWN),
+        ]
+    assert instructions[1].offset == 2
+
+
+def test_statistics():
+    stats = disasm.Statistics()
+    for instruction in disasm.disassemble(b'\x1B\x40Hello\n\x1B\x40'):
+        stats.add(instruction)
+    assert stats.instructions == 4
+    assert stats.total_bytes == 10
+    assert stats.categories == {
+            disasm.SETUP: [2, 4],
+            disasm.TEXT: [1, 5],
+            disasm.CONTROL: [1, 1],
+        }
+    assert stats.commands['ESC @'] == [2, 4]
+    assert stats.commands['TEXT'] == [1, 5]
+    report = stats.report().splitlines()
+    assert report[0] == '4 instructions, 10 bytes'
+    assert report[3].split()[-3:] == ['1', '5', '50.0%']
+
+
+def test_listing():
+    lines = disasm.listing(b'\x1B\x40Hi\x1D\x56\x00').splitlines()
+    assert lines == [
+            '00000000  1b 40                      ESC @    Initialize printer',
+            "00000002  48 69                      TEXT     'Hi'",
+            '00000004  1d 56 00                   GS V     '
+            'Select cut mode and cut (0)',
+        ]
+
+
+def test_main_with_capture(tmpdir):
+    path = str(tmpdir.join('job.cap'))
+    with capture.CaptureWriter(path) as writer:
+        writer.stream('counter')(middleware.WRITE, b'\x1B\x40Hi')
+        writer.stream('counter')(middleware.READ, b'\x12')
+    out = io.StringIO()
+    assert disasm.main([path, '--stats'], out=out) == 0
+    output = out.getvalue()
+    assert 'ESC @' in output
+    assert "'Hi'" in output
+    assert '2 instructions, 4 bytes' in output
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/tests/test_dispatch.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import threading
+
+from escpos import dispatch
+from escpos.impl.bematech import MP4200TH
+from escpos.impl.epson import GenericESCPOS
+from escpos.conn.dummy import DummyConnection
+
+
+class SlowConnection(DummyConnection):
+
+    def __init__(self, gate):
+        super(SlowConnection, self).__init__()
+        self.gate = gate
+
+    def catch(self):
+        self.gate.wait(5)  # like a printer still trying to connect
+
+
+class BrokenConnection(DummyConnection):
+
+    def write(self, data):
+        raise RuntimeError('broken pipe')
+
+
+def test_broadcast_report():
+    gate = threading.Event()
+    job = ['init', ('text', ('Daily Menu',)), 'cut']
+    targets = [
+            dispatch.Target('kitchen', DummyConnection(), GenericESCPOS),
+            dispatch.Target('bar', DummyConnection(), MP4200TH),
+            dispatch.Target('slow', SlowConnection(gate), GenericESCPOS),
+            dispatch.Target('broken', BrokenConnection(), GenericESCPOS),
+        ]
+    try:
+        report = dispatch.broadcast(targets, job, timeout=0.5)
+    finally:
+        gate.set()
+
+    assert [r.status for r in report.results] == [
+            dispatch.STATUS_OK,
+            dispatch.STATUS_OK,
+            dispatch.STATUS_TIMEOUT,
+            dispatch.STATUS_FAILED,
+        ]
+    assert not report.ok
+    assert [r.name for r in report.failures] == ['slow', 'broken']
+    assert isinstance(report.failures[1].error, RuntimeError)
+    assert report.elapsed < 5
+
+    assert targets[0].connection.output == GenericESCPOS.compile(job)
+    assert targets[1].connection.output == MP4200TH.compile(job)
+
+
+def test_timed_out_target_does_not_write_late():
+    gate = threading.Event()
+    written = threading.Event()
+
+    class LateConnection(SlowConnection):
+
+        def write(self, data):
+            written.set()
+
+    connection = LateConnection(gate)
+    report = dispatch.broadcast(
+            [dispatch.Target('late', connection, GenericESCPOS)],
+            ['init'],
+            timeout=0.1)
+    assert report.results[0].status == dispatch.STATUS_TIMEOUT
+
+    gate.set()  # connection is finally established
+    assert not written.wait(0.3)
+
+
+def test_broadcast_compiles_once_per_implementation(monkeypatch):
+    calls = []
+    original = GenericESCPOS.compile.__func__
+
+    def compile(cls, operations, **kwargs):
+        calls.append(cls)
+        return original(cls, operations, **kwargs)
+
+    monkeypatch.setattr(GenericESCPOS, 'compile', classmethod(compile))
+    targets = [
+            dispatch.Target(str(i), DummyConnection(), GenericESCPOS)
+            for i in range(10)
+        ]
+    report = dispatch.broadcast(targets, ['init'])
+    assert report.ok
+    assert calls == [GenericESCPOS]
+    assert all(t.connection.output == b'\x1B\x40' for t in targets)
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/tests/test_emulator.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+
+import pytest
+
+from escpos import barcode
+from escpos import feature
+from escpos import status
+from escpos.emulator import Emulator
+from escpos.emulator import Tokenizer
+from escpos.emulator import tokenize
+from escpos.emulator import page as _page
+from escpos.emulator import tokenizer as _tokenizer
+from escpos.helpers import find_implementations
+from escpos.impl.daruma import DR700
+from escpos.impl.epson import GenericESCPOS
+
+
+FEATURES = {
+        feature.CUTTER: True,
+        feature.CASHDRAWER_PORTS: True,
+    }
+
+RECEIPT = [
+        'init',
+        'justify_center',
+        ('set_emphasized', (True,)),
+        ('text', ('RECEIPT #5678',)),
+        ('set_emphasized', (False,)),
+        'justify_left',
+        ('set_text_size', (0, 1)),
+        ('textout', ('Total: ',)),
+        ('set_text_size', (0, 0)),
+        ('text', ('R$ 12,50 á',)),
+        ('code128', ('5678',)),
+        ('qrcode', ('https://example.com/5678',)),
+        ('kick_drawer',),
+        ('cut', (), {'partial': False}),
+    ]
+
+
+def test_tokenize_compiled_receipt():
+    data = GenericESCPOS.compile(RECEIPT, features=FEATURES)
+    tokens = tokenize(data)
+    assert b''.join(t.raw for t in tokens) == data
+    assert not [t for t in tokens if t.kind == _tokenizer.UNKNOWN]
+    names = [t.name for t in tokens if t.kind == _tokenizer.COMMAND]
+    assert names[:2] == ['ESC @', 'ESC a']
+    assert 'GS k' in names
+    assert names.count('GS ( k') == 4
+    assert names[-1] == 'GS V'
+
+
+def test_tokenize_every_implementation():
+    operations = [
+            'init',
+            ('set_emphasized', (True,)),
+            ('text', ('Hi',)),
+            ('set_emphasized', (False,)),
+            ('set_condensed', (True,)),
+            ('set_condensed', (False,)),
+            ('set_expanded', (True,)),
+            'justify_center',
+            ('text', ('Body',)),
+            ('code128', ('5678',)),
+            ('qrcode', ('https://example.com/5678',)),
+            'kick_drawer',
+            'cut',
+        ]
+    for impl in find_implementations():
+        data = impl.type.compile(operations)
+        table = _tokenizer.command_table(impl.type)
+        tokens = tokenize(data, table=table)
+        assert b''.join(t.raw for t in tokens) == data, impl.fqname
+        assert not [
+                t for t in tokens if t.kind == _tokenizer.UNKNOWN
+            ], impl.fqname
+        assert [t.raw for t in tokens if t.kind == _tokenizer.TEXT] == [
+                b'Hi',
+                b'Body',
+            ], impl.fqname
+        emulator = Emulator(table=table)
+        emulator.feed(data)
+        assert emulator.drawer_kicks <= 1, impl.fqname
+
+
+def test_command_table():
+    assert _tokenizer.command_table(GenericESCPOS) is \
+        _tokenizer.ESCPOS_COMMANDS
+    table = _tokenizer.command_table(DR700(pytest.FakeDevice()))
+    assert table[b'\x1B\x70'][0] == 'ESC p'
+    assert tokenize(b'\x1B\x70\x1B\x6D', table=table)[1].name == 'ESC m'
+
+
+def test_tokenize_streaming():
+    data = GenericESCPOS.compile(RECEIPT, features=FEATURES)
+    expected = [t for t in tokenize(data) if t.kind != _tokenizer.TEXT]
+    tokenizer = Tokenizer()
+    tokens = []
+    for i in range(len(data)):
+        tokens.extend(tokenizer.feed(data[i:i + 1]))
+    tokens.extend(tokenizer.close())
+    assert tokenizer.pending == 0
+    # text runs may be split among feeds, but commands must not
+    assert [t for t in tokens if t.kind != _tokenizer.TEXT] == expected
+    assert b''.join(t.raw for t in tokens) == data
+
+
+def test_tokenize_unknown_and_incomplete():
+    tokens = tokenize(b'A\x1B\xFFB\x1D\x28\x6B\x05\x00\x31')
+    kinds = [t.kind for t in tokens]
+    assert kinds == [
+            _tokenizer.TEXT,
+            _tokenizer.UNKNOWN,
+            _tokenizer.TEXT,
+            _tokenizer.UNKNOWN,  # incomplete at the end of data
+        ]
+    assert tokens[1].name == 'ESC FF'
+
+
+def test_page_model():
+    emulator = Emulator()
+    pages = emulator.feed(GenericESCPOS.compile(RECEIPT, features=FEATURES))
+    assert len(pages) == 1
+    page = pages[0]
+    assert page.cut == _page.CUT_FULL
+    assert _page.page_text(page).split('\n')[:2] == [
+            'RECEIPT #5678',
+            'Total: R$ 12,50 á',
+        ]
+
+    title = page.lines[0]
+    assert title.justification == _page.JUSTIFY_CENTER
+    assert title.elements[0].style.bold
+
+    total = page.lines[1]
+    assert total.justification == _page.JUSTIFY_LEFT
+    assert [e.style.height for e in total.elements] == [2, 1]
+    assert not total.elements[0].style.bold
+
+    symbols = [e for line in page.lines for e in line.elements]
+    assert _page.Barcode(barcode.CODE128, b'{A5678') in symbols
+    assert _page.QRCode(b'https://example.com/5678') in symbols
+    assert emulator.drawer_kicks == 1
+    assert emulator.unknown_commands == 0
+    assert emulator.close() == []
+
+
+def test_as_connection():
+    emulator = Emulator()
+    printer = GenericESCPOS(emulator)
+    printer.init()
+    printer.text('Hello')
+    assert printer.status() == status.parse(b'\x12\x12\x12\x12')
+    assert printer.end_job(timeout=1)
+    pages = emulator.close()
+    assert len(pages) == 1
+    assert pages[0].cut == _page.CUT_NONE
+    assert _page.page_text(pages[0]) == 'Hello'
+
+
+def test_read_pages():
+    data = GenericESCPOS.compile(RECEIPT, features=FEATURES) * 50
+    emulator = Emulator()
+    pages = list(emulator.read_pages(io.BytesIO(data), chunk_size=7))
+    assert len(pages) == 50
+    assert emulator.pages == 50
+    assert emulator.bytes_received == len(data)
+    assert len(set(pages)) == 1
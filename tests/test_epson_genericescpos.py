@@ -22,8 +22,13 @@ from __future__ import unicode_literals
 
 import pytest
 
+from escpos.conn.dummy import DummyConnection
 from escpos.impl.epson import GenericESCPOS
+from escpos.completion import time as time_module
+from escpos.exceptions import TimeoutException
+from escpos import barcode
 from escpos import feature
+from escpos.helpers import find_implementations
 
 
 @pytest.fixture(scope='module')
@@ -61,3 +66,249 @@ def test_set_code_page_value_bound_limits(printer):
 
     with pytest.raises(ValueError):
         assert printer.set_code_page(256)
+
+
+def test_buffered_single_write():
+    conn = DummyConnection()
+    printer = GenericESCPOS(conn)
+    with printer.buffered():
+        printer.init()
+        printer.justify_center()
+        printer.text('Hello')
+        printer.lf(2)
+        assert conn.output == b''
+
+    assert len(conn._output_list) == 1
+    assert conn.output == b'\x1B\x40\x1B\x61\x01Hello\x0A\x0A\x0A'
+
+
+def test_buffered_flush_on_size_threshold():
+    conn = DummyConnection()
+    printer = GenericESCPOS(conn)
+    with printer.buffered(size=4):
+        printer.init()
+        assert conn.output == b''
+        printer.justify_center()
+        assert conn.output == b'\x1B\x40\x1B\x61\x01'
+        printer.lf()
+
+    assert len(conn._output_list) == 2
+    assert conn.output == b'\x1B\x40\x1B\x61\x01\x0A'
+
+
+def test_buffered_explicit_flush_and_nesting():
+    conn = DummyConnection()
+    printer = GenericESCPOS(conn)
+    with printer.buffered():
+        printer.init()
+        printer.flush()
+        assert conn.output == b'\x1B\x40'
+        with printer.buffered():
+            printer.lf()
+        assert conn.output == b'\x1B\x40'
+
+    assert conn.output == b'\x1B\x40\x0A'
+
+
+def test_buffered_discarded_on_error():
+    conn = DummyConnection()
+    printer = GenericESCPOS(conn)
+    with pytest.raises(ValueError):
+        with printer.buffered():
+            printer.init()
+            printer.set_code_page(256)
+
+    assert conn.output == b''
+    printer.lf()
+    assert conn.output == b'\x0A'
+
+
+def test_buffered_discarded_on_interrupt():
+    conn = DummyConnection()
+    printer = GenericESCPOS(conn)
+    with pytest.raises(KeyboardInterrupt):
+        with printer.buffered(size=1024):
+            printer.init()
+            raise KeyboardInterrupt()
+
+    assert conn.output == b''
+    printer.lf()
+    assert conn.output == b'\x0A'
+
+    block = printer.buffered()
+    block.__enter__()
+    printer.init()
+    block.gen.close()  # GeneratorExit, as when abandoned
+    printer.lf()
+    assert conn.output == b'\x0A\x0A'
+
+
+def test_buffered_barcode_does_not_wait(monkeypatch):
+    monkeypatch.setattr(time_module, 'sleep', _fail_on_sleep)
+    conn = DummyConnection()
+    printer = GenericESCPOS(conn)
+    with printer.buffered():
+        assert printer.ean8('12345670') is None
+        assert printer.qrcode('spam') is None
+
+    assert len(conn._output_list) == 1
+
+
+def _fail_on_sleep(seconds):
+    raise AssertionError('should not sleep while buffering')
+
+
+def test_compile(monkeypatch):
+    monkeypatch.setattr(time_module, 'sleep', _fail_on_sleep)
+    data = GenericESCPOS.compile([
+            'init',
+            ('set_emphasized', (True,)),
+            ('text', ('Hello',)),
+            ('code128', ('123',), {'codeset': barcode.CODE128_B}),
+            ('cut', (), {'partial': False}),
+        ], features={feature.CUTTER: True})
+
+    assert data == (
+            b'\x1B\x40'
+            + b'\x1B\x45\x01'
+            + b'Hello\x0A'
+            + b'\x1D\x6B\x49\x05\x7BB123\x00'
+            + b'\x1D\x56\x41\x00'
+        )
+
+
+def test_compile_callable():
+    def routine(printer):
+        printer.init()
+        printer.lf(2)
+
+    assert GenericESCPOS.compile(routine) == b'\x1B\x40\x0A\x0A'
+
+
+def test_compile_unknown_operation():
+    with pytest.raises(ValueError):
+        GenericESCPOS.compile(['no_such_method'])
+
+    with pytest.raises(ValueError):
+        GenericESCPOS.compile(['_write'])
+
+
+def test_compile_matches_every_implementation():
+    operations = [
+            'init',
+            ('set_expanded', (True,)),
+            ('text', ('Title',)),
+            ('set_condensed', (True,)),
+            ('set_emphasized', (True,)),
+            'justify_center',
+            ('text', ('Body',)),
+            'cut',
+        ]
+    for impl in find_implementations():
+        printer = impl.type(pytest.FakeDevice())
+        for operation in operations:
+            if isinstance(operation, tuple):
+                getattr(printer, operation[0])(*operation[1])
+            else:
+                getattr(printer, operation)()
+        expected = printer.device.write_buffer
+        assert impl.type.compile(operations) == expected, impl.fqname
+
+
+def test_cache_state_elides_redundant_commands():
+    printer = GenericESCPOS(pytest.FakeDevice(), cache_state=True)
+    printer.set_emphasized(True)
+    printer.set_emphasized(True)
+    assert printer.device.write_buffer == b'\x1B\x45\x01'
+
+    printer.justify_center()
+    printer.text_center('Spam')
+    assert printer.device.write_buffer == b'\x1B\x61\x01Spam\x0A'
+
+    printer.set_condensed(True)
+    printer.set_font(b'\x01')
+    printer.set_condensed(False)
+    assert printer.device.write_buffer == b'\x1B\x4D\x01\x1B\x4D\x00'
+
+    printer.set_expanded(True)
+    printer.set_text_size(1, 1)
+    printer.set_code_page(2)
+    printer.set_code_page(2)
+    assert printer.device.write_buffer == b'\x1D\x21\x11\x1B\x74\x02'
+
+
+def test_cache_state_forgotten_on_init():
+    printer = GenericESCPOS(pytest.FakeDevice(), cache_state=True)
+    printer.set_emphasized(False)
+    printer.init()
+    printer.set_emphasized(False)
+    assert printer.device.write_buffer == (
+            b'\x1B\x45\x00'
+            + b'\x1B\x40'
+            + b'\x1B\x45\x00'
+        )
+
+
+def test_cache_state_forgotten_when_buffer_is_discarded():
+    printer = GenericESCPOS(DummyConnection(), cache_state=True)
+    with pytest.raises(ValueError):
+        with printer.buffered():
+            printer.set_emphasized(True)
+            printer.set_text_size(8, 8)
+
+    printer.set_emphasized(True)
+    assert printer.device.output == b'\x1B\x45\x01'
+
+
+def test_cache_state_not_remembered_when_write_fails(monkeypatch):
+    printer = GenericESCPOS(DummyConnection(), cache_state=True)
+
+    def broken_write(data):
+        raise IOError('device unplugged')
+
+    monkeypatch.setattr(printer.device, 'write', broken_write)
+    with pytest.raises(IOError):
+        printer.set_emphasized(True)
+
+    monkeypatch.undo()
+    printer.set_emphasized(True)
+    assert printer.device.output == b'\x1B\x45\x01'
+
+
+def test_no_cache_state_by_default():
+    printer = GenericESCPOS(pytest.FakeDevice())
+    printer.justify_left()
+    printer.justify_left()
+    assert printer.device.write_buffer == b'\x1B\x61\x00\x1B\x61\x00'
+
+
+def test_end_job_waits_for_acknowledgement():
+    printer = GenericESCPOS(pytest.FakeDevice())
+    printer.text('Hello')
+    printer.device.read_buffer = b'\x37\x22' + b'0001' + b'\x00'
+    elapsed = printer.end_job(timeout=1)
+    assert elapsed >= 0
+    assert printer.device.write_buffer == (
+            b'Hello\n'
+            + b'\x1D\x28\x48\x06\x00\x30\x30' + b'0001'
+        )
+
+    # an answer to another request does not acknowledge this job
+    printer.device.read_buffer = b'\x37\x22' + b'0001' + b'\x00'
+    with pytest.raises(TimeoutException):
+        printer.end_job(timeout=0.1)
+
+    printer.device.read_buffer = b'\x37\x22' + b'0003' + b'\x00'
+    future = printer.end_job(timeout=1, block=False)
+    assert future.result(timeout=5) >= 0
+
+
+def test_end_job_in_buffered_mode():
+    data = GenericESCPOS.compile(['init', 'end_job'])
+    assert data == b'\x1B\x40\x1D\x28\x48\x06\x00\x30\x30' + b'0001'
+
+    printer = GenericESCPOS(pytest.FakeDevice())
+    with printer.buffered():
+        printer.init()
+        assert printer.end_job(ack=False) is None
+        assert printer.device.write_buffer == b'\x1B\x40'
@@ -27,6 +27,8 @@ from escpos.exceptions import TimeoutException
 from escpos.helpers import chunks
 from escpos.helpers import TimeoutHelper
 from escpos.helpers import find_implementations
+from escpos.helpers import hexdump
+from escpos.helpers import hexdump_bytes
 
 
 def test_chunk():
@@ -65,3 +67,24 @@ def test_find_implementations():
         raise RuntimeError((
                 'Cannot find expected FQ name {!r}; found FQ names: {!r}'
             ).format(expected_fqname, found_fqnames))
+
+
+def test_hexdump():
+    data = b'\x1B\x40Hello World!\x0A\x1D\x56\x42\x00'
+    expected = (
+            '1b 40 48 65 6c 6c 6f 20 57 6f 72 6c 64 21 0a 1d  '
+            '.@Hello World!..\n'
+            '56 42 00                                         '
+            'VB.             '
+        )
+    assert hexdump(data) == expected
+    assert hexdump(bytearray(data)) == expected
+    assert hexdump(list(bytearray(data))) == expected
+    assert hexdump(b'') == ''
+    assert hexdump(b'\xff', panel_gap=1) == 'ff' + ' ' * 46 + '.' + ' ' * 15
+
+
+def test_hexdump_bytes():
+    hex_panel, char_panel = hexdump_bytes(b'AB', fill_last_line=False)
+    assert hex_panel == ['41 42']
+    assert char_panel == ['AB']
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/tests/test_metrics.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import os
+import time
+
+import pytest
+
+from escpos import config
+from escpos import metrics
+from escpos.conn.network import NetworkConnection
+from escpos.emulator.server import PrinterServer
+
+if hasattr(os, 'openpty'):
+    from escpos.emulator.serialport import SerialPrinter
+
+
+def test_histogram():
+    histogram = metrics.Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+    data = histogram.snapshot()
+    assert data['buckets'] == [(0.1, 2), (1.0, 3), (float('inf'), 4)]
+    assert data['count'] == 4
+    assert data['sum'] == pytest.approx(2.65)
+
+
+def test_registry_shares_metrics_by_type_and_label():
+    registry = metrics.MetricsRegistry()
+    assert registry.get('network', 'a:9100') is registry.get(
+            'network', 'a:9100')
+    assert registry.get('network', 'a:9100') is not registry.get(
+            'bluetooth', 'a:9100')
+
+
+def test_prometheus_text():
+    registry = metrics.MetricsRegistry(buckets=(0.5,))
+    registry.get('network', '10.0.0.5:9100').record_write(10, 0.25)
+    text = registry.prometheus_text()
+    labels = 'type="network",connection="10.0.0.5:9100"'
+    assert '# TYPE escpos_connection_writes_total counter' in text
+    assert 'escpos_connection_writes_total{%s} 1' % labels in text
+    assert 'escpos_connection_bytes_written_total{%s} 10' % labels in text
+    assert (
+            'escpos_connection_write_duration_seconds_bucket'
+            '{%s,le="0.5"} 1' % labels) in text
+    assert (
+            'escpos_connection_write_duration_seconds_bucket'
+            '{%s,le="+Inf"} 1' % labels) in text
+    assert (
+            'escpos_connection_write_duration_seconds_sum'
+            '{%s} 0.25' % labels) in text
+
+
+def test_network_metrics(monkeypatch):
+    monkeypatch.setattr(config, 'BACKOFF_DELAY', 0.01)
+    with PrinterServer(reset_after=1024, max_resets=1) as server:
+        conn = NetworkConnection.create(server.address)
+        conn.catch()
+        conn.write(b'x' * 2048)
+        _wait_for(lambda: server.resets == 1)
+        conn.write(b'y' * 100)  # fails, reconnects and retries
+        conn.release()
+    data = metrics.snapshot()['network:{}'.format(server.address)]
+    assert data['writes'] == 2
+    assert data['bytes_written'] == 2148
+    assert data['errors'] == 0
+    assert data['retries'] >= 1
+    assert data['reconnects'] >= 1
+    assert data['write_latency']['count'] == 2
+
+
+@pytest.mark.skipif(not hasattr(os, 'openpty'), reason='requires a pty')
+def test_serial_stall_time():
+    with SerialPrinter(baudrate=9600, buffer_size=256) as printer:
+        conn = printer.connect()
+        conn.catch()
+        conn.write(b'x' * 512)
+        _wait_for(lambda: not printer.ready)
+        conn.write(b'y')  # waits for the printer to drain
+        data = conn.metrics.snapshot()
+    assert data['writes'] == 2
+    assert data['bytes_written'] == 513
+    assert data['stall_seconds'] > 0
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, 'timed out'
+        time.sleep(0.01)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/tests/test_pool.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import threading
+
+import pytest
+
+from escpos.exceptions import NoPrinterAvailableError
+from escpos.impl.epson import GenericESCPOS
+from escpos.pool import PrinterPool
+
+
+class FailingDevice(pytest.FakeDevice):
+
+    def write(self, data):
+        raise IOError('connection refused')
+
+
+def test_routes_to_least_busy_member():
+    gate = threading.Event()
+    printers = {
+            'a': GenericESCPOS(pytest.FakeDevice()),
+            'b': GenericESCPOS(pytest.FakeDevice()),
+        }
+    with PrinterPool(printers) as pool:
+        blocking = pool.submit(lambda p: gate.wait(5))
+        # while a member is busy, jobs go to the other one
+        for i in range(3):
+            pool.submit(b'x').result(timeout=5)
+        gate.set()
+        blocking.result(timeout=5)
+        stats = pool.stats()
+    busy = [n for n in stats if stats[n]['jobs'] == 1][0]
+    idle = [n for n in stats if stats[n]['jobs'] == 3][0]
+    assert busy != idle
+    assert printers[idle].device.write_buffer == b'xxx'
+
+
+def test_unhealthy_member_is_removed():
+    printers = {
+            'good': GenericESCPOS(pytest.FakeDevice()),
+            'bad': GenericESCPOS(FailingDevice()),
+        }
+    pool = PrinterPool(printers, max_failures=2)
+    errors = 0
+    for i in range(10):
+        try:
+            pool.submit(b'x').result(timeout=5)
+        except IOError:
+            errors += 1
+    assert errors == 2
+    assert pool.healthy == ['good']
+    assert pool.members == ['bad', 'good']
+    assert pool.stats()['bad']['failures'] == 2
+
+    pool.restore('bad')
+    assert pool.healthy == ['bad', 'good']
+
+    pool.remove('good')
+    pool.restore('bad')
+    for i in range(2):
+        with pytest.raises(IOError):
+            pool.submit(b'x').result(timeout=5)
+    with pytest.raises(NoPrinterAvailableError):
+        pool.submit(b'x')
+    pool.shutdown()
+
+
+def test_job_errors_are_not_member_failures():
+    printers = {'only': GenericESCPOS(pytest.FakeDevice())}
+    with PrinterPool(printers, max_failures=2) as pool:
+        for i in range(3):
+            with pytest.raises(ValueError):
+                pool.submit([('set_code_page', (256,))]).result(timeout=5)
+        assert pool.healthy == ['only']
+        assert pool.stats()['only']['failures'] == 0
+        pool.submit(b'x').result(timeout=5)
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/tests/test_raster.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import os
+
+import pytest
+
+try:
+    import numpy as np
+    _lib_numpy = True
+except ImportError:
+    _lib_numpy = False
+
+try:
+    from PIL import Image
+    _lib_pil = True
+except ImportError:
+    _lib_pil = False
+
+from escpos import raster
+from escpos.conn.dummy import DummyConnection
+from escpos.impl.elgin import ElginRM22
+from escpos.impl.epson import GenericESCPOS
+
+
+requires_numpy = pytest.mark.skipif(
+        not _lib_numpy,
+        reason='NumPy library is unavailable')
+
+requires_pil = pytest.mark.skipif(
+        not (_lib_numpy and _lib_pil),
+        reason='NumPy and/or Pillow libraries are unavailable')
+
+
+@requires_numpy
+def test_gs_v_0_packs_rows():
+    dots = np.zeros((2, 10), dtype=bool)
+    dots[0, 0] = True  # first dot of first row
+    dots[1, 9] = True  # last dot of second row
+    commands = raster.gs_v_0(dots)
+    assert commands == [
+            b'\x1D\x76\x30\x00'
+            + b'\x02\x00'  # 2 bytes per row (10 dots padded to 16)
+            + b'\x02\x00'  # 2 rows
+            + b'\x80\x00'
+            + b'\x00\x40'
+        ]
+
+
+@requires_numpy
+def test_gs_v_0_splits_bands():
+    dots = np.ones((5, 8), dtype=bool)
+    commands = raster.gs_v_0(dots, band_height=2)
+    assert len(commands) == 3
+    assert commands[0] == b'\x1D\x76\x30\x00\x01\x00\x02\x00\xFF\xFF'
+    assert commands[2] == b'\x1D\x76\x30\x00\x01\x00\x01\x00\xFF'
+
+
+@requires_numpy
+def test_rasterize_threshold_and_scale():
+    gray = np.full((40, 100), 255, dtype=np.uint8)
+    gray[:, :50] = 0  # left half is black
+    dots = raster.rasterize(gray, max_width=50)
+    assert dots.shape == (20, 50)
+    assert dots[:, :25].all()
+    assert not dots[:, 25:].any()
+
+
+@requires_numpy
+def test_rasterize_rgba_transparency_is_white():
+    rgba = np.zeros((4, 4, 4), dtype=np.uint8)  # black but transparent
+    assert not raster.rasterize(rgba).any()
+
+
+@requires_numpy
+def test_ordered_dither_density():
+    gray = np.full((64, 64), 128, dtype=np.uint8)
+    dots = raster.rasterize(gray, dither=raster.DITHER_ORDERED)
+    assert dots.mean() == pytest.approx(0.5, abs=0.02)
+
+
+@requires_pil
+def test_floyd_steinberg_from_pillow_image():
+    image = Image.new('L', (32, 32), 64)
+    dots = raster.rasterize(image, dither=raster.DITHER_FLOYD_STEINBERG)
+    assert dots.shape == (32, 32)
+    assert dots.mean() == pytest.approx(0.75, abs=0.05)
+
+
+@requires_numpy
+def test_unknown_dithering_mode():
+    with pytest.raises(ValueError):
+        raster.rasterize(np.zeros((1, 1)), dither='spam')
+
+
+@requires_numpy
+def test_printer_image_fits_dots_per_line():
+    printer = ElginRM22(pytest.FakeDevice())
+    printer.image(np.zeros((10, 1000), dtype=np.uint8))
+    data = printer.device.write_buffer
+    assert data[:8] == b'\x1D\x76\x30\x00\x30\x00\x04\x00'  # 384 dots
+    assert len(data) == 8 + 48 * 4
+
+    printer = GenericESCPOS(pytest.FakeDevice())
+    printer.image(np.zeros((1, 8), dtype=np.uint8))
+    assert printer.device.write_buffer == (
+            b'\x1D\x76\x30\x00\x01\x00\x01\x00\xFF'
+        )
+
+
+@requires_numpy
+def test_cache_hits_and_misses():
+    cache = raster.RasterCache()
+    image = np.zeros((4, 8), dtype=np.uint8)
+    first = raster.encode(image, cache=cache)
+    second = raster.encode(image.copy(), cache=cache)
+    assert first == second
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+    raster.encode(image, dither=raster.DITHER_ORDERED, cache=cache)
+    assert cache.misses == 2
+    assert len(cache) == 2
+
+
+@requires_numpy
+def test_cache_evicts_least_recently_used():
+    cache = raster.RasterCache(max_bytes=10)
+    cache.put('a', b'12345')
+    cache.put('b', b'12345')
+    assert cache.get('a') == b'12345'  # 'a' is now the most recent
+    cache.put('c', b'12345')
+    assert cache.get('b') is None
+    assert cache.get('a') == b'12345'
+    assert cache.size == 10
+
+    cache.put('huge', b'x' * 11)  # bigger than the whole budget
+    assert cache.get('huge') is None
+    assert len(cache) == 2
+
+
+@requires_numpy
+def test_cache_disk_persistence(tmpdir):
+    image = np.zeros((4, 8), dtype=np.uint8)
+    data = raster.encode(
+            image,
+            cache=raster.RasterCache(directory=str(tmpdir)))
+
+    cache = raster.RasterCache(directory=str(tmpdir))
+    assert raster.encode(image, cache=cache) == data
+    assert cache.disk_hits == 1
+    assert len(cache) == 1
+
+
+def test_cache_disk_overwrite_on_windows(tmpdir, monkeypatch):
+    # Windows rename semantics (and no os.replace, as in Python 2)
+    rename = os.rename
+
+    def windows_rename(source, target):
+        if os.path.exists(target):
+            raise OSError('file exists: {!r}'.format(target))
+        rename(source, target)
+
+    monkeypatch.delattr(os, 'replace', raising=False)
+    monkeypatch.setattr(os, 'rename', windows_rename)
+
+    raster.RasterCache(directory=str(tmpdir)).put('a', b'old')
+    raster.RasterCache(directory=str(tmpdir)).put('a', b'new')
+    assert raster.RasterCache(directory=str(tmpdir)).get('a') == b'new'
+    assert len(tmpdir.listdir()) == 1
+
+
+@requires_numpy
+def test_printer_image_uses_shared_cache(monkeypatch):
+    monkeypatch.setattr(raster, 'cache', raster.RasterCache())
+    image = np.zeros((4, 8), dtype=np.uint8)
+    first = GenericESCPOS(pytest.FakeDevice())
+    first.image(image)
+    second = GenericESCPOS(pytest.FakeDevice())
+    second.image(image)
+    assert first.device.write_buffer == second.device.write_buffer
+    assert raster.cache.hits == 1
+
+    second.image(image, cache=False)
+    assert raster.cache.hits == 1
+
+
+@requires_numpy
+def test_gs_l_nv_graphics_commands():
+    dots = np.zeros((2, 10), dtype=bool)
+    dots[0, 0] = True
+    assert raster.gs_l_define_nv_graphics('LG', dots) == (
+            b'\x1D\x28\x4C\x0F\x00'  # GS ( L pL pH (11 + 4 bytes of data)
+            + b'\x30\x43\x30'  # m fn a
+            + b'LG'  # kc1 kc2
+            + b'\x01'  # b
+            + b'\x0A\x00\x02\x00'  # 10x2 dots
+            + b'\x31'  # c
+            + b'\x80\x00\x00\x00'
+        )
+    assert raster.gs_l_print_nv_graphics('LG', double_height=True) == (
+            b'\x1D\x28\x4C\x06\x00\x30\x45LG\x01\x02'
+        )
+    assert raster.gs_l_delete_nv_graphics(b'LG') == (
+            b'\x1D\x28\x4C\x04\x00\x30\x42LG'
+        )
+
+    big = np.zeros((2304, 320), dtype=bool)  # 92160 bytes of data
+    data = raster.gs_l_define_nv_graphics('LG', big)
+    assert data[:7] == b'\x1D\x38\x4C\x0B\x68\x01\x00'  # GS 8 L p1..p4
+
+    with pytest.raises(ValueError):
+        raster.gs_l_print_nv_graphics('L')
+    with pytest.raises(ValueError):
+        raster.gs_l_print_nv_graphics('L\x7F')
+    with pytest.raises(ValueError):
+        raster.gs_l_define_nv_graphics('LG', np.zeros((2305, 8), dtype=bool))
+
+
+@requires_numpy
+def test_nv_graphics_uploads_only_when_changed(tmpdir):
+    filename = str(tmpdir.join('nv.json'))
+    registry = raster.NVGraphicsRegistry(filename=filename)
+    logo = np.zeros((4, 8), dtype=np.uint8)
+    printer = GenericESCPOS(pytest.FakeDevice())
+    print_logo = raster.gs_l_print_nv_graphics('LG')
+
+    printer.nv_graphics('LG', logo, registry=registry)
+    data = printer.device.write_buffer
+    assert data.startswith(b'\x1D\x28\x4C')
+    assert data.endswith(print_logo)
+    assert len(data) > len(print_logo)
+
+    printer.nv_graphics('LG', logo.copy(), registry=registry)
+    assert printer.device.write_buffer == print_logo
+
+    # registry is persisted, so another process would know it as well
+    registry = raster.NVGraphicsRegistry(filename=filename)
+    printer.nv_graphics('LG', logo, registry=registry)
+    assert printer.device.write_buffer == print_logo
+
+    # another logo under the same key must be uploaded again
+    printer.nv_graphics('LG', logo + 255, registry=registry)
+    assert len(printer.device.write_buffer) > len(print_logo)
+
+    printer.delete_nv_graphics('LG', registry=registry)
+    assert printer.device.write_buffer == raster.gs_l_delete_nv_graphics('LG')
+    assert registry.get(str(printer.device), 'LG') is None
+
+
+@requires_numpy
+def test_nv_graphics_upload_depends_on_conversion():
+    registry = raster.NVGraphicsRegistry()
+    logo = np.arange(32, dtype=np.uint8).reshape((4, 8)) * 8
+    printer = GenericESCPOS(pytest.FakeDevice())
+    print_logo = raster.gs_l_print_nv_graphics('LG')
+
+    printer.nv_graphics('LG', logo, registry=registry)
+    assert len(printer.device.write_buffer) > len(print_logo)
+    printer.nv_graphics('LG', logo, registry=registry)
+    assert printer.device.write_buffer == print_logo
+
+    printer.nv_graphics('LG', logo, threshold=64, registry=registry)
+    assert len(printer.device.write_buffer) > len(print_logo)
+
+    printer.nv_graphics('LG', logo, threshold=64, registry=registry)
+    assert printer.device.write_buffer == print_logo
+
+
+@requires_numpy
+def test_nv_graphics_registered_only_when_written():
+    registry = raster.NVGraphicsRegistry()
+    logo = np.zeros((4, 8), dtype=np.uint8)
+    printer = GenericESCPOS(pytest.FakeDevice())
+    printer_id = str(printer.device)
+    with pytest.raises(ValueError):
+        with printer.buffered():
+            printer.nv_graphics('LG', logo, registry=registry)
+            raise ValueError()
+    assert registry.get(printer_id, 'LG') is None
+
+    with printer.buffered():
+        printer.nv_graphics('LG', logo, registry=registry)
+        assert registry.get(printer_id, 'LG') is None
+    assert registry.get(printer_id, 'LG') is not None
+
+
+@requires_numpy
+def test_nv_graphics_compile_does_not_register(monkeypatch):
+    monkeypatch.setattr(raster, 'nv_registry', raster.NVGraphicsRegistry())
+    logo = np.zeros((4, 8), dtype=np.uint8)
+    first = GenericESCPOS.compile([('nv_graphics', ('LG', logo))])
+    second = GenericESCPOS.compile([('nv_graphics', ('LG', logo))])
+    assert first == second
+    assert first.startswith(b'\x1D\x28\x4C')
+    assert raster.nv_registry._printers == {}
+
+
+@requires_numpy
+def test_nv_graphics_registered_over_dummy_connection():
+    registry = raster.NVGraphicsRegistry()
+    logo = np.zeros((4, 8), dtype=np.uint8)
+    printer = GenericESCPOS(DummyConnection())
+    printer.nv_graphics('LG', logo, registry=registry)
+    assert registry.get(str(printer.device), 'LG') is not None
+
+
+def test_nv_registry_overwrite_on_windows(tmpdir, monkeypatch):
+    rename = os.rename
+
+    def windows_rename(source, target):
+        if os.path.exists(target):
+            raise OSError('file exists: {!r}'.format(target))
+        rename(source, target)
+
+    monkeypatch.delattr(os, 'replace', raising=False)
+    monkeypatch.setattr(os, 'rename', windows_rename)
+
+    filename = str(tmpdir.join('nv.json'))
+    registry = raster.NVGraphicsRegistry(filename=filename)
+    registry.set('printer', 'LG', 'abc')
+    registry.set('printer', 'LG', 'def')
+    registry = raster.NVGraphicsRegistry(filename=filename)
+    assert registry.get('printer', 'LG') == 'def'
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/tests/test_spool.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import threading
+
+import pytest
+
+from escpos.impl.epson import GenericESCPOS
+from escpos.spool import Spooler
+
+
+class ReleasableDevice(pytest.FakeDevice):
+
+    def __init__(self):
+        super(ReleasableDevice, self).__init__()
+        self.released = False
+
+    def release(self):
+        self.released = True
+
+
+def test_jobs_run_in_order():
+    device = ReleasableDevice()
+    printer = GenericESCPOS(device)
+    gate = threading.Event()
+    with Spooler(max_workers=4) as spooler:
+        spooler.add_printer('kitchen', printer)
+        first = spooler.submit('kitchen', lambda p: gate.wait(5))
+        futures = [
+                spooler.submit('kitchen', [('text', ('{}'.format(i),))])
+                for i in range(10)
+            ]
+        assert spooler.pending('kitchen') == 11
+        gate.set()
+        assert first.result(timeout=5) is True
+        for future in futures:
+            assert future.result(timeout=5) is None
+    assert device.write_buffer == b''.join(
+            '{}\n'.format(i).encode('ascii') for i in range(10))
+    assert device.released
+
+
+def test_compiled_job_and_errors():
+    printer = GenericESCPOS(ReleasableDevice())
+    spooler = Spooler(max_workers=1)
+    spooler.add_printer('bar', printer)
+
+    data = GenericESCPOS.compile(['init', ('text', ('Hello',)), 'cut'])
+    assert spooler.submit('bar', data).result(timeout=5) is None
+
+    def failing(p):
+        raise RuntimeError('paper jam')
+
+    future = spooler.submit('bar', failing)
+    with pytest.raises(RuntimeError):
+        future.result(timeout=5)
+
+    # a failed job does not stop the queue
+    spooler.submit('bar', ['init']).result(timeout=5)
+    assert printer.device.write_buffer == data + b'\x1B\x40'
+
+    with pytest.raises(KeyError):
+        spooler.submit('unknown', b'\x1B\x40')
+
+    spooler.shutdown()
+    with pytest.raises(RuntimeError):
+        spooler.submit('bar', b'\x1B\x40')
+
+
+def test_printers_run_concurrently():
+    # with two workers, a blocked printer must not hold up the other one
+    blocked = GenericESCPOS(ReleasableDevice())
+    other = GenericESCPOS(ReleasableDevice())
+    gate = threading.Event()
+    with Spooler(max_workers=2) as spooler:
+        spooler.add_printer('blocked', blocked)
+        spooler.add_printer('other', other)
+        spooler.submit('blocked', lambda p: gate.wait(5))
+        spooler.submit('other', b'\x1B\x40').result(timeout=5)
+        gate.set()
+    assert other.device.write_buffer == b'\x1B\x40'
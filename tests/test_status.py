@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/tests/test_status.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import threading
+
+import pytest
+
+from escpos import status
+from escpos.impl.epson import GenericESCPOS
+
+
+ALL_OK = b'\x12\x12\x12\x12'
+
+COVER_OPEN_NO_PAPER = (
+        b'\x1A'  # offline
+        + b'\x36'  # cover open, stopped by paper end
+        + b'\x12'
+        + b'\x7E'  # paper near end and paper end
+    )
+
+
+def test_parse():
+    ok = status.parse(ALL_OK)
+    assert ok.online
+    assert not any([
+            ok.cover_open,
+            ok.error,
+            ok.paper_end,
+            ok.paper_near_end,
+            ok.autocutter_error,
+        ])
+    assert ok.raw == ALL_OK
+
+    bad = status.parse(COVER_OPEN_NO_PAPER)
+    assert not bad.online
+    assert bad.cover_open
+    assert bad.stopped_by_paper_end
+    assert bad.paper_near_end
+    assert bad.paper_end
+    assert not bad.error
+
+    assert status.parse(None) is None
+    assert status.parse(b'\x12\x12\x12') is None  # incomplete
+    assert status.parse(b'\x12\x12\x12\x13') is None  # bit 0 set
+
+
+def test_printer_status():
+    printer = GenericESCPOS(pytest.FakeDevice())
+    with printer.buffered():
+        printer.text('pending')
+        printer.device.read_buffer = COVER_OPEN_NO_PAPER
+        result = printer.status(timeout=0)
+        # status requests are not held in buffer
+        assert printer.device.write_buffer == status.DLE_EOT_QUERY
+    assert result.cover_open
+    assert printer.device.write_buffer == b'pending\n'
+
+    assert printer.status(timeout=0) is None  # printer did not answer
+
+
+def test_status_poller():
+    printer = GenericESCPOS(pytest.FakeDevice())
+    printer.device.read_buffer = ALL_OK
+    poller = status.StatusPoller(printer, interval=10, lock=threading.Lock())
+    assert poller.status is None
+    assert not poller.available
+    assert not poller.is_fresh(60)
+
+    poller.start()
+    try:
+        with pytest.raises(RuntimeError):
+            poller.start()
+        for i in range(100):
+            if poller.updated_at is not None:
+                break
+            threading.Event().wait(0.01)
+    finally:
+        poller.stop()
+
+    assert poller.available
+    assert poller.is_fresh(60)
+
+    printer.device.read_buffer = COVER_OPEN_NO_PAPER
+    assert poller.refresh().paper_end
+    assert not poller.available
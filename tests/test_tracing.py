@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/tests/test_tracing.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import logging
+
+import pytest
+
+from escpos import tracing
+from escpos.impl.epson import GenericESCPOS
+from escpos.retry import backoff
+
+
+class NoWait(object):
+
+    def wait(self, device, delay):
+        return device.read()
+
+
+@pytest.fixture
+def spans():
+    finished = []
+    tracing.set_tracer(tracing.CallbackTracer(finished.append))
+    yield finished
+    tracing.set_tracer(None)
+
+
+def test_off_by_default():
+    printer = GenericESCPOS(pytest.FakeDevice())
+    assert 'text' not in vars(printer)
+    assert 'write' not in vars(printer.device)
+    with tracing.span('job') as span:
+        assert tracing.current_span() is None
+    assert span.name is None
+
+
+def test_printer_and_connection_spans(spans):
+    printer = GenericESCPOS(pytest.FakeDevice(), completion=NoWait())
+    with tracing.span('receipt', order=5678):
+        printer.text('Hello')
+        printer.qrcode('https://github.com/base4sistemas/pyescpos')
+    names = [s.name for s in spans]
+    assert names[:6] == [
+            'fakedevice.catch',
+            'fakedevice.write',  # textout
+            'escpos.textout',
+            'fakedevice.write',  # lf
+            'escpos.lf',
+            'escpos.text',
+        ]
+    assert names[-4:] == [
+            'fakedevice.read',
+            'completion.wait',
+            'escpos.qrcode',
+            'receipt',
+        ]
+    assert spans[1].bytes == 5
+    wait = spans[-3]
+    assert wait.attributes == {'delay': 1}
+    assert wait.parent.name == 'escpos.qrcode'
+    assert wait.parent.parent is spans[-1]
+    assert spans[-1].attributes == {'order': 5678}
+    assert spans[-1].duration >= sum(
+            s.duration for s in spans if s.parent is spans[-1])
+
+
+def test_retries_and_errors(spans):
+    attempts = []
+
+    @backoff(max_tries=3, delay=0.01, factor=2)
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RuntimeError('failed')
+
+    with pytest.raises(ValueError):
+        with tracing.span('job'):
+            flaky()
+            raise ValueError('not printed')
+    job = spans[-1]
+    assert job.retries == 2
+    assert isinstance(job.error, ValueError)
+    assert [s.name for s in spans] == ['backoff', 'backoff', 'job']
+    assert spans[1].attributes == {'delay': 0.02}
+
+
+def test_slow_operation_reporter(caplog):
+    tracing.set_tracer(tracing.SlowOperationReporter(threshold=0.01))
+    try:
+        printer = GenericESCPOS(pytest.FakeDevice())
+        with caplog.at_level(logging.WARNING, logger='escpos.tracing'):
+            printer.ean8('12345670')  # waits for the barcode to be printed
+    finally:
+        tracing.set_tracer(None)
+    messages = [r.getMessage() for r in caplog.records]
+    assert len(messages) == 2
+    assert messages[0].startswith('slow completion.wait: 0.2')
+    assert messages[1].startswith('slow escpos.ean8: 0.2')
+
+
+@pytest.mark.skipif(tracing._lib_opentelemetry, reason='has OpenTelemetry')
+def test_opentelemetry_tracer_depends_on_library():
+    with pytest.raises(RuntimeError):
+        tracing.OpenTelemetryTracer()
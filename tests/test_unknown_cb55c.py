@@ -56,3 +56,12 @@ def test_emphasized(printer):
 
     printer.set_emphasized(False)
     assert b'\x1B\x46' == printer.device.write_buffer
+
+
+def test_cache_state():
+    printer = CB55C(pytest.FakeDevice(), cache_state=True)
+    printer.set_emphasized(True)
+    printer.set_condensed(True)
+    printer.set_condensed(True)
+    printer.set_emphasized(True)  # ESC ! has turned emphasized mode off
+    assert b'\x1B\x45\x1B\x21\x01\x1B\x45' == printer.device.write_buffer
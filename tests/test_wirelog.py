@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+#
+# escpos/tests/test_wirelog.py
+#
+# Copyright 2026 Base4 Sistemas
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import logging
+
+import pytest
+
+from escpos import config
+from escpos import wirelog
+from escpos.conn.dummy import DummyConnection
+from escpos.helpers import hexdump
+
+
+@pytest.fixture
+def debug_logger():
+    logger = logging.getLogger('escpos.tests.wirelog')
+    logger.setLevel(logging.DEBUG)
+    yield logger
+    logger.setLevel(logging.NOTSET)
+
+
+def test_lazy_hexdump():
+    data = b'\x1B\x40' * 40
+    assert str(wirelog.LazyHexdump(data)) == hexdump(data)
+    assert str(wirelog.LazyHexdump(data, max_bytes=16)) == (
+            hexdump(data[:16]) + '\n... 64 more bytes (of 80)')
+
+
+def test_formats_only_when_emitted(debug_logger, monkeypatch):
+    formatted = []
+    monkeypatch.setattr(
+            wirelog,
+            'hexdump',
+            lambda data: formatted.append(data) or '')
+    handler = logging.Handler(level=logging.INFO)  # drops debug records
+    handler.emit = lambda record: record.getMessage()
+    debug_logger.addHandler(handler)
+    monkeypatch.setattr(debug_logger, 'propagate', False)
+    try:
+        wire = wirelog.WireLogger(debug_logger)
+        wire.debug('writing to %s:\n%s', 'printer', b'\x1B\x40')
+        assert formatted == []
+        handler.setLevel(logging.DEBUG)
+        wire.debug('writing to %s:\n%s', 'printer', b'\x1B\x40')
+        assert formatted == [b'\x1B\x40']
+    finally:
+        debug_logger.removeHandler(handler)
+
+
+def test_sampling_and_cap(debug_logger, caplog, monkeypatch):
+    monkeypatch.setattr(config, 'WIRELOG_SAMPLE', 3)
+    monkeypatch.setattr(config, 'WIRELOG_MAX_BYTES', 4)
+    wire = wirelog.WireLogger(debug_logger)
+    with caplog.at_level(logging.DEBUG, logger=debug_logger.name):
+        for i in range(7):
+            wire.debug('write #%s:\n%s', i, b'\x00' * 10)
+    messages = [r.getMessage() for r in caplog.records]
+    assert [m.split(':')[0] for m in messages] == [
+            'write #0', 'write #3', 'write #6']
+    assert messages[0].endswith('... 6 more bytes (of 10)')
+
+
+def test_dumps_everything_by_default(debug_logger, caplog, monkeypatch):
+    monkeypatch.setattr(config, 'WIRELOG_MAX_BYTES', None)
+    data = b'\x1B\x40' * 1024
+    wire = wirelog.WireLogger(debug_logger)
+    with caplog.at_level(logging.DEBUG, logger=debug_logger.name):
+        wire.debug('writing to %s:\n%s', 'printer', data)
+    message, = [r.getMessage() for r in caplog.records]
+    assert message == 'writing to printer:\n' + hexdump(data)
+
+
+def test_max_bytes_setting(monkeypatch):
+    monkeypatch.delenv('ESCPOS_WIRELOG_MAX_BYTES', raising=False)
+    assert config._env(
+            'ESCPOS_WIRELOG_MAX_BYTES',
+            None,
+            cast=config._optional_int) is None
+    monkeypatch.setenv('ESCPOS_WIRELOG_MAX_BYTES', '64')
+    assert config._env(
+            'ESCPOS_WIRELOG_MAX_BYTES',
+            None,
+            cast=config._optional_int) == 64
+
+
+def test_disabled(monkeypatch):
+    calls = []
+    monkeypatch.setattr(wirelog, 'LazyHexdump', calls.append)
+    wire = wirelog.WireLogger(logging.getLogger('escpos.tests.wirelog.off'))
+    wire.logger.setLevel(logging.INFO)
+    wire.debug('writing to %s:\n%s', 'printer', b'\x1B\x40')
+    assert calls == []
+
+
+def test_connection_write_is_logged(caplog):
+    conn = DummyConnection()
+    with caplog.at_level(logging.DEBUG, logger='escpos.conn.dummy'):
+        conn.write(b'\x1B\x40')
+    record, = caplog.records
+    assert record.getMessage().endswith(hexdump(b'\x1B\x40'))